@@ -0,0 +1,91 @@
+"""Add team ids to match info
+
+Revision ID: 5b1f0d2c7a93
+Revises: e4a00e10c56f
+Create Date: 2026-10-19 18:05:12.304117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f0d2c7a93'
+down_revision: Union[str, None] = 'e4a00e10c56f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Batch mode, SQLite can only add foreign keys by recreating the tables
+    with op.batch_alter_table('map_result_info') as batch_op:
+        batch_op.add_column(sa.Column('first_team_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('second_team_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_map_result_info_first_team_id_teams',
+            'teams',
+            ['first_team_id'],
+            ['id'],
+            ondelete='SET NULL',
+        )
+        batch_op.create_foreign_key(
+            'fk_map_result_info_second_team_id_teams',
+            'teams',
+            ['second_team_id'],
+            ['id'],
+            ondelete='SET NULL',
+        )
+        batch_op.create_index(
+            'index_map_result_info_first_team', ['first_team_id', 'map']
+        )
+        batch_op.create_index(
+            'index_map_result_info_second_team', ['second_team_id', 'map']
+        )
+
+    with op.batch_alter_table('map_pick_ban_info') as batch_op:
+        batch_op.add_column(sa.Column('initiator_team_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_map_pick_ban_info_initiator_team_id_teams',
+            'teams',
+            ['initiator_team_id'],
+            ['id'],
+            ondelete='SET NULL',
+        )
+        batch_op.create_index(
+            'index_map_pick_ban_info_initiator_team', ['initiator_team_id', 'map']
+        )
+
+    # Backfill the ids from the team names, names of deleted teams stay unlinked
+    op.execute(
+        'UPDATE map_result_info SET '
+        'first_team_id = (SELECT id FROM teams WHERE teams.name = first_team), '
+        'second_team_id = (SELECT id FROM teams WHERE teams.name = second_team)'
+    )
+    op.execute(
+        'UPDATE map_pick_ban_info SET '
+        'initiator_team_id = (SELECT id FROM teams WHERE teams.name = initiator)'
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('map_pick_ban_info') as batch_op:
+        batch_op.drop_index('index_map_pick_ban_info_initiator_team')
+        batch_op.drop_constraint(
+            'fk_map_pick_ban_info_initiator_team_id_teams', type_='foreignkey'
+        )
+        batch_op.drop_column('initiator_team_id')
+
+    with op.batch_alter_table('map_result_info') as batch_op:
+        batch_op.drop_index('index_map_result_info_second_team')
+        batch_op.drop_index('index_map_result_info_first_team')
+        batch_op.drop_constraint(
+            'fk_map_result_info_second_team_id_teams', type_='foreignkey'
+        )
+        batch_op.drop_constraint(
+            'fk_map_result_info_first_team_id_teams', type_='foreignkey'
+        )
+        batch_op.drop_column('second_team_id')
+        batch_op.drop_column('first_team_id')
@@ -1,7 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from ravenspedia.api_v1.auth.views import router as auth_router
 from ravenspedia.api_v1.news.views import router as news_router
+from ravenspedia.api_v1.project_classes.map_stats.views import (
+    router as map_stats_router,
+)
 from ravenspedia.api_v1.project_classes.match.views import (
     router as match_router,
     manager_match_router,
@@ -27,8 +30,15 @@ from ravenspedia.api_v1.project_classes.tournament.views import (
 )
 from ravenspedia.api_v1.schedules.views import router as schedule_router
 from .search.views import router as search_router
+from .export.views import router as export_router
+from .changes.views import router as changes_router
+from .metrics.views import router as metrics_router
+from .profiling import profile_request
+from .profiling.views import router as profiling_router
+from .snapshots.views import router as snapshot_router
 
-router = APIRouter()
+# Every endpoint can be profiled on demand by an admin (see profile_request)
+router = APIRouter(dependencies=[Depends(profile_request)])
 router.include_router(router=auth_router, prefix="/auth")
 router.include_router(router=player_router, prefix="/players")
 router.include_router(router=player_stats_router, prefix="/players/stats")
@@ -39,9 +49,15 @@ router.include_router(router=match_router, prefix="/matches")
 router.include_router(router=manager_match_router, prefix="/matches")
 router.include_router(router=match_stats_router, prefix="/matches/stats")
 router.include_router(router=match_info_router, prefix="/matches/stats")
+router.include_router(router=map_stats_router, prefix="/stats/maps")
 router.include_router(router=tournament_router, prefix="/tournaments")
 router.include_router(router=manager_tournament_router, prefix="/tournaments")
 router.include_router(router=schedule_router, prefix="/schedules")
 router.include_router(router=news_router, prefix="/news")
 
 router.include_router(router=search_router, prefix="/search")
+router.include_router(router=export_router, prefix="/export")
+router.include_router(router=changes_router, prefix="/changes")
+router.include_router(router=snapshot_router, prefix="/snapshots")
+router.include_router(router=metrics_router, prefix="/metrics")
+router.include_router(router=profiling_router, prefix="/profiles")
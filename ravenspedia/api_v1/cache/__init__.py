@@ -0,0 +1,12 @@
+# Data for export
+__all__ = (
+    "cache_tags",
+    "invalidate_tags",
+    "response_cache",
+    "ResponseCacheMiddleware",
+)
+
+from .dependencies import cache_tags
+from .middleware import ResponseCacheMiddleware
+from .store import response_cache
+from .tags import invalidate_tags
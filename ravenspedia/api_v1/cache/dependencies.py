@@ -0,0 +1,47 @@
+from fastapi import Request, HTTPException, status
+
+from .tags import get_tag_versions, make_etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches the given ETag.
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        # Weak comparison is used, as required for If-None-Match
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cache_tags(*templates: str):
+    """
+    Create a dependency declaring the cache tags of a read endpoint.
+    Templates are formatted with the path parameters, e.g. "team:{team_name}".
+    """
+
+    async def dependency(request: Request) -> None:
+        tags = tuple(template.format(**request.path_params) for template in templates)
+
+        # Take the snapshot before the handler reads the database, so that
+        # a concurrent write always leaves the stored response outdated
+        versions = get_tag_versions(tags)
+        etag = make_etag(tags, versions)
+
+        # Share the snapshot with the caching middleware
+        request.state.cache_tags = tags
+        request.state.cache_versions = versions
+        request.state.cache_etag = etag
+
+        # Answer conditional requests without running the handler
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag},
+            )
+
+    return dependency
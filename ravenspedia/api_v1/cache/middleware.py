@@ -0,0 +1,143 @@
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ravenspedia.api_v1.metrics.instruments import cache_requests
+from ravenspedia.api_v1.profiling.dependencies import profile_requested
+from ravenspedia.core.config import cache_settings
+from .dependencies import etag_matches
+from .store import CachedResponse, ResponseCache, response_cache
+from .tags import get_tag_versions
+
+
+def make_cache_key(scope: Scope) -> str:
+    """
+    Build the cache key of a request from its path and normalized query string.
+    """
+    query = parse_qsl(scope.get("query_string", b"").decode(), keep_blank_values=True)
+    return f"{scope['path']}?{urlencode(sorted(query))}"
+
+
+# ASGI middleware serving tagged GET responses from the server-side cache
+class ResponseCacheMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: ResponseCache = response_cache,
+        max_entry_size: int = cache_settings.max_entry_size,
+    ):
+        self.app = app
+        self.cache = cache
+        self.max_entry_size = max_entry_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only plain GET requests are cached, profiled ones always run the endpoint
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not cache_settings.enabled
+            or profile_requested(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = make_cache_key(scope)
+        entry = self.cache.get(key)
+
+        # Serve the stored response while none of its tags has been invalidated
+        if entry is not None:
+            if get_tag_versions(entry.tags) == entry.versions:
+                cache_requests.inc("hit")
+                # Let the metrics label the request with the route it skipped
+                scope["route"] = entry.route
+                scope["path_params"] = entry.path_params
+                await self.send_cached(scope, send, entry)
+                return
+            self.cache.discard(key)
+
+        await self.app(scope, receive, self.capture(scope, send, key))
+
+    async def send_cached(
+        self,
+        scope: Scope,
+        send: Send,
+        entry: CachedResponse,
+    ) -> None:
+        """
+        Send a cached response, or 304 if the client already has it.
+        """
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if etag_matches(if_none_match, entry.etag):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(b"etag", entry.etag.encode("latin-1"))],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": entry.headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": entry.body})
+
+    def capture(self, scope: Scope, send: Send, key: str) -> Send:
+        """
+        Wrap send to add the validators and store the response once complete.
+        """
+        start: Message | None = None
+        body = bytearray()
+        cacheable = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, cacheable
+
+            if message["type"] == "http.response.start":
+                # The tags are set by the cache_tags dependency of the endpoint
+                state = scope.get("state", {})
+                etag = state.get("cache_etag")
+                headers = list(message.get("headers", []))
+                names = {name.lower() for name, _ in headers}
+
+                if etag is not None and message["status"] == 200:
+                    # Only responses of tagged endpoints count in the hit ratio
+                    cache_requests.inc("miss")
+                    if b"etag" not in names:
+                        headers.append((b"etag", etag.encode("latin-1")))
+                    # Let clients keep the response but revalidate it every time
+                    headers.append((b"cache-control", b"no-cache"))
+                    message["headers"] = headers
+                    cacheable = b"set-cookie" not in names
+                # Keep a copy, outer middlewares may still change the message
+                start = {**message, "headers": list(message.get("headers", []))}
+
+            elif message["type"] == "http.response.body" and cacheable:
+                body.extend(message.get("body", b""))
+                if len(body) > self.max_entry_size:
+                    cacheable = False  # Too big to be kept in memory
+                    body.clear()
+                elif not message.get("more_body", False):
+                    state = scope["state"]
+                    self.cache.set(
+                        key,
+                        CachedResponse(
+                            tags=state["cache_tags"],
+                            versions=state["cache_versions"],
+                            etag=state["cache_etag"],
+                            headers=start["headers"],
+                            body=bytes(body),
+                            route=scope.get("route"),
+                            path_params=scope.get("path_params", {}),
+                        ),
+                    )
+
+            await send(message)
+
+        return send_wrapper
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from ravenspedia.core.config import cache_settings
+
+
+# A response kept in the cache together with the tag versions it was built from
+@dataclass
+class CachedResponse:
+    tags: tuple[str, ...]  # Tags the response depends on
+    versions: tuple[int, ...]  # Versions of the tags when the response was built
+    etag: str  # ETag sent with the response
+    headers: list[tuple[bytes, bytes]]  # Raw headers of the response
+    body: bytes  # Full body of the response
+    route: Any = None  # Route that built the response, reported in the metrics
+    path_params: dict = field(default_factory=dict)  # Parameters of the route
+
+
+# Bounded in-memory store of responses, evicting the least recently used ones
+class ResponseCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Return the cached response for the key, if any.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)  # Mark as recently used
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store a response, evicting the oldest ones above the size limit.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """
+        Remove the response stored for the key.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every stored response.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared response cache used by the caching middleware
+response_cache = ResponseCache(max_entries=cache_settings.max_entries)
@@ -0,0 +1,53 @@
+import secrets
+from collections import defaultdict
+
+# Random token identifying this process, so that ETags issued before a restart
+# (when all version counters start again from zero) are never considered fresh
+EPOCH = secrets.token_hex(4)
+
+# Version counter of every tag that has been invalidated at least once
+_versions: defaultdict[str, int] = defaultdict(int)
+
+
+def _kind(tag: str) -> str:
+    """
+    Return the entity kind of a tag, e.g. "match" for "match:1".
+    """
+    return tag.split(":", 1)[0]
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Invalidate the cached responses that depend on the given tags.
+    """
+    for tag in tags:
+        kind = _kind(tag)
+        if kind == tag:
+            # A bare kind invalidates every entity of that kind at once
+            _versions[f"{kind}:*"] += 1
+        else:
+            _versions[tag] += 1
+
+        # Any change of an entity also changes the lists of its kind
+        _versions[kind] += 1
+
+
+def get_tag_versions(tags: tuple[str, ...]) -> tuple[int, ...]:
+    """
+    Return the current versions of the given tags.
+    """
+    versions = []
+    for tag in tags:
+        kind = _kind(tag)
+        versions.append(_versions.get(tag, 0))
+        if kind != tag:
+            versions.append(_versions.get(f"{kind}:*", 0))
+    return tuple(versions)
+
+
+def make_etag(tags: tuple[str, ...], versions: tuple[int, ...]) -> str:
+    """
+    Build the ETag of a response depending on the given tags and versions.
+    """
+    versions_part = ".".join(str(version) for version in versions)
+    return f'"{EPOCH}-{len(tags)}-{versions_part}"'
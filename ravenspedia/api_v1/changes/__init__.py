@@ -0,0 +1,4 @@
+# Data for export
+__all__ = ("track_changes",)
+
+from .tracking import track_changes
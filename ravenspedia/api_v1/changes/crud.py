@@ -0,0 +1,42 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import TableChange
+from .schemes import Change, ChangeFeed
+
+
+async def get_changes(
+    session: AsyncSession,
+    since: int,
+    limit: int,
+    entities: list[str] | None = None,
+) -> ChangeFeed:
+    """
+    Return the changes logged after the since cursor, oldest first.
+    """
+    stmt = (
+        select(TableChange)
+        .where(TableChange.id > since)
+        .order_by(TableChange.id)
+        .limit(limit + 1)  # One more row tells whether another page follows
+    )
+    if entities:
+        stmt = stmt.where(TableChange.entity.in_(entities))
+    rows = list(await session.scalars(stmt))
+
+    changes = [
+        Change(
+            cursor=row.id,
+            entity=row.entity,
+            entity_id=row.entity_id,
+            operation=row.operation,
+            version=row.version,
+            changed_at=row.changed_at,
+        )
+        for row in rows[:limit]
+    ]
+    return ChangeFeed(
+        changes=changes,
+        cursor=changes[-1].cursor if changes else since,
+        has_more=len(rows) > limit,
+    )
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from ravenspedia.core import ChangeOperation
+
+
+# Define the schema of one entry of the change feed
+class Change(BaseModel):
+    cursor: int  # Position of the change in the feed
+    entity: str  # "match", "player", "team", "tournament" or "news"
+    entity_id: int
+    operation: ChangeOperation
+    version: int  # Number of changes of the entity so far
+    changed_at: datetime
+
+
+# Define the schema of a page of the change feed
+class ChangeFeed(BaseModel):
+    changes: list[Change]
+    cursor: int  # Pass as since to get the next changes
+    has_more: bool  # Whether more changes follow this page
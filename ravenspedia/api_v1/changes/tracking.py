@@ -0,0 +1,222 @@
+from typing import Iterable, Mapping
+
+from sqlalchemy import bindparam, event, func, insert, inspect, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ravenspedia.core import (
+    ChangeOperation,
+    PlayerTournamentAssociation,
+    TableChange,
+    TableMapPickBanInfo,
+    TableMapResultInfo,
+    TableMatch,
+    TableMatchStats,
+    TableNews,
+    TablePlayer,
+    TableTeam,
+    TableTeamMapStats,
+    TableTeamVetoStats,
+    TableTournament,
+    TableTournamentResult,
+    TeamMatchAssociation,
+    TeamTournamentAssociation,
+)
+
+# Entities of the feed touched by a change of each model, with the column that
+# holds their id: "id" is the model's own entity, other columns its parents
+CHANGE_SOURCES = {
+    TableMatch: (("match", "id"),),
+    TablePlayer: (("player", "id"), ("team", "team_id")),
+    TableTeam: (("team", "id"),),
+    TableTournament: (("tournament", "id"),),
+    TableNews: (("news", "id"),),
+    TableMatchStats: (("match", "match_id"), ("player", "player_id")),
+    TableMapResultInfo: (("match", "match_id"),),
+    TableMapPickBanInfo: (("match", "match_id"),),
+    TableTeamMapStats: (("team", "team_id"),),
+    TableTeamVetoStats: (("team", "team_id"),),
+    TableTournamentResult: (("tournament", "tournament_id"), ("team", "team_id")),
+    TeamMatchAssociation: (("match", "match_id"), ("team", "team_id")),
+    TeamTournamentAssociation: (("tournament", "tournament_id"), ("team", "team_id")),
+    PlayerTournamentAssociation: (
+        ("player", "player_id"),
+        ("tournament", "tournament_id"),
+    ),
+}
+
+# When an entity changes several times in one statement, the strongest wins
+_PRIORITY = {
+    ChangeOperation.UPDATE: 0,
+    ChangeOperation.INSERT: 1,
+    ChangeOperation.DELETE: 2,
+}
+
+# Next version of an entity, computed by the database for each inserted change
+_next_version = (
+    select(func.coalesce(func.max(TableChange.version), 0) + 1)
+    .where(
+        TableChange.entity == bindparam("entity"),
+        TableChange.entity_id == bindparam("entity_id"),
+    )
+    .scalar_subquery()
+)
+
+# Changes collected from a flush or a statement: (entity, id) -> operation
+Changes = dict[tuple[str, int], ChangeOperation]
+
+
+def add_row_changes(
+    changes: Changes,
+    model: type,
+    row: Mapping,
+    operation: ChangeOperation,
+) -> None:
+    """
+    Add the changes caused by one row of a model: its own entity gets the
+    operation, the parent entities it belongs to are updated.
+    """
+    for entity, column in CHANGE_SOURCES[model]:
+        entity_id = row.get(column)
+        if entity_id is None:
+            continue
+        row_operation = operation if column == "id" else ChangeOperation.UPDATE
+        current = changes.get((entity, entity_id))
+        if current is None or _PRIORITY[row_operation] > _PRIORITY[current]:
+            changes[(entity, entity_id)] = row_operation
+
+
+def pending_changes(session: Session) -> Changes:
+    """
+    Changes made in the current transaction of a session, not logged yet.
+    """
+    return session.info.setdefault("pending_changes", {})
+
+
+def record_changes(session: Session) -> None:
+    """
+    Append the pending changes to the change log with a single statement, in
+    the transaction that made them.
+    """
+    session.flush()  # The last flush of the transaction may add changes
+    changes = session.info.pop("pending_changes", None)
+    if not changes:
+        return
+    session.connection().execute(
+        insert(TableChange.__table__).values(
+            entity=bindparam("entity"),
+            entity_id=bindparam("entity_id"),
+            operation=bindparam("operation"),
+            version=_next_version,
+        ),
+        [
+            {"entity": entity, "entity_id": entity_id, "operation": operation.name}
+            for (entity, entity_id), operation in changes.items()
+        ],
+    )
+
+
+def discard_changes(session: Session, transaction) -> None:
+    """
+    Forget the changes of a transaction that ended without a commit.
+    """
+    if transaction.parent is None:
+        session.info.pop("pending_changes", None)
+
+
+def object_rows(obj, operation: ChangeOperation) -> Iterable[dict]:
+    """
+    Column values of a flushed object. An update also yields the previous
+    parents, so that an entity leaving a parent updates it too.
+    """
+    state = inspect(obj)
+    columns = [column for _, column in CHANGE_SOURCES[type(obj)]]
+    yield {column: state.dict.get(column) for column in columns}
+    if operation == ChangeOperation.UPDATE:
+        for column in columns:
+            for previous in state.attrs[column].history.deleted:
+                yield {column: previous}
+
+
+def collect_flush_changes(session: Session, flush_context) -> None:
+    """
+    Collect the objects inserted, modified and deleted by a flush.
+    """
+    changes = pending_changes(session)
+    for objects, operation in (
+        (session.new, ChangeOperation.INSERT),
+        (session.dirty, ChangeOperation.UPDATE),
+        (session.deleted, ChangeOperation.DELETE),
+    ):
+        for obj in objects:
+            if type(obj) not in CHANGE_SOURCES:
+                continue
+            if operation == ChangeOperation.UPDATE and not session.is_modified(obj):
+                continue
+            for row in object_rows(obj, operation):
+                add_row_changes(changes, type(obj), row, operation)
+
+
+def statement_rows(state: ORMExecuteState, model: type) -> list[Mapping]:
+    """
+    Rows an INSERT, UPDATE or DELETE statement will write, read before it runs.
+    """
+    statement = state.statement
+    parameters = state.parameters
+
+    # Bulk statements given their rows: INSERT many, UPDATE by primary key
+    if isinstance(parameters, list):
+        return parameters
+    if state.is_insert:
+        if statement.select is None:
+            return [statement.compile().params]
+        # INSERT ... SELECT: run the SELECT to know the rows it inserts
+        names = [getattr(name, "key", name) for name in statement._select_names]
+        result = state.session.execute(statement.select)
+        return [dict(zip(names, row)) for row in result]
+
+    # UPDATE and DELETE: the rows matching the WHERE clause
+    table = inspect(model).local_table
+    columns = [table.c[column] for _, column in CHANGE_SOURCES[model]]
+    stmt = select(*columns)
+    if statement.whereclause is not None:
+        stmt = stmt.where(statement.whereclause)
+    return list(state.session.execute(stmt).mappings())
+
+
+def collect_statement_changes(state: ORMExecuteState):
+    """
+    Collect the rows written by ORM-enabled INSERT, UPDATE and DELETE
+    statements, which bypass the flush.
+    """
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return None
+    model = state.bind_mapper.class_ if state.bind_mapper is not None else None
+    if model not in CHANGE_SOURCES:
+        return None
+
+    if state.is_insert:
+        operation = ChangeOperation.INSERT
+    elif state.is_update:
+        operation = ChangeOperation.UPDATE
+    else:
+        operation = ChangeOperation.DELETE
+
+    rows = statement_rows(state, model)
+    result = state.invoke_statement()
+
+    changes = pending_changes(state.session)
+    for row in rows:
+        add_row_changes(changes, model, row, operation)
+    return result
+
+
+def track_changes(session_class: type[Session] = Session) -> None:
+    """
+    Log every change of the tracked models made through sessions of a class.
+    The changes of a transaction are collected as it runs and logged on commit.
+    """
+    if not event.contains(session_class, "after_flush", collect_flush_changes):
+        event.listen(session_class, "after_flush", collect_flush_changes)
+        event.listen(session_class, "do_orm_execute", collect_statement_changes)
+        event.listen(session_class, "before_commit", record_changes)
+        event.listen(session_class, "after_transaction_end", discard_changes)
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import db_helper
+from . import crud
+from .schemes import ChangeFeed
+
+router = APIRouter(tags=["Changes"])
+
+
+# Define an endpoint to read the changes made after a cursor
+@router.get(
+    "/",
+    response_model=ChangeFeed,
+    status_code=status.HTTP_200_OK,
+)
+async def get_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    entity: list[str] | None = Query(None),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> ChangeFeed:
+    return await crud.get_changes(
+        session=session,
+        since=since,
+        limit=limit,
+        entities=entity,
+    )
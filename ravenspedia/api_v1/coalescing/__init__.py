@@ -0,0 +1,4 @@
+# Data for export
+__all__ = ("CoalescingRoute",)
+
+from .routing import CoalescingRoute
@@ -0,0 +1,121 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from ravenspedia.api_v1.cache.middleware import make_cache_key
+from ravenspedia.api_v1.metrics.instruments import coalesced_requests
+from ravenspedia.api_v1.metrics.middleware import route_template
+from ravenspedia.api_v1.profiling.dependencies import profile_requested
+from ravenspedia.core.config import coalescing_settings
+
+# Request headers that may change the response, so they are part of the key
+VARY_HEADERS = (b"authorization", b"cookie", b"if-none-match", b"accept-encoding")
+
+# Attributes of the request state set by the cache_tags dependency
+CACHE_STATE = ("cache_tags", "cache_versions", "cache_etag")
+
+
+# A response computed once and handed to the coalesced requests
+@dataclass
+class SharedResponse:
+    response: Response
+    state: dict  # Cache snapshot of the request that built the response
+
+
+def make_coalescing_key(request: Request) -> str:
+    """
+    Build the key of a request from its path, normalized query string and the
+    headers the response may depend on.
+    """
+    headers = dict(
+        (name, value)
+        for name, value in request.scope["headers"]
+        if name in VARY_HEADERS
+    )
+    vary = b"\x00".join(headers.get(name, b"") for name in VARY_HEADERS)
+    return f"{make_cache_key(request.scope)}\x00{vary.decode('latin-1')}"
+
+
+def is_shareable(response: Response) -> bool:
+    """
+    Check that a response can be sent to several clients.
+    """
+    return (
+        # Streamed and file responses have no body and can only be sent once
+        hasattr(response, "body")
+        and response.background is None
+        # Responses setting cookies belong to one client only
+        and all(name != b"set-cookie" for name, _ in response.raw_headers)
+    )
+
+
+# Requests in flight by key, waited for by the identical requests
+_in_flight: dict[str, asyncio.Future] = {}
+
+
+async def coalesce(
+    request: Request,
+    handler: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """
+    Run the handler, or wait for the identical request already in flight and
+    share its response.
+    """
+    key = make_coalescing_key(request)
+    loop = asyncio.get_running_loop()
+    future = _in_flight.get(key)
+
+    if future is not None and future.get_loop() is loop:
+        # Shielded, so that a follower leaving does not cancel the others
+        shared = await asyncio.shield(future)
+        if shared is None:
+            # The leader failed or its response cannot be shared: compute it here
+            return await handler(request)
+        coalesced_requests.inc("follower")
+        # Let the caching middleware send the same validators as the leader
+        for name, value in shared.state.items():
+            setattr(request.state, name, value)
+        return shared.response
+
+    coalesced_requests.inc("leader")
+    future = loop.create_future()
+    _in_flight[key] = future
+    shared = None
+    try:
+        response = await handler(request)
+        if is_shareable(response):
+            state = {
+                name: getattr(request.state, name)
+                for name in CACHE_STATE
+                if hasattr(request.state, name)
+            }
+            shared = SharedResponse(response=response, state=state)
+        return response
+    finally:
+        # Later requests start a new computation
+        if _in_flight.get(key) is future:
+            del _in_flight[key]
+        future.set_result(shared)
+
+
+# Route letting concurrent identical GET requests of the routes listed in the
+# settings await a single in-flight computation and share its response
+class CoalescingRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def coalescing_handler(request: Request) -> Response:
+            # Only plain GET requests are coalesced, profiled ones always run
+            if (
+                request.method != "GET"
+                or not coalescing_settings.enabled
+                or route_template(request.scope) not in coalescing_settings.routes
+                or profile_requested(request.scope)
+            ):
+                return await handler(request)
+            return await coalesce(request, handler)
+
+        return coalescing_handler
@@ -0,0 +1,239 @@
+import csv
+import io
+import json
+import zlib
+from typing import AsyncIterator
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ravenspedia.core import (
+    PlayerStats,
+    TableMatch,
+    TableMatchStats,
+    TableTeam,
+    TableTournament,
+    TeamMatchAssociation,
+)
+from ravenspedia.core.config import export_settings
+from .schemes import ExportFilter, ExportFormat
+from ..rendering import dumps
+
+# Columns of the stats inside match_stats, in the order of the FACEIT model
+STATS_COLUMNS = [
+    field.alias or name for name, field in PlayerStats.model_fields.items()
+]
+
+# Columns of the exports: identifiers first, then the exported data
+MATCH_STATS_COLUMNS = ["stat_id", "date", "tournament_id", "tournament", *STATS_COLUMNS]
+MATCHES_COLUMNS = [
+    "match_id",
+    "date",
+    "status",
+    "best_of",
+    "tournament_id",
+    "tournament",
+    "teams",
+    "description",
+    "original_source",
+]
+
+
+def apply_filter(stmt: Select, export_filter: ExportFilter) -> Select:
+    """
+    Restrict a statement joined with the matches to the filtered ones.
+    """
+    if export_filter.start_date:
+        stmt = stmt.where(TableMatch.date >= export_filter.start_date)
+    if export_filter.end_date:
+        stmt = stmt.where(TableMatch.date <= export_filter.end_date)
+    if export_filter.tournament_ids:
+        stmt = stmt.where(TableMatch.tournament_id.in_(export_filter.tournament_ids))
+    return stmt
+
+
+async def stream_batches(
+    session_factory: async_sessionmaker[AsyncSession],
+    stmt: Select,
+) -> AsyncIterator[list[dict]]:
+    """
+    Run a statement with a server-side cursor and yield its rows in batches,
+    so that only one batch is held in memory at a time. The session lives as
+    long as the stream, and the cursor is closed even if the client leaves.
+    """
+    async with session_factory() as session:
+        result = await session.stream(
+            stmt.execution_options(yield_per=export_settings.batch_size)
+        )
+        try:
+            async for partition in result.mappings().partitions():
+                yield partition
+        finally:
+            await result.close()
+
+
+async def match_stats_rows(
+    session_factory: async_sessionmaker[AsyncSession],
+    export_filter: ExportFilter,
+) -> AsyncIterator[list[dict]]:
+    """
+    Yield the filtered player stats rows, one map of one player per row.
+    """
+    stmt = (
+        select(
+            TableMatchStats.id,
+            TableMatchStats.match_stats,
+            TableMatch.date,
+            TableMatch.tournament_id,
+            TableTournament.name,
+        )
+        .join(TableMatch, TableMatch.id == TableMatchStats.match_id)
+        .join(TableTournament, TableTournament.id == TableMatch.tournament_id)
+        .order_by(TableMatchStats.id)
+    )
+    async for batch in stream_batches(
+        session_factory, apply_filter(stmt, export_filter)
+    ):
+        yield [
+            {
+                "stat_id": row["id"],
+                "date": row["date"],
+                "tournament_id": row["tournament_id"],
+                "tournament": row["name"],
+                **{column: row["match_stats"].get(column) for column in STATS_COLUMNS},
+            }
+            for row in batch
+        ]
+
+
+async def matches_rows(
+    session_factory: async_sessionmaker[AsyncSession],
+    export_filter: ExportFilter,
+) -> AsyncIterator[list[dict]]:
+    """
+    Yield the filtered matches with the names of their teams.
+    """
+    # Names of the teams of each match, aggregated by the database as a JSON array
+    teams = (
+        select(func.json_group_array(TableTeam.name))
+        .join(TeamMatchAssociation, TeamMatchAssociation.team_id == TableTeam.id)
+        .where(TeamMatchAssociation.match_id == TableMatch.id)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            TableMatch.id,
+            TableMatch.date,
+            TableMatch.status,
+            TableMatch.best_of,
+            TableMatch.tournament_id,
+            TableTournament.name,
+            teams.label("teams"),
+            TableMatch.description,
+            TableMatch.original_source,
+        )
+        .join(TableTournament, TableTournament.id == TableMatch.tournament_id)
+        .order_by(TableMatch.id)
+    )
+    async for batch in stream_batches(
+        session_factory, apply_filter(stmt, export_filter)
+    ):
+        yield [
+            {
+                "match_id": row["id"],
+                "date": row["date"],
+                "status": row["status"],
+                "best_of": row["best_of"],
+                "tournament_id": row["tournament_id"],
+                "tournament": row["name"],
+                "teams": json.loads(row["teams"]),
+                "description": row["description"],
+                "original_source": row["original_source"],
+            }
+            for row in batch
+        ]
+
+
+def encode_ndjson(batch: list[dict]) -> bytes:
+    """
+    Encode a batch of rows as JSON objects, one per line.
+    """
+    return b"".join(dumps(row) + b"\n" for row in batch)
+
+
+def encode_csv(batch: list[dict], columns: list[str], header: bool) -> bytes:
+    """
+    Encode a batch of rows as CSV lines, lists joined with "|".
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    for row in batch:
+        writer.writerow(
+            [
+                "|".join(value) if isinstance(value, list) else csv_value(value)
+                for value in (row[column] for column in columns)
+            ]
+        )
+    return buffer.getvalue().encode("utf-8")
+
+
+def csv_value(value) -> object:
+    """
+    Write dates in ISO format and enums by value, like the JSON exports.
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return getattr(value, "value", value)
+
+
+async def encode_rows(
+    batches: AsyncIterator[list[dict]],
+    export_format: ExportFormat,
+    columns: list[str],
+    compress: bool,
+) -> AsyncIterator[bytes]:
+    """
+    Encode batches of rows in the export format, gzip-compressed on the fly.
+    """
+    compressor = (
+        zlib.compressobj(export_settings.gzip_level, zlib.DEFLATED, 31)
+        if compress
+        else None
+    )
+    header = True
+    async for batch in batches:
+        if export_format == ExportFormat.CSV:
+            chunk = encode_csv(batch, columns, header)
+        else:
+            chunk = encode_ndjson(batch)
+        header = False
+        if compressor is not None:
+            chunk = compressor.compress(chunk)
+        if chunk:
+            yield chunk
+
+    # A CSV export without rows still has its header
+    if header and export_format == ExportFormat.CSV:
+        chunk = encode_csv([], columns, header=True)
+        yield compressor.compress(chunk) if compressor is not None else chunk
+    if compressor is not None:
+        yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """
+    Check whether the client accepts gzip-compressed responses.
+    """
+    for encoding in (accept_encoding or "").lower().split(","):
+        name, _, params = encoding.partition(";")
+        if name.strip() != "gzip":
+            continue
+        # "gzip;q=0" explicitly refuses the encoding
+        quality = params.strip().removeprefix("q=")
+        try:
+            return float(quality or 1) > 0
+        except ValueError:
+            return True
+    return False
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional, List
+
+from fastapi import Query
+
+from .schemes import ExportFilter, ExportFormat
+
+
+async def get_export_filter(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    tournament_ids: Optional[List[int]] = Query(None),
+    format: ExportFormat = ExportFormat.NDJSON,
+) -> ExportFilter:
+    """
+    Create an ExportFilter object from query parameters.
+    """
+    return ExportFilter(
+        start_date=start_date,
+        end_date=end_date,
+        tournament_ids=tournament_ids,
+        format=format,
+    )
@@ -0,0 +1,25 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ExportFormat(str, Enum):
+    """
+    Formats of the exports: one JSON object per line, or comma-separated values.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ExportFilter(BaseModel):
+    """
+    Pydantic model for filtering the exported rows.
+    """
+
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    tournament_ids: Optional[List[int]] = None
+    format: ExportFormat = ExportFormat.NDJSON
@@ -0,0 +1,90 @@
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ravenspedia.core import db_helper
+from . import crud
+from .dependencies import get_export_filter
+from .schemes import ExportFilter, ExportFormat
+
+router = APIRouter(tags=["Export"])
+
+# Content types of the export formats
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def export_response(
+    request: Request,
+    rows,
+    export_filter: ExportFilter,
+    columns: list[str],
+    filename: str,
+) -> StreamingResponse:
+    """
+    Stream the encoded rows, gzip-compressed if the client accepts it.
+    """
+    compress = crud.accepts_gzip(request.headers.get("accept-encoding"))
+    extension = export_filter.format.value
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{extension}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        crud.encode_rows(rows, export_filter.format, columns, compress),
+        media_type=MEDIA_TYPES[export_filter.format],
+        headers=headers,
+    )
+
+
+# Export the player stats of every map, one row per player and map
+@router.get(
+    "/match_stats/",
+    status_code=status.HTTP_200_OK,
+)
+async def export_match_stats(
+    request: Request,
+    export_filter: ExportFilter = Depends(get_export_filter),
+    # The rows are read while the body is sent, after the request's dependencies
+    session_factory: async_sessionmaker[AsyncSession] = Depends(
+        db_helper.session_factory_dependency
+    ),
+) -> StreamingResponse:
+    return export_response(
+        request=request,
+        rows=crud.match_stats_rows(
+            session_factory=session_factory, export_filter=export_filter
+        ),
+        export_filter=export_filter,
+        columns=crud.MATCH_STATS_COLUMNS,
+        filename="match_stats",
+    )
+
+
+# Export the general information of the matches, one row per match
+@router.get(
+    "/matches/",
+    status_code=status.HTTP_200_OK,
+)
+async def export_matches(
+    request: Request,
+    export_filter: ExportFilter = Depends(get_export_filter),
+    # The rows are read while the body is sent, after the request's dependencies
+    session_factory: async_sessionmaker[AsyncSession] = Depends(
+        db_helper.session_factory_dependency
+    ),
+) -> StreamingResponse:
+    return export_response(
+        request=request,
+        rows=crud.matches_rows(
+            session_factory=session_factory, export_filter=export_filter
+        ),
+        export_filter=export_filter,
+        columns=crud.MATCHES_COLUMNS,
+        filename="matches",
+    )
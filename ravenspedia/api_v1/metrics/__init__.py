@@ -0,0 +1,11 @@
+# Data for export
+__all__ = (
+    "registry",
+    "instrument_pool",
+    "call_faceit",
+    "timed_job",
+    "MetricsMiddleware",
+)
+
+from .instruments import registry, instrument_pool, call_faceit, timed_job
+from .middleware import MetricsMiddleware
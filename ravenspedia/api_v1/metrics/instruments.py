@@ -0,0 +1,155 @@
+import sqlite3
+import time
+from functools import wraps
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .registry import Counter, Gauge, Histogram, Registry
+
+# Metrics exposed on /metrics
+registry = Registry()
+
+http_request_duration = registry.register(
+    Histogram(
+        "ravenspedia_http_request_duration_seconds",
+        "Latency of the HTTP requests by route template.",
+        labels=("method", "route", "status"),
+    )
+)
+http_requests_in_flight = registry.register(
+    Gauge(
+        "ravenspedia_http_requests_in_flight",
+        "HTTP requests being processed.",
+    )
+)
+db_pool_checkout_wait = registry.register(
+    Histogram(
+        "ravenspedia_db_pool_checkout_wait_seconds",
+        "Time spent waiting for a connection from the SQLAlchemy pool.",
+    )
+)
+db_sqlite_lock_errors = registry.register(
+    Counter(
+        "ravenspedia_db_sqlite_lock_errors_total",
+        "Statements failed because SQLite stayed busy or locked past its timeout.",
+        labels=("error",),
+    )
+)
+faceit_request_duration = registry.register(
+    Histogram(
+        "ravenspedia_faceit_request_duration_seconds",
+        "Latency of the FACEIT API calls by endpoint.",
+        labels=("endpoint",),
+    )
+)
+faceit_errors = registry.register(
+    Counter(
+        "ravenspedia_faceit_errors_total",
+        "FACEIT API calls failed or answered with an error status.",
+        labels=("endpoint", "status"),
+    )
+)
+scheduler_job_duration = registry.register(
+    Histogram(
+        "ravenspedia_scheduler_job_duration_seconds",
+        "Duration of the scheduled jobs.",
+        labels=("job", "result"),
+        buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300),
+    )
+)
+cache_requests = registry.register(
+    Counter(
+        "ravenspedia_cache_requests_total",
+        "GET requests looked up in the response cache by result.",
+        labels=("result",),
+    )
+)
+coalesced_requests = registry.register(
+    Counter(
+        "ravenspedia_coalesced_requests_total",
+        "GET requests of coalesced routes by role: leader (computed) or follower (shared).",
+        labels=("role",),
+    )
+)
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    """
+    Time the pool checkouts of an engine and count the SQLite busy/locked errors,
+    which are not retried.
+    """
+    sync_engine = engine.sync_engine
+    if getattr(sync_engine, "_metrics_instrumented", False):
+        return
+
+    raw_connection = sync_engine.raw_connection
+
+    # Every connection of the engine is taken from the pool here, so the time of
+    # the call is the wait for a free connection (or for opening a new one)
+    @wraps(raw_connection)
+    def timed_raw_connection(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return raw_connection(*args, **kwargs)
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - start)
+
+    sync_engine.raw_connection = timed_raw_connection
+    sync_engine._metrics_instrumented = True
+
+    @event.listens_for(sync_engine, "handle_error")
+    def count_lock_errors(context) -> None:
+        error = context.original_exception
+        if isinstance(error, sqlite3.OperationalError):
+            message = str(error)
+            if "locked" in message:
+                db_sqlite_lock_errors.inc("locked")
+            elif "busy" in message:
+                db_sqlite_lock_errors.inc("busy")
+
+
+def call_faceit(endpoint: str, request: Callable, *args, **kwargs):
+    """
+    Run a FACEIT API request, recording its latency and errors under the endpoint
+    template (e.g. "/matches/{match_id}"), and return its response.
+    """
+    start = time.perf_counter()
+    try:
+        response = request(*args, **kwargs)
+    except Exception:
+        faceit_errors.inc(endpoint, "exception")
+        raise
+    finally:
+        faceit_request_duration.observe(time.perf_counter() - start, endpoint)
+
+    if response.status_code >= 400:
+        faceit_errors.inc(endpoint, str(response.status_code))
+    return response
+
+
+def timed_job(name: str) -> Callable:
+    """
+    Decorate a scheduled job to record its duration and outcome.
+    """
+
+    def decorator(job: Callable) -> Callable:
+        @wraps(job)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = "error"
+            try:
+                value = job(*args, **kwargs)
+                result = "success"
+                return value
+            finally:
+                scheduler_job_duration.observe(
+                    time.perf_counter() - start,
+                    name,
+                    result,
+                )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,59 @@
+import time
+
+from starlette.routing import replace_params
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ravenspedia.core.config import metrics_settings
+from .instruments import http_request_duration, http_requests_in_flight
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Label of a request: the path template of its route, e.g. /teams/{team_name}/,
+    never the raw path, so that the number of series stays bounded.
+    """
+    # The router stores the matched route in the shared scope, and the cache
+    # middleware restores it on cache hits
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+
+    # Recent FastAPI versions keep included routers nested, so the path of the
+    # route lacks their prefixes: the part of the path before the route's own
+    own_path, _ = replace_params(
+        route.path_format, route.param_convertors, dict(scope["path_params"])
+    )
+    prefix = scope["path"].removesuffix(own_path)
+    return (prefix if prefix != scope["path"] else "") + route.path
+
+
+# ASGI middleware recording the latency and the in-flight count of the requests
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not metrics_settings.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            http_request_duration.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                route_template(scope),
+                str(status),
+            )
@@ -0,0 +1,184 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import defaultdict
+from threading import Lock
+from typing import Callable, Iterator
+
+# Latency buckets in seconds, from fast cache hits to slow FACEIT calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def escape(value: str) -> str:
+    """
+    Escape a label value for the Prometheus text format.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """
+    Render label pairs as {name="value",...}, or nothing without labels.
+    """
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def format_value(value: float) -> str:
+    """
+    Render a sample value, integers without a fractional part.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# Base class of the metrics: a name, a help text and a fixed set of label names
+class Metric(ABC):
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = Lock()  # Scheduler jobs report from their own thread
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, tuple, tuple, float]]:
+        """
+        Yield (name, label names, label values, value) of every sample.
+        """
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for name, label_names, label_values, value in self.samples():
+            labels = format_labels(label_names, label_values)
+            lines.append(f"{name}{labels} {format_value(value)}")
+        return "\n".join(lines)
+
+
+# Monotonically increasing count, e.g. of requests or errors
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple, float] = defaultdict(float)
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] += amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def samples(self):
+        for label_values, value in sorted(self._values.items()):
+            yield self.name, self.labels, label_values, value
+
+
+# Value that goes up and down, optionally read from a function when scraped
+class Gauge(Metric):
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        function: Callable[[], float] | None = None,
+    ):
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple, float] = defaultdict(float)
+        self.function = function
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] += amount
+
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] -= amount
+
+    def set(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+    def value(self, *label_values: str) -> float:
+        if self.function is not None:
+            return self.function()
+        return self._values.get(label_values, 0)
+
+    def samples(self):
+        if self.function is not None:
+            yield self.name, (), (), self.function()
+            return
+        for label_values, value in sorted(self._values.items()):
+            yield self.name, self.labels, label_values, value
+
+
+# Distribution of observed values (e.g. durations) in cumulative buckets
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Label values -> [count per bucket (the last one is +Inf), sum]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [
+                    [0] * (len(self.buckets) + 1),
+                    0.0,
+                ]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, *label_values: str) -> int:
+        entry = self._values.get(label_values)
+        return sum(entry[0]) if entry else 0
+
+    def samples(self):
+        bucket_labels = self.labels + ("le",)
+        for label_values, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else format_value(bound)
+                yield (
+                    f"{self.name}_bucket",
+                    bucket_labels,
+                    label_values + (le,),
+                    cumulative,
+                )
+            yield f"{self.name}_sum", self.labels, label_values, total
+            yield f"{self.name}_count", self.labels, label_values, cumulative
+
+
+# Set of metrics exposed together on /metrics
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format (0.0.4).
+        """
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from .instruments import registry
+
+router = APIRouter(tags=["Metrics"])
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# Define the endpoint scraped by Prometheus (at /metrics, its default path)
+@router.get(
+    "",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ravenspedia.api_v1.cache import invalidate_tags
 from ravenspedia.api_v1.news.schemes import NewsCreate, NewsGeneralInfoUpdate
 from ravenspedia.core import db_helper, TableNews
 
@@ -47,6 +48,7 @@ async def create_news(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A news with such data already exists",
         )
+    invalidate_tags(f"news:{news.id}")
     return news
 
 
@@ -60,6 +62,7 @@ async def update_general_news_info(
     for field, value in news_update.model_dump(exclude_unset=True).items():
         setattr(news, field, value)
     await session.commit()
+    invalidate_tags(f"news:{news.id}")
     return news
 
 
@@ -68,5 +71,7 @@ async def delete_news(
     session: AsyncSession,
     news: TableNews,
 ) -> None:
+    news_id = news.id
     await session.delete(news)
     await session.commit()
+    invalidate_tags(f"news:{news_id}")
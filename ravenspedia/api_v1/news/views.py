@@ -5,21 +5,30 @@ from . import crud
 from .schemes import ResponseNews, NewsCreate, NewsGeneralInfoUpdate
 from ravenspedia.core import db_helper, TableNews, TableUser
 from ravenspedia.api_v1.auth.dependencies import get_current_admin_user
+from ravenspedia.api_v1.cache import cache_tags
+from ravenspedia.api_v1.rendering import FastJSONResponse
 
 router = APIRouter(tags=["News"])
 
 
+# Convert a TableNews object to a plain dict shaped like ResponseNews.
+def table_to_response_dict(
+    news: TableNews,
+) -> dict:
+    return {
+        "title": news.title,
+        "content": news.content,
+        "created_at": news.created_at,
+        "author": news.author,
+        "id": news.id,
+    }
+
+
 # Convert a TableNews object to ResponseNews schema for API output.
 def table_to_response_form(
     news: TableNews,
 ) -> ResponseNews:
-    return ResponseNews(
-        id=news.id,
-        title=news.title,
-        content=news.content,
-        created_at=news.created_at,
-        author=news.author,
-    )
+    return ResponseNews(**table_to_response_dict(news))
 
 
 # Endpoint to retrieve all news articles.
@@ -27,12 +36,13 @@ def table_to_response_form(
     "/",
     response_model=list[ResponseNews],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("news"))],
 )
 async def get_news(
     session: AsyncSession = Depends(db_helper.session_dependency),
-):
+) -> FastJSONResponse:
     news = await crud.get_news(session=session)
-    return [table_to_response_form(cur) for cur in news]
+    return FastJSONResponse([table_to_response_dict(cur) for cur in news])
 
 
 # Endpoint to retrieve a single news article by ID.
@@ -40,13 +50,14 @@ async def get_news(
     "/{news_id}/",
     response_model=ResponseNews,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("news:{news_id}"))],
 )
 async def get_news_by_id(
     news_id: int,
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> ResponseNews:
+) -> FastJSONResponse:
     news = await crud.get_news_by_id(news_id=news_id, session=session)
-    return table_to_response_form(news)
+    return FastJSONResponse(table_to_response_dict(news))
 
 
 # Endpoint to create a new news article (admin only).
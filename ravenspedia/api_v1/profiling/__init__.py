@@ -0,0 +1,11 @@
+# Data for export
+__all__ = (
+    "profile_request",
+    "profile_requested",
+    "profile_store",
+    "ProfilingMiddleware",
+)
+
+from .dependencies import profile_request, profile_requested
+from .middleware import ProfilingMiddleware
+from .store import profile_store
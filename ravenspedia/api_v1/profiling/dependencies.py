@@ -0,0 +1,78 @@
+import asyncio
+import itertools
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Scope
+
+from ravenspedia.api_v1.auth.dependencies import (
+    get_access_token,
+    get_current_admin_user,
+    get_current_user,
+)
+from ravenspedia.api_v1.metrics.middleware import route_template
+from ravenspedia.core import db_helper
+from ravenspedia.core.config import profiling_settings
+from .sampler import StackSampler
+
+# Requests seen by the rolling capture
+_request_counter = itertools.count()
+
+# Values of the header and of the query flag asking for a profile
+_FLAG_VALUES = {"1", "true", "yes"}
+
+
+def profile_requested(scope: Scope) -> bool:
+    """
+    Check the X-Profile header and the profile query flag of a request.
+    """
+    for name, value in scope.get("headers", []):
+        if name == b"x-profile":
+            return value.decode("latin-1").lower() in _FLAG_VALUES
+    query = scope.get("query_string", b"").decode("latin-1")
+    return any(
+        pair.partition("=")[0] == "profile"
+        and pair.partition("=")[2].lower() in _FLAG_VALUES
+        for pair in query.split("&")
+    )
+
+
+def rolling_capture(scope: Scope) -> bool:
+    """
+    Decide whether the rolling capture samples this request.
+    """
+    if profiling_settings.sample_every <= 0:
+        return False
+    routes = profiling_settings.routes
+    if routes and route_template(scope) not in routes:
+        return False
+    return next(_request_counter) % profiling_settings.sample_every == 0
+
+
+def start_profiler(request: Request, mode: str) -> None:
+    """
+    Sample the current request until the profiling middleware stops it.
+    """
+    sampler = StackSampler(
+        task=asyncio.current_task(),
+        interval=profiling_settings.interval_ms / 1000,
+    )
+    request.state.profiler = sampler.start()
+    request.state.profile_mode = mode
+
+
+async def profile_request(
+    request: Request,
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> None:
+    """
+    Start profiling the request if an admin asks for it, or if the rolling capture
+    picks it. Declared on the API router, so it runs before every endpoint.
+    """
+    if profile_requested(request.scope):
+        # Only admins may profile, others get the usual 401/403
+        user = await get_current_user(request, get_access_token(request), session)
+        await get_current_admin_user(user)
+        start_profiler(request, "explicit")
+    elif rolling_capture(request.scope):
+        start_profiler(request, "rolling")
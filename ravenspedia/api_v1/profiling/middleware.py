@@ -0,0 +1,77 @@
+import time
+from datetime import datetime
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ravenspedia.api_v1.metrics.middleware import route_template
+from ravenspedia.core.config import profiling_settings
+from .sampler import StackSampler
+from .store import Profile, ProfileStore, profile_store
+
+
+# ASGI middleware stopping the profiler of a request and storing its profile
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, store: ProfileStore = profile_store):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # The profiler is started by the profile_request dependency
+                sampler = scope.get("state", {}).pop("profiler", None)
+                if sampler is not None:
+                    profile = self.finish(scope, sampler, message["status"], start)
+                    if profile is not None:
+                        message = {
+                            **message,
+                            "headers": [
+                                *message.get("headers", []),
+                                (b"x-profile-id", str(profile.id).encode()),
+                            ],
+                        }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # No response was sent (e.g. an unhandled error): drop the profile
+            sampler = scope.get("state", {}).pop("profiler", None)
+            if sampler is not None:
+                sampler.stop()
+
+    def finish(
+        self,
+        scope: Scope,
+        sampler: StackSampler,
+        status: int,
+        start: float,
+    ) -> Profile | None:
+        """
+        Stop the sampler and store its profile, None if it is not kept.
+        """
+        stacks = sampler.stop()
+        duration_ms = (time.perf_counter() - start) * 1000
+        mode = scope["state"].get("profile_mode", "explicit")
+        if mode == "rolling" and duration_ms < profiling_settings.min_duration_ms:
+            return None
+
+        profile = Profile(
+            id=self.store.next_id(),
+            mode=mode,
+            method=scope["method"],
+            path=scope["path"],
+            route=route_template(scope),
+            status=status,
+            duration_ms=round(duration_ms, 2),
+            interval_ms=profiling_settings.interval_ms,
+            created_at=datetime.now(),
+            stacks=stacks,
+        )
+        return profile if self.store.add(profile) else None
@@ -0,0 +1,89 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+
+def frame_name(frame: FrameType) -> str:
+    """
+    Name of a frame in the folded stacks: module:function.
+    """
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_name}"
+
+
+def coroutine_frames(task: asyncio.Task) -> tuple[list[FrameType], str | None]:
+    """
+    Frames of the coroutines of a task, outermost first, and the name of what
+    the innermost one awaits (e.g. a Future) when the task is suspended.
+    """
+    frames = []
+    awaitable = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(
+            awaitable, "gi_frame", None
+        )
+        if frame is None:
+            # Not a coroutine: the object the task is waiting for
+            return frames, f"[await {type(awaitable).__name__}]"
+        frames.append(frame)
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(
+            awaitable, "gi_yieldfrom", None
+        )
+    return frames, None
+
+
+# Background thread sampling the stack of one request task at a fixed interval
+class StackSampler:
+    def __init__(self, task: asyncio.Task, interval: float):
+        self.task = task
+        self.interval = interval
+        self.thread_id = threading.get_ident()  # Thread of the event loop
+        self.stacks: Counter[str] = Counter()  # Folded stack -> number of samples
+        self.started_at = time.perf_counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter[str]:
+        """
+        Stop sampling and return the collected stacks (safe to call twice).
+        """
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._thread.join()
+        return self.stacks
+
+    def sample(self) -> None:
+        """
+        Record the current stack of the task.
+        """
+        frames, awaiting = coroutine_frames(self.task)
+        if not frames:
+            return
+        names = [frame_name(frame) for frame in frames]
+
+        if awaiting is not None:
+            names.append(awaiting)
+        else:
+            # The task is running: add the plain functions it is calling, found
+            # between the top of the thread stack and its innermost coroutine
+            calls = []
+            frame = sys._current_frames().get(self.thread_id)
+            while frame is not None and frame is not frames[-1]:
+                calls.append(frame_name(frame))
+                frame = frame.f_back
+            if frame is not None:
+                names.extend(reversed(calls))
+
+        self.stacks[";".join(names)] += 1
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.sample()
+            self._stopped.wait(self.interval)
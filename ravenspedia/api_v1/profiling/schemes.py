@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+# Define the schema describing a stored profile
+class ProfileInfo(BaseModel):
+    id: int
+    mode: str
+    method: str
+    path: str
+    route: str
+    status: int
+    duration_ms: float
+    interval_ms: float
+    samples: int
+    created_at: datetime
+
+
+# Define the schema of the rolling capture settings
+class CaptureSettings(BaseModel):
+    sample_every: int = Field(0, ge=0)  # Profile 1 in N requests, 0 disables
+    routes: list[str] = []  # Route templates sampled, empty for every route
+    min_duration_ms: float = Field(0.0, ge=0)  # Faster profiles are not kept
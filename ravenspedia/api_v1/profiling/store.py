@@ -0,0 +1,87 @@
+import heapq
+import itertools
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ravenspedia.core.config import profiling_settings
+
+
+# Sampled stacks of one request together with what was requested
+@dataclass
+class Profile:
+    id: int
+    mode: str  # "explicit" (asked for by an admin) or "rolling" (sampled)
+    method: str
+    path: str
+    route: str
+    status: int
+    duration_ms: float
+    interval_ms: float
+    created_at: datetime
+    stacks: Counter = field(repr=False)  # Folded stack -> number of samples
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def folded(self) -> str:
+        """
+        Render the stacks in the folded format read by flamegraph.pl and speedscope.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+# Bounded store of profiles: the latest explicit ones and the slowest rolling ones
+class ProfileStore:
+    def __init__(self, keep_recent: int, keep_worst: int):
+        self.keep_recent = keep_recent
+        self.keep_worst = keep_worst
+        self._ids = itertools.count(1)
+        self._recent: OrderedDict[int, Profile] = OrderedDict()
+        self._worst: list[tuple[float, int, Profile]] = []  # Min-heap by duration
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, profile: Profile) -> bool:
+        """
+        Store a profile, return False if a rolling one is faster than all kept.
+        """
+        if profile.mode == "explicit":
+            self._recent[profile.id] = profile
+            while len(self._recent) > self.keep_recent:
+                self._recent.popitem(last=False)
+            return True
+
+        entry = (profile.duration_ms, profile.id, profile)
+        if len(self._worst) < self.keep_worst:
+            heapq.heappush(self._worst, entry)
+            return True
+        if entry[:2] > self._worst[0][:2]:
+            heapq.heapreplace(self._worst, entry)  # Drop the fastest one kept
+            return True
+        return False
+
+    def get(self, profile_id: int) -> Profile | None:
+        if profile_id in self._recent:
+            return self._recent[profile_id]
+        return next((p for _, _, p in self._worst if p.id == profile_id), None)
+
+    def list(self) -> list[Profile]:
+        """
+        Return all stored profiles, slowest first.
+        """
+        profiles = [*self._recent.values(), *(p for _, _, p in self._worst)]
+        return sorted(profiles, key=lambda p: p.duration_ms, reverse=True)
+
+    def clear(self) -> None:
+        self._recent.clear()
+        self._worst.clear()
+
+
+# Shared profile store filled by the profiling middleware
+profile_store = ProfileStore(
+    keep_recent=profiling_settings.keep_recent,
+    keep_worst=profiling_settings.keep_worst,
+)
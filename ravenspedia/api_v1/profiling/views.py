@@ -0,0 +1,88 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from ravenspedia.api_v1.auth.dependencies import get_current_admin_user
+from ravenspedia.core import TableUser
+from ravenspedia.core.config import profiling_settings
+from .schemes import CaptureSettings, ProfileInfo
+from .store import Profile, profile_store
+
+router = APIRouter(tags=["Profiles"])
+
+
+# Convert a Profile to ProfileInfo schema for API output.
+def profile_to_response_form(profile: Profile) -> ProfileInfo:
+    return ProfileInfo(
+        id=profile.id,
+        mode=profile.mode,
+        method=profile.method,
+        path=profile.path,
+        route=profile.route,
+        status=profile.status,
+        duration_ms=profile.duration_ms,
+        interval_ms=profile.interval_ms,
+        samples=profile.samples,
+        created_at=profile.created_at,
+    )
+
+
+# Define an endpoint to list the stored profiles, slowest first
+@router.get(
+    "/",
+    response_model=list[ProfileInfo],
+    status_code=status.HTTP_200_OK,
+)
+async def get_profiles(
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin.
+) -> list[ProfileInfo]:
+    return [profile_to_response_form(profile) for profile in profile_store.list()]
+
+
+# Define an endpoint to read the rolling capture settings
+@router.get(
+    "/capture/",
+    response_model=CaptureSettings,
+    status_code=status.HTTP_200_OK,
+)
+async def get_capture_settings(
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin.
+) -> CaptureSettings:
+    return CaptureSettings(
+        sample_every=profiling_settings.sample_every,
+        routes=profiling_settings.routes,
+        min_duration_ms=profiling_settings.min_duration_ms,
+    )
+
+
+# Define an endpoint to change the rolling capture without a redeploy
+@router.put(
+    "/capture/",
+    response_model=CaptureSettings,
+    status_code=status.HTTP_200_OK,
+)
+async def update_capture_settings(
+    capture_in: CaptureSettings,
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin.
+) -> CaptureSettings:
+    for name, value in capture_in.model_dump().items():
+        setattr(profiling_settings, name, value)
+    return capture_in
+
+
+# Define an endpoint to download a profile in the folded stacks format
+@router.get(
+    "/{profile_id}/",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_profile(
+    profile_id: int,
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin.
+) -> PlainTextResponse:
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile {profile_id} not found",
+        )
+    return PlainTextResponse(profile.folded())
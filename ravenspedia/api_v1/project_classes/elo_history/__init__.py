@@ -0,0 +1,10 @@
+# Data for export
+__all__ = (
+    "ResponseEloCurve",
+    "get_player_elo_curve",
+    "get_team_elo_curve",
+    "record_elo_changes",
+)
+
+from .crud import get_player_elo_curve, get_team_elo_curve, record_elo_changes
+from .schemes import ResponseEloCurve
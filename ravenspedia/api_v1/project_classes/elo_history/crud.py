@@ -0,0 +1,218 @@
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import (
+    TablePlayer,
+    TablePlayerEloHistory,
+    TableTeam,
+    TableTeamEloHistory,
+)
+from .schemes import EloPoint, ResponseEloCurve
+
+# History table of each kind of entity
+EloHistory = type[TablePlayerEloHistory] | type[TableTeamEloHistory]
+
+
+def owner_column(history: EloHistory):
+    """
+    Return the column of the history table referencing the player or the team.
+    """
+    if history is TablePlayerEloHistory:
+        return history.player_id
+    return history.team_id
+
+
+async def record_elo_changes(
+    session: AsyncSession,
+    history: EloHistory,
+    values: dict[int, float | None],
+    ts: datetime,
+) -> int:
+    """
+    Append the new ELO of the given players or teams (id -> ELO) to their
+    history, only where it differs from the last recorded value. The caller
+    commits. Returns the number of changes recorded.
+    """
+    values = {owner_id: elo for owner_id, elo in values.items() if elo is not None}
+    if not values:
+        return 0
+    owner_id = owner_column(history)
+
+    # Last recorded ELO of each owner, through the (owner, ts) index
+    last_ts = (
+        select(owner_id.label("owner_id"), func.max(history.ts).label("ts"))
+        .where(owner_id.in_(list(values)))
+        .group_by(owner_id)
+        .subquery()
+    )
+    last_values = dict(
+        (
+            await session.execute(
+                select(owner_id, history.elo).join(
+                    last_ts,
+                    (last_ts.c.owner_id == owner_id) & (last_ts.c.ts == history.ts),
+                )
+            )
+        ).all()
+    )
+
+    # Only the changes are stored, an unchanged ELO adds nothing
+    rows = [
+        {owner_id.key: owner, "ts": ts, "elo": elo}
+        for owner, elo in values.items()
+        if last_values.get(owner) != elo
+    ]
+    if rows:
+        await session.execute(insert(history), rows)
+    return len(rows)
+
+
+def downsample(
+    changes: list[tuple[datetime, float]],
+    start: datetime,
+    end: datetime,
+    max_points: int,
+) -> list[EloPoint]:
+    """
+    Merge the changes into at most max_points points, one per equal slice of the
+    range, keeping the last, lowest and highest ELO of each slice.
+    """
+    if len(changes) <= max_points or end <= start:
+        return [
+            EloPoint(ts=ts, elo=elo, min_elo=elo, max_elo=elo) for ts, elo in changes
+        ]
+
+    width = (end - start) / max_points
+    points: list[EloPoint] = []
+    last_bucket = None
+    for ts, elo in changes:
+        bucket = min(int((ts - start) / width), max_points - 1)
+        if bucket != last_bucket:
+            points.append(EloPoint(ts=ts, elo=elo, min_elo=elo, max_elo=elo))
+            last_bucket = bucket
+            continue
+        point = points[-1]
+        point.ts, point.elo = ts, elo
+        point.min_elo = min(point.min_elo, elo)
+        point.max_elo = max(point.max_elo, elo)
+    return points
+
+
+async def get_elo_curve(
+    session: AsyncSession,
+    history: EloHistory,
+    owner: int,
+    name: str,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    max_points: int,
+) -> ResponseEloCurve:
+    """
+    Retrieve the ELO curve of a player or a team over a range, downsampled to
+    at most max_points points.
+    """
+    owner_id = owner_column(history)
+    stmt = (
+        select(history.ts, history.elo)
+        .where(owner_id == owner)
+        .order_by(history.ts, history.id)
+    )
+    if start_date is not None:
+        stmt = stmt.where(history.ts >= start_date)
+    if end_date is not None:
+        stmt = stmt.where(history.ts <= end_date)
+    changes = [(ts, elo) for ts, elo in await session.execute(stmt)]
+    changes_count = len(changes)
+
+    # The ELO at the start of the range is the last one recorded before it
+    if start_date is not None:
+        previous = (
+            await session.execute(
+                select(history.ts, history.elo)
+                .where(owner_id == owner, history.ts < start_date)
+                .order_by(history.ts.desc(), history.id.desc())
+                .limit(1)
+            )
+        ).first()
+        if previous is not None:
+            changes.insert(0, (start_date, previous.elo))
+
+    points = []
+    if changes:
+        points = downsample(
+            changes,
+            start=changes[0][0],
+            end=changes[-1][0],
+            max_points=max_points,
+        )
+    return ResponseEloCurve(
+        name=name,
+        start_date=start_date,
+        end_date=end_date,
+        changes=changes_count,
+        downsampled=len(points) < len(changes),
+        points=points,
+    )
+
+
+async def get_player_elo_curve(
+    session: AsyncSession,
+    player_nickname: str,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    max_points: int,
+) -> ResponseEloCurve:
+    """
+    Retrieve the Faceit ELO curve of a player.
+    """
+    # Only the id of the player is needed, its relationships are not loaded
+    player_id = await session.scalar(
+        select(TablePlayer.id).where(TablePlayer.nickname == player_nickname)
+    )
+    if player_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Player {player_nickname} not found",
+        )
+    return await get_elo_curve(
+        session,
+        TablePlayerEloHistory,
+        player_id,
+        player_nickname,
+        start_date,
+        end_date,
+        max_points,
+    )
+
+
+async def get_team_elo_curve(
+    session: AsyncSession,
+    team_name: str,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    max_points: int,
+) -> ResponseEloCurve:
+    """
+    Retrieve the average Faceit ELO curve of a team.
+    """
+    # Only the id of the team is needed, its relationships are not loaded
+    team_id = await session.scalar(
+        select(TableTeam.id).where(TableTeam.name == team_name)
+    )
+    if team_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team {team_name} not found",
+        )
+    return await get_elo_curve(
+        session,
+        TableTeamEloHistory,
+        team_id,
+        team_name,
+        start_date,
+        end_date,
+        max_points,
+    )
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class EloPoint(BaseModel):
+    """
+    Pydantic model for one point of an ELO curve, covering one or more changes.
+    """
+
+    ts: datetime  # Date of the last change covered by the point
+    elo: float  # ELO after the last change covered by the point
+    min_elo: float  # Lowest ELO among the changes covered by the point
+    max_elo: float  # Highest ELO among the changes covered by the point
+
+
+class ResponseEloCurve(BaseModel):
+    """
+    Pydantic model for the response format of the ELO curve of a player or a team.
+    """
+
+    name: str  # Nickname of the player or name of the team
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    changes: int  # Number of ELO changes in the range
+    downsampled: bool  # Whether several changes were merged into one point
+    points: List[EloPoint]
@@ -0,0 +1,12 @@
+# Data for export
+__all__ = (
+    "rebuild_map_meta_stats",
+    "recalculate_map_meta_stats",
+    "update_map_meta_stats",
+)
+
+from .crud import (
+    rebuild_map_meta_stats,
+    recalculate_map_meta_stats,
+    update_map_meta_stats,
+)
@@ -0,0 +1,225 @@
+from collections import defaultdict
+from typing import Iterable
+
+from sqlalchemy import and_, case, delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import MapName, TableMapMetaStats, TableMapResultInfo, TableMatch
+from .schemes import ResponseMapMetaStats
+from ..team_stats.crud import percent
+from ...cache import invalidate_tags
+
+# Counters of the rollup, in the order of the grouped query below
+COUNTERS = (
+    "played",
+    "rounds",
+    "overtimes",
+    "half_swing",
+    "first_half_leads",
+    "first_half_leader_wins",
+)
+
+
+def count_map_result(result: TableMapResultInfo) -> dict:
+    """
+    Compute the contribution of one map result to the counters of the rollup.
+    """
+    first_half_margin = (
+        result.first_half_score_first_team - result.first_half_score_second_team
+    )
+    second_half_margin = (
+        result.second_half_score_first_team - result.second_half_score_second_team
+    )
+    final_margin = result.total_score_first_team - result.total_score_second_team
+    return {
+        "played": 1,
+        "rounds": result.total_score_first_team + result.total_score_second_team,
+        "overtimes": int(
+            result.overtime_score_first_team + result.overtime_score_second_team > 0
+        ),
+        "half_swing": abs(first_half_margin - second_half_margin),
+        "first_half_leads": int(first_half_margin != 0),
+        # The leader after the first half kept the lead until the end
+        "first_half_leader_wins": int(first_half_margin * final_margin > 0),
+    }
+
+
+async def update_map_meta_stats(
+    session: AsyncSession,
+    results: Iterable[TableMapResultInfo],
+    tournament_id: int,
+    sign: int = 1,
+) -> None:
+    """
+    Add (sign=1) or subtract (sign=-1) map results of a tournament from the map
+    rollup. The caller commits.
+    """
+    # Accumulate the changes of the counters per map
+    deltas = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    for result in results:
+        for name, value in count_map_result(result).items():
+            deltas[result.map][name] += sign * value
+    if not deltas:
+        return
+
+    # Create the missing rollup entries of the maps, with zero counters
+    existing = set(
+        await session.scalars(
+            select(TableMapMetaStats.map).where(
+                TableMapMetaStats.tournament_id == tournament_id,
+                TableMapMetaStats.map.in_(list(deltas)),
+            )
+        )
+    )
+    session.add_all(
+        TableMapMetaStats(
+            tournament_id=tournament_id,
+            map=map_name,
+            **dict.fromkeys(COUNTERS, 0),
+        )
+        for map_name in deltas
+        if map_name not in existing
+    )
+    await session.flush()
+
+    # Apply the changes with a single UPDATE per map
+    for map_name, delta in deltas.items():
+        await session.execute(
+            update(TableMapMetaStats)
+            .where(
+                TableMapMetaStats.tournament_id == tournament_id,
+                TableMapMetaStats.map == map_name,
+            )
+            .values(
+                {
+                    name: getattr(TableMapMetaStats, name) + value
+                    for name, value in delta.items()
+                }
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def recalculate_map_meta_stats(
+    session: AsyncSession,
+    tournament_ids: Iterable[int | None] | None = None,
+) -> None:
+    """
+    Replace the map rollup of the given tournaments (all by default) with a fixed
+    number of statements. The caller commits.
+    """
+    if tournament_ids is not None:
+        tournament_ids = {id_ for id_ in tournament_ids if id_ is not None}
+        if not tournament_ids:
+            return
+
+    # Count the results added or removed in the transaction
+    await session.flush()
+    stmt = delete(TableMapMetaStats).execution_options(synchronize_session=False)
+    if tournament_ids is not None:
+        stmt = stmt.where(TableMapMetaStats.tournament_id.in_(tournament_ids))
+    await session.execute(stmt)
+
+    # Same counters as count_map_result, grouped by tournament and map
+    result = TableMapResultInfo
+    first_half_margin = (
+        result.first_half_score_first_team - result.first_half_score_second_team
+    )
+    second_half_margin = (
+        result.second_half_score_first_team - result.second_half_score_second_team
+    )
+    final_margin = result.total_score_first_team - result.total_score_second_team
+    leader_won = or_(
+        and_(first_half_margin > 0, final_margin > 0),
+        and_(first_half_margin < 0, final_margin < 0),
+    )
+    stmt = (
+        select(
+            TableMatch.tournament_id,
+            result.map,
+            func.count(),
+            func.sum(result.total_score_first_team + result.total_score_second_team),
+            func.sum(
+                case(
+                    (
+                        result.overtime_score_first_team
+                        + result.overtime_score_second_team
+                        > 0,
+                        1,
+                    ),
+                    else_=0,
+                )
+            ),
+            func.sum(func.abs(first_half_margin - second_half_margin)),
+            func.sum(case((first_half_margin != 0, 1), else_=0)),
+            func.sum(case((leader_won, 1), else_=0)),
+        )
+        .join(TableMatch, TableMatch.id == result.match_id)
+        .group_by(TableMatch.tournament_id, result.map)
+    )
+    if tournament_ids is not None:
+        stmt = stmt.where(TableMatch.tournament_id.in_(tournament_ids))
+
+    rows = [
+        {"tournament_id": tournament_id, "map": map_name, **dict(zip(COUNTERS, values))}
+        for tournament_id, map_name, *values in await session.execute(stmt)
+    ]
+    if rows:
+        await session.execute(insert(TableMapMetaStats), rows)
+
+
+async def rebuild_map_meta_stats(
+    session: AsyncSession,
+) -> None:
+    """
+    Recalculate the map rollup of all tournaments from the map results
+    (e.g. for backfills).
+    """
+    await recalculate_map_meta_stats(session)
+    await session.commit()
+    invalidate_tags("map")
+
+
+async def get_map_meta_stats(
+    session: AsyncSession,
+    tournament_ids: list[int] | None = None,
+) -> list[ResponseMapMetaStats]:
+    """
+    Retrieve the statistics of every map from the rollup, summed over all
+    tournaments or the given ones.
+    """
+    stmt = select(
+        TableMapMetaStats.map,
+        *(func.sum(getattr(TableMapMetaStats, name)) for name in COUNTERS),
+    ).group_by(TableMapMetaStats.map)
+    if tournament_ids is not None:
+        stmt = stmt.where(TableMapMetaStats.tournament_id.in_(tournament_ids))
+    by_map = {
+        map_name: dict(zip(COUNTERS, values))
+        for map_name, *values in await session.execute(stmt)
+    }
+
+    # Maps never played are reported with zeros
+    empty = dict.fromkeys(COUNTERS, 0)
+    total_played = sum(row["played"] for row in by_map.values())
+    response = []
+    for map_name in MapName:
+        row = by_map.get(map_name, empty)
+        played = row["played"]
+        response.append(
+            ResponseMapMetaStats(
+                map=map_name.value,
+                played=played,
+                play_rate=percent(played, total_played),
+                average_rounds=round(row["rounds"] / played, 2) if played else 0.0,
+                overtimes=row["overtimes"],
+                overtime_rate=percent(row["overtimes"], played),
+                average_half_swing=(
+                    round(row["half_swing"] / played, 2) if played else 0.0
+                ),
+                first_half_leader_win_rate=percent(
+                    row["first_half_leader_wins"], row["first_half_leads"]
+                ),
+            )
+        )
+    return response
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+from ..team_stats.schemes import MapName
+
+
+class ResponseMapMetaStats(BaseModel):
+    """
+    Pydantic model for the response format of the statistics of a map across
+    tournaments.
+    """
+
+    map: MapName  # The name of the map
+    played: int  # Number of map results on the map
+    play_rate: float  # Share of all map results played on the map, in percent
+    average_rounds: float  # Average number of rounds per map, overtime included
+    overtimes: int  # Number of maps that went to overtime
+    overtime_rate: float  # Share of the maps that went to overtime, in percent
+    average_half_swing: float  # Average change of the round margin between the halves
+    first_half_leader_win_rate: (
+        float  # Share of the maps with a first half leader won by it, in percent
+    )
@@ -0,0 +1,46 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .crud import get_map_meta_stats, rebuild_map_meta_stats
+from .schemes import ResponseMapMetaStats
+from ...auth.dependencies import get_current_admin_user
+from ...cache import cache_tags
+
+from ravenspedia.core import db_helper, TableUser
+
+# Define a router for map statistics endpoints
+router = APIRouter(tags=["Map Stats"])
+
+
+@router.get(
+    "/",
+    response_model=List[ResponseMapMetaStats],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("map"))],
+)
+async def get_map_stats(
+    tournament_ids: Optional[List[int]] = Query(None),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> List[ResponseMapMetaStats]:
+    """
+    Retrieve the play count, average rounds, overtime rate and half swing of
+    every map, across all tournaments or the given ones.
+    """
+    return await get_map_meta_stats(session=session, tournament_ids=tournament_ids)
+
+
+@router.patch(
+    "/rebuild/",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def rebuild_map_stats(
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> None:
+    """
+    Recalculate the map statistics of all tournaments from the map results
+    (admin only).
+    """
+    await rebuild_map_meta_stats(session=session)
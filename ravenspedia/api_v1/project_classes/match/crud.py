@@ -1,48 +1,54 @@
 from importlib.util import source_hash
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from ravenspedia.core import TableMatch, TableTournament, TableMatchStats
-from .dependencies import get_match_by_id
+from ravenspedia.core import (
+    TableMatch,
+    TableTournament,
+    TableMatchStats,
+    TableMatchDocument,
+    TableMapPickBanInfo,
+    TableMapResultInfo,
+    TablePlayer,
+    TeamMatchAssociation,
+)
+from .documents import get_match_documents, refresh_match_documents
+from .live import match_broadcaster
 from .schemes import MatchCreate, MatchGeneralInfoUpdate
-from ..match_stats import sync_player_tournaments
+from ..map_stats import recalculate_map_meta_stats
+from ..match_stats import sync_players_tournaments
+from ..team_stats.crud import recalculate_team_map_stats, recalculate_team_veto_stats
 from ..tournament import get_tournament_by_name
+from ..tournament.summary import refresh_tournament_summaries
+from ...cache import invalidate_tags
 
 
-async def get_matches(session: AsyncSession) -> list[TableMatch]:
+async def get_matches(session: AsyncSession) -> list[str]:
     """
-    Retrieve all matches from the database with related data.
+    Retrieve the serialized documents of all matches, ordered by ID.
     """
-    stmt = (
-        select(TableMatch)
-        .options(
-            selectinload(TableMatch.stats).selectinload(TableMatchStats.player),
-            selectinload(TableMatch.teams),
-            selectinload(TableMatch.tournament),
-            selectinload(TableMatch.veto),
-            selectinload(TableMatch.result),
-        )
-        .order_by(TableMatch.id)
-    )
-    matches = await session.scalars(stmt)
-    return list(matches)
+    return await get_match_documents(session, order_by=(TableMatch.id,))
 
 
 async def get_match(
     session: AsyncSession,
     match_id: int,
-) -> TableMatch | None:
+) -> str:
     """
-    Retrieve a specific match by its ID.
+    Retrieve the serialized document of a specific match by its ID.
     """
-    table_match: TableMatch = await get_match_by_id(
-        match_id=match_id,
-        session=session,
-    )
-    return table_match
+    documents = await get_match_documents(session, TableMatch.id == match_id)
+
+    # Raise an exception if the match is not found
+    if not documents:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Match {match_id} not found",
+        )
+
+    return documents[0]
 
 
 async def create_match(
@@ -91,28 +97,124 @@ async def create_match(
         match,
         attribute_names=["stats", "teams", "tournament", "veto", "result"],
     )
+    await refresh_match_documents(session, [match.id])
+    invalidate_tags(f"tournament:{tournament_of_match.name}")
     return match
 
 
+async def delete_matches(
+    session: AsyncSession,
+    match_ids: list[int],
+    sync_players: bool = True,
+) -> dict:
+    """
+    Delete matches and everything attached to them with a fixed number of bulk
+    statements, in the caller's transaction. Returns the number of affected rows.
+    """
+    summary = {
+        "matches": 0,
+        "stats": 0,
+        "veto": 0,
+        "map_results": 0,
+        "documents": 0,
+        "team_links": 0,
+        "player_tournaments": 0,
+    }
+    if not match_ids:
+        return summary
+
+    # Players (via stats or teams) and teams whose derived data must be resynced
+    player_ids = list(
+        await session.scalars(
+            union(
+                select(TableMatchStats.player_id).where(
+                    TableMatchStats.match_id.in_(match_ids)
+                ),
+                select(TablePlayer.id)
+                .join(
+                    TeamMatchAssociation,
+                    TeamMatchAssociation.team_id == TablePlayer.team_id,
+                )
+                .where(TeamMatchAssociation.match_id.in_(match_ids)),
+            )
+        )
+    )
+    team_ids = list(
+        await session.scalars(
+            select(TeamMatchAssociation.team_id)
+            .where(TeamMatchAssociation.match_id.in_(match_ids))
+            .distinct()
+        )
+    )
+    # Teams that picked or banned in the matches, even if they left them since
+    veto_team_ids = list(
+        await session.scalars(
+            select(TableMapPickBanInfo.initiator_team_id)
+            .where(TableMapPickBanInfo.match_id.in_(match_ids))
+            .distinct()
+        )
+    )
+    # Tournaments whose map rollup counted the results of the matches
+    tournament_ids = list(
+        await session.scalars(
+            select(TableMatch.tournament_id)
+            .where(TableMatch.id.in_(match_ids))
+            .distinct()
+        )
+    )
+
+    # Delete the rows attached to the matches, then the matches themselves
+    for key, model in (
+        ("stats", TableMatchStats),
+        ("veto", TableMapPickBanInfo),
+        ("map_results", TableMapResultInfo),
+        ("documents", TableMatchDocument),
+        ("team_links", TeamMatchAssociation),
+    ):
+        result = await session.execute(
+            delete(model)
+            .where(model.match_id.in_(match_ids))
+            .execution_options(synchronize_session=False)
+        )
+        summary[key] = result.rowcount
+
+    result = await session.execute(
+        delete(TableMatch)
+        .where(TableMatch.id.in_(match_ids))
+        .execution_options(synchronize_session=False)
+    )
+    summary["matches"] = result.rowcount
+
+    # Keep the players' tournaments and the teams' map stats consistent
+    if sync_players:
+        summary["player_tournaments"] = await sync_players_tournaments(
+            session, player_ids
+        )
+    await recalculate_team_map_stats(session, team_ids)
+    await recalculate_team_veto_stats(session, [*team_ids, *veto_team_ids])
+    await recalculate_map_meta_stats(session, tournament_ids)
+    # The live stream has nothing more to diff for the matches
+    match_broadcaster.forget(match_ids)
+
+    return summary
+
+
 async def delete_match(
     session: AsyncSession,
     match: TableMatch,
-) -> None:
+) -> dict:
     """
     Delete a match from the database and sync player tournaments.
     """
-    # Gather all players associated with the match (via stats or teams)
-    players = {stat.player for stat in match.stats}
-    for team in match.teams:
-        players.update(team.players)
-
-    # Sync tournaments for all affected players
-    for player in players:
-        await sync_player_tournaments(session, player)
-
-    # Delete the match and commit
-    await session.delete(match)
+    match_id = match.id
+    tournament_id = match.tournament_id
+    summary = await delete_matches(session, [match_id])
     await session.commit()
+    await refresh_tournament_summaries(session, [tournament_id])
+
+    # Its teams, players, tournament and map statistics all referenced the match
+    invalidate_tags(f"match:{match_id}", "tournament", "team", "player", "map")
+    return summary
 
 
 async def update_general_match_info(
@@ -123,6 +225,9 @@ async def update_general_match_info(
     """
     Update general information of a match (e.g., tournament, date, description).
     """
+    old_tournament = match.tournament.name
+    old_tournament_id = match.tournament_id
+
     # Update fields dynamically based on the provided update data
     for class_field, value in match_update.model_dump(exclude_unset=True).items():
         if class_field == "tournament":
@@ -144,5 +249,33 @@ async def update_general_match_info(
         else:
             setattr(match, class_field, value)
 
+    # The map results of the match move to the rollup of the new tournament
+    moved = match.tournament_id != old_tournament_id
+    if moved:
+        await recalculate_map_meta_stats(
+            session, [old_tournament_id, match.tournament_id]
+        )
+
     await session.commit()
+    await refresh_match_documents(session, [match.id])
+    if moved:
+        # The summary of the new tournament is refreshed with the match document
+        await refresh_tournament_summaries(session, [old_tournament_id])
+    invalidate_tags(
+        f"tournament:{old_tournament}",
+        f"tournament:{match.tournament.name}",
+        # The date and tournament of the match are shown in the head-to-heads
+        *(f"team:{team.name}" for team in match.teams),
+        *(("map",) if moved else ()),
+    )
     return match
+
+
+async def rebuild_match_documents(
+    session: AsyncSession,
+) -> None:
+    """
+    Regenerate the documents of all matches (e.g. after a migration).
+    """
+    match_ids = await session.scalars(select(TableMatch.id))
+    await refresh_match_documents(session, list(match_ids))
@@ -13,6 +13,7 @@ from ravenspedia.core import (
     TableTeam,
     TableTournament,
 )
+from ravenspedia.api_v1.metrics import call_faceit
 from ravenspedia.core.config import faceit_settings
 
 
@@ -53,7 +54,9 @@ async def find_steam_id_by_faceit_id(faceit_id: str) -> str:
         "Accept": "application/json",
         "Authorization": f"Bearer {faceit_settings.api_key}",
     }
-    response = requests.get(
+    response = call_faceit(
+        "/players/{player_id}",
+        requests.get,
         f"{faceit_settings.base_url}/players/{faceit_id}",
         headers=headers,
     )
@@ -0,0 +1,167 @@
+from typing import Iterable
+
+from fastapi import Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from ravenspedia.core import (
+    TableMatch,
+    TableMatchStats,
+    TableMatchDocument,
+    GeneralPlayerStats,
+)
+from .live import match_broadcaster
+from .schemes import ResponseMatch
+from ..tournament.summary import refresh_match_tournament_summaries
+from ...cache import invalidate_tags
+
+
+def build_response_match(
+    match: TableMatch,
+) -> ResponseMatch:
+    """
+    Convert a TableMatch object to a ResponseMatch schema.
+    """
+    result = ResponseMatch(
+        id=match.id,
+        tournament=match.tournament.name,
+        description=match.description,
+        date=match.date,
+        max_number_of_players=match.max_number_of_players,
+        max_number_of_teams=match.max_number_of_teams,
+        best_of=match.best_of,
+        status=match.status,
+        original_source=match.original_source,
+        stats=[],
+        veto=[],
+        result=[],
+    )
+
+    # Populate additional fields if the match is not being created
+    result.teams = [team.name for team in match.teams]
+    result.players = list({elem.player.nickname for elem in match.stats})
+    result.stats = [GeneralPlayerStats(**elem.match_stats) for elem in match.stats]
+    result.veto = [elem for elem in match.veto]
+    result.result = [elem for elem in match.result]
+
+    return result
+
+
+def render_match_document(
+    match: TableMatch,
+) -> str:
+    """
+    Serialize a match to the same JSON document the API returns for it.
+    """
+    response = build_response_match(match)
+
+    # Serialize by alias, exactly like FastAPI does for the response_model
+    return response.model_dump_json(by_alias=True, warnings=False)
+
+
+def match_document_options() -> tuple:
+    """
+    Loader options needed to render the document of a match.
+    """
+    return (
+        selectinload(TableMatch.stats).selectinload(TableMatchStats.player),
+        selectinload(TableMatch.teams),
+        selectinload(TableMatch.tournament),
+        selectinload(TableMatch.veto),
+        selectinload(TableMatch.result),
+    )
+
+
+async def refresh_match_documents(
+    session: AsyncSession,
+    match_ids: Iterable[int],
+) -> None:
+    """
+    Regenerate and store the documents of the given matches.
+    """
+    match_ids = set(match_ids)
+    if not match_ids:
+        return
+
+    # Use a separate session so that the documents reflect the committed state
+    # without touching the objects loaded in the caller's session
+    async with AsyncSession(bind=session.bind) as document_session:
+        stmt = (
+            select(TableMatch)
+            .where(TableMatch.id.in_(match_ids))
+            .options(*match_document_options(), selectinload(TableMatch.document))
+        )
+        matches = await document_session.scalars(stmt)
+
+        changed = []
+        for match in matches:
+            content = render_match_document(match)
+            if match.document is None:
+                match.document = TableMatchDocument(content=content, version=1)
+            elif match.document.content != content:
+                # Bump the version only when the document actually changes
+                match.document.content = content
+                match.document.version += 1
+            else:
+                continue
+            changed.append((match.id, match.document.version, content))
+
+        await document_session.commit()
+
+    # Cached responses of the changed matches are now outdated
+    invalidate_tags(*(f"match:{match_id}" for match_id, _, _ in changed))
+
+    # Push the changes to the viewers of the live stream
+    for match_id, version, content in changed:
+        match_broadcaster.publish(match_id, version, content)
+
+    # Completed tournaments summarize the stats of their matches
+    await refresh_match_tournament_summaries(
+        session, [match_id for match_id, _, _ in changed]
+    )
+
+
+async def get_match_documents(
+    session: AsyncSession,
+    *criteria,
+    order_by: tuple = (TableMatch.id,),
+) -> list[str]:
+    """
+    Retrieve the serialized documents of the matches matching the criteria.
+    """
+    stmt = (
+        select(TableMatch.id, TableMatchDocument.content)
+        .outerjoin(TableMatchDocument, TableMatchDocument.match_id == TableMatch.id)
+        .where(*criteria)
+        .order_by(*order_by)
+    )
+    rows = (await session.execute(stmt)).all()
+
+    # Render the documents that have not been generated yet in memory
+    missing = [match_id for match_id, content in rows if content is None]
+    rendered = {}
+    if missing:
+        matches = await session.scalars(
+            select(TableMatch)
+            .where(TableMatch.id.in_(missing))
+            .options(*match_document_options())
+        )
+        rendered = {match.id: render_match_document(match) for match in matches}
+
+    return [
+        content if content is not None else rendered[match_id]
+        for match_id, content in rows
+    ]
+
+
+def documents_to_response(
+    documents: list[str],
+) -> Response:
+    """
+    Join serialized documents into a JSON array response.
+    """
+    return Response(
+        content="[" + ",".join(documents) + "]",
+        media_type="application/json",
+    )
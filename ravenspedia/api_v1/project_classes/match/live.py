@@ -0,0 +1,102 @@
+import asyncio
+import json
+import threading
+
+from ravenspedia.core import MatchStatus
+from ravenspedia.core.config import live_settings
+from ...rendering import dumps
+
+# Queued instead of the backlog of a viewer that falls too far behind
+RESYNC = object()
+
+
+def encode_event(event: str, data: bytes | str) -> bytes:
+    """
+    Encode one Server-Sent Event, the data being a single line of JSON.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+# One viewer of the live stream: the events waiting to be sent to it
+class Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue_size: int):
+        self.loop = loop  # Loop of the viewer's request, the queue belongs to it
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+
+    def push(self, message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Too slow: drop the backlog, the viewer gets a new snapshot instead
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+# In-process pub/sub turning new match documents into diffs for every viewer
+class MatchBroadcaster:
+    def __init__(self):
+        self._subscribers: set[Subscriber] = set()
+        self._documents: dict[int, dict] = {}  # Last document of unfinished matches
+        self._lock = threading.Lock()
+
+    def subscribe(self, queue_size: int = live_settings.queue_size) -> Subscriber:
+        subscriber = Subscriber(asyncio.get_running_loop(), queue_size)
+        # Scheduled jobs publish from another thread
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def forget(self, match_ids: list[int]) -> None:
+        """
+        Drop the last documents of deleted matches.
+        """
+        with self._lock:
+            for match_id in match_ids:
+                self._documents.pop(match_id, None)
+
+    def publish(self, match_id: int, version: int, content: str) -> None:
+        """
+        Send the fields of a match that changed since its previous document.
+        The event is encoded once and shared by all viewers.
+        """
+        document = json.loads(content)
+        with self._lock:
+            previous = self._documents.get(match_id)
+            if document["status"] == MatchStatus.COMPLETED.value:
+                self._documents.pop(match_id, None)  # No more updates expected
+            else:
+                self._documents[match_id] = document
+            subscribers = list(self._subscribers)
+
+        changes = {
+            key: value
+            for key, value in document.items()
+            if previous is None or previous.get(key) != value
+        }
+        if not changes or not subscribers:
+            return
+        message = encode_event(
+            "match", dumps({"id": match_id, "version": version, "changes": changes})
+        )
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        for subscriber in subscribers:
+            if subscriber.loop is loop:
+                subscriber.push(message)
+            else:
+                # Published from another thread, e.g. a scheduled job
+                subscriber.loop.call_soon_threadsafe(subscriber.push, message)
+
+
+# Shared broadcaster fed by refresh_match_documents
+match_broadcaster = MatchBroadcaster()
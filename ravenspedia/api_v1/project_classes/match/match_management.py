@@ -1,9 +1,56 @@
 from fastapi import HTTPException, status
-from sqlalchemy import delete
+from sqlalchemy import delete, exists, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ravenspedia.core import TableMatch, TableTeam, TableMatchStats
-from ..match_stats import sync_player_tournaments
+from ravenspedia.core import (
+    TableMatch,
+    TablePlayer,
+    TableTeam,
+    TableMatchStats,
+    TeamMatchAssociation,
+    TeamTournamentAssociation,
+)
+from .documents import refresh_match_documents
+from ..match_stats import sync_players_tournaments
+from ..team_stats.crud import update_team_map_stats
+from ..tournament.tournament_management import (
+    count_tournament_teams,
+    is_team_in_tournament,
+)
+from ...cache import invalidate_tags
+
+
+async def is_team_in_match(
+    session: AsyncSession,
+    team_id: int,
+    match_id: int,
+) -> bool:
+    """
+    Check with an EXISTS query whether a team plays in a match.
+    """
+    return await session.scalar(
+        select(
+            exists().where(
+                TeamMatchAssociation.team_id == team_id,
+                TeamMatchAssociation.match_id == match_id,
+            )
+        )
+    )
+
+
+async def get_team_players(
+    session: AsyncSession,
+    team_id: int,
+) -> list[tuple[int, str]]:
+    """
+    Return the ids and nicknames of a team's players without loading the players.
+    """
+    result = await session.execute(
+        select(TablePlayer.id, TablePlayer.nickname).where(
+            TablePlayer.team_id == team_id
+        )
+    )
+    return [(player_id, nickname) for player_id, nickname in result]
 
 
 async def add_team_in_match(
@@ -15,38 +62,61 @@ async def add_team_in_match(
     Add a team to a match, with validation checks.
     """
     # Check if the team is already in the match
-    if team in match.teams:
+    if await is_team_in_match(session, team.id, match.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Team {team.name} already exists",
         )
 
     # Check if the match has reached its maximum number of teams
-    if len(match.teams) == match.max_number_of_teams:
+    count_of_teams = await session.scalar(
+        select(func.count()).where(TeamMatchAssociation.match_id == match.id)
+    )
+    if count_of_teams >= match.max_number_of_teams:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"The maximum number of teams will participate in the match",
         )
 
     # Check if the tournament has reached its maximum number of teams
-    if (team not in match.tournament.teams) and (
-        len(match.tournament.teams) == match.tournament.max_count_of_teams
+    in_tournament = await is_team_in_tournament(session, team.id, match.tournament_id)
+    if (
+        not in_tournament
+        and await count_tournament_teams(session, match.tournament_id)
+        >= match.tournament.max_count_of_teams
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"The maximum number of teams will participate in the tournament",
         )
 
-    # Add the team to the match
-    match.teams.append(team)
-    if not match.tournament in team.tournaments:
-        team.tournaments.append(match.tournament)
+    # Add the team to the match, and to its tournament if needed
+    await session.execute(
+        insert(TeamMatchAssociation).values(team_id=team.id, match_id=match.id)
+    )
+    if not in_tournament:
+        await session.execute(
+            insert(TeamTournamentAssociation).values(
+                team_id=team.id,
+                tournament_id=match.tournament_id,
+            )
+        )
 
     # Sync player tournaments for all players in the team
-    for player in team.players:
-        await sync_player_tournaments(session, player)
+    players = await get_team_players(session, team.id)
+    await sync_players_tournaments(session, [player_id for player_id, _ in players])
+
+    # Results of the match naming the team count again in its map stats
+    await update_team_map_stats(session, match.result, team_ids={team.id})
 
     await session.commit()
+    await session.refresh(match, ["teams"])
+    await refresh_match_documents(session, [match.id])
+    invalidate_tags(
+        f"team:{team.name}",
+        f"tournament:{match.tournament.name}",
+        *(f"player:{nickname}" for _, nickname in players),
+    )
     return match
 
 
@@ -59,20 +129,40 @@ async def delete_team_from_match(
     Remove a team from a match.
     """
     # Check if the team is in the match
-    if not team in match.teams:
+    if not await is_team_in_match(session, team.id, match.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"The team is no longer participate in the match",
         )
 
     # Remove the team from the match
-    match.teams.remove(team)
+    await session.execute(
+        delete(TeamMatchAssociation).where(
+            TeamMatchAssociation.team_id == team.id,
+            TeamMatchAssociation.match_id == match.id,
+        )
+    )
 
     # Sync player tournaments for all players in the team
-    for player in team.players:
-        await sync_player_tournaments(session, player)
+    players = await get_team_players(session, team.id)
+    await sync_players_tournaments(session, [player_id for player_id, _ in players])
+
+    # Results of the match no longer count in the team's map stats
+    await update_team_map_stats(
+        session,
+        match.result,
+        sign=-1,
+        team_ids={team.id},
+    )
 
     await session.commit()
+    await session.refresh(match, ["teams"])
+    await refresh_match_documents(session, [match.id])
+    invalidate_tags(
+        f"team:{team.name}",
+        f"tournament:{match.tournament.name}",
+        *(f"player:{nickname}" for _, nickname in players),
+    )
     return match
 
 
@@ -83,6 +173,8 @@ async def delete_match_stats(
     """
     Delete all statistics associated with a match.
     """
+    nicknames = {stat.player.nickname for stat in match.stats}
+
     # Delete all match stats from the database
     await session.execute(
         delete(TableMatchStats).where(TableMatchStats.match_id == match.id)
@@ -92,4 +184,6 @@ async def delete_match_stats(
 
     await session.commit()
     await session.refresh(match)
+    await refresh_match_documents(session, [match.id])
+    invalidate_tags(*(f"player:{nickname}" for nickname in nicknames))
     return match
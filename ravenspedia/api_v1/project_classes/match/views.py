@@ -1,4 +1,4 @@
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, status, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.core import (
@@ -6,15 +6,17 @@ from ravenspedia.core import (
     TableMatch,
     TableTeam,
     TableUser,
-    GeneralPlayerStats,
 )
-from . import crud, dependencies, match_management
+from . import crud, dependencies, documents, match_management
 from .dependencies import get_match_by_id
 from .schemes import ResponseMatch, MatchCreate, MatchGeneralInfoUpdate
 from ..team import get_team_by_name
 from ...auth.dependencies import get_current_admin_user
+from ...cache import cache_tags
+from ...coalescing import CoalescingRoute
 
-router = APIRouter(tags=["Matches"])
+# Identical concurrent reads of the routes in CoalescingSettings share one response
+router = APIRouter(tags=["Matches"], route_class=CoalescingRoute)
 manager_match_router = APIRouter(tags=["Matches Manager"])
 
 
@@ -22,29 +24,7 @@ manager_match_router = APIRouter(tags=["Matches Manager"])
 def table_to_response_form(
     match: TableMatch,
 ) -> ResponseMatch:
-    result = ResponseMatch(
-        id=match.id,
-        tournament=match.tournament.name,
-        description=match.description,
-        date=match.date,
-        max_number_of_players=match.max_number_of_players,
-        max_number_of_teams=match.max_number_of_teams,
-        best_of=match.best_of,
-        status=match.status,
-        original_source=match.original_source,
-        stats=[],
-        veto=[],
-        result=[],
-    )
-
-    # Populate additional fields if the match is not being created
-    result.teams = [team.name for team in match.teams]
-    result.players = list({elem.player.nickname for elem in match.stats})
-    result.stats = [GeneralPlayerStats(**elem.match_stats) for elem in match.stats]
-    result.veto = [elem for elem in match.veto]
-    result.result = [elem for elem in match.result]
-
-    return result
+    return documents.build_response_match(match=match)
 
 
 # Retrieve all matches from the database.
@@ -52,13 +32,13 @@ def table_to_response_form(
     "/",
     response_model=list[ResponseMatch],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("match"))],
 )
 async def get_matches(
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> list[ResponseMatch]:
+) -> Response:
     matches = await crud.get_matches(session=session)
-    result = [table_to_response_form(match=match) for match in matches]
-    return result
+    return documents.documents_to_response(matches)
 
 
 # Retrieve a specific match by its ID.
@@ -66,16 +46,17 @@ async def get_matches(
     "/{match_id}/",
     response_model=ResponseMatch,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("match:{match_id}"))],
 )
 async def get_match(
     match_id: int,
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> ResponseMatch:
+) -> Response:
     match = await crud.get_match(
         match_id=match_id,
         session=session,
     )
-    return table_to_response_form(match=match)
+    return Response(content=match, media_type="application/json")
 
 
 # Create a new match in the database (admin only).
@@ -96,6 +77,18 @@ async def create_match(
     return table_to_response_form(match=match)
 
 
+# Regenerate the stored documents of all matches (admin only).
+@router.patch(
+    "/rebuild_documents/",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def rebuild_match_documents(
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> None:
+    await crud.rebuild_match_documents(session=session)
+
+
 # Update general information of a match (admin only).
 @router.patch(
     "/{match_id}/",
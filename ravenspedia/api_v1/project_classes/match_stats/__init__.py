@@ -1,9 +1,10 @@
 # Data for export
 __all__ = (
     "sync_player_tournaments",
+    "sync_players_tournaments",
     "MapResultInfo",
     "MapPickBanInfo",
 )
 
-from .helpers import sync_player_tournaments
+from .helpers import sync_player_tournaments, sync_players_tournaments
 from .schemes import MapPickBanInfo, MapResultInfo
@@ -1,8 +1,18 @@
-from sqlalchemy import select
+from typing import Iterable
+
+from sqlalchemy import delete, insert, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ravenspedia.core import TableMatch, TableMatchStats, TablePlayer, TableTeam
+from ravenspedia.core import (
+    TableMatch,
+    TableMatchStats,
+    TablePlayer,
+    TableTeam,
+    TeamMatchAssociation,
+    PlayerTournamentAssociation,
+)
+from ...cache import invalidate_tags
 
 
 async def sync_player_tournaments(
@@ -31,3 +41,46 @@ async def sync_player_tournaments(
     player.tournaments = list(tournaments)
 
     await session.commit()
+    invalidate_tags(f"player:{player.nickname}", "tournament")
+
+
+async def sync_players_tournaments(
+    session: AsyncSession,
+    player_ids: Iterable[int],
+) -> int:
+    """
+    Set-based sync_player_tournaments for many players at once. The caller commits.
+    Returns the number of player-tournament links written.
+    """
+    player_ids = list(player_ids)
+    if not player_ids:
+        return 0
+
+    # Tournaments of the matches the players have stats in
+    by_stats = (
+        select(TableMatchStats.player_id, TableMatch.tournament_id)
+        .join(TableMatch, TableMatch.id == TableMatchStats.match_id)
+        .where(TableMatchStats.player_id.in_(player_ids))
+    )
+
+    # Tournaments of the matches the players' teams take part in
+    by_team = (
+        select(TablePlayer.id, TableMatch.tournament_id)
+        .join(TeamMatchAssociation, TeamMatchAssociation.team_id == TablePlayer.team_id)
+        .join(TableMatch, TableMatch.id == TeamMatchAssociation.match_id)
+        .where(TablePlayer.id.in_(player_ids))
+    )
+
+    # Replace the players' tournament links with the computed ones
+    await session.execute(
+        delete(PlayerTournamentAssociation)
+        .where(PlayerTournamentAssociation.player_id.in_(player_ids))
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(
+        insert(PlayerTournamentAssociation).from_select(
+            ["player_id", "tournament_id"],
+            union(by_stats, by_team),
+        )
+    )
+    return result.rowcount
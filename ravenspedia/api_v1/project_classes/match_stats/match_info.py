@@ -2,6 +2,10 @@ from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .schemes import MapPickBanInfo, MapResultInfo
+from ..map_stats import update_map_meta_stats
+from ..match.documents import refresh_match_documents
+from ..team_stats.crud import update_team_map_stats, update_team_veto_stats
+from ...cache import invalidate_tags
 from ravenspedia.core import (
     TableMatch,
     TableMapPickBanInfo,
@@ -26,7 +30,8 @@ async def add_pick_ban_info_in_match(
         )
 
     # Validate that the initiator is one of the teams in the match
-    team_names = {team.name for team in match.teams}
+    team_ids = {team.name: team.id for team in match.teams}
+    team_names = set(team_ids)
     if info.initiator not in team_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -42,12 +47,20 @@ async def add_pick_ban_info_in_match(
         )
 
     # Add the new pick/ban info to the match
-    new_pick_ban = TableMapPickBanInfo(**info.model_dump())
+    new_pick_ban = TableMapPickBanInfo(
+        **info.model_dump(),
+        initiator_team_id=team_ids[info.initiator],
+    )
     match.veto.append(new_pick_ban)
 
+    # Update the veto rollup of the initiator in the same transaction
+    await update_team_veto_stats(session, match, vetoes=[new_pick_ban])
     await session.commit()
     await session.refresh(match)
+    await refresh_match_documents(session, [match.id])
 
+    # The veto stats of the initiator depend on its vetoes
+    invalidate_tags(f"team:{info.initiator}")
     return match
 
 
@@ -63,10 +76,15 @@ async def delete_last_pick_ban_info_from_match(
     if not match.veto:
         return match
 
-    # Remove the last pick/ban entry
-    match.veto.pop()
+    # Remove the last pick/ban entry and its share of the initiator's veto rollup
+    removed_pick_ban = match.veto.pop()
+    await update_team_veto_stats(session, match, vetoes=[removed_pick_ban], sign=-1)
     await session.commit()
     await session.refresh(match)
+    await refresh_match_documents(session, [match.id])
+
+    # The veto stats of the initiator depend on its vetoes
+    invalidate_tags(f"team:{removed_pick_ban.initiator}")
     return match
 
 
@@ -115,7 +133,8 @@ async def add_map_result_info_in_match(
         )
 
     # Validate that the teams are part of the match
-    team_names = {team.name for team in match.teams}
+    team_ids = {team.name: team.id for team in match.teams}
+    team_names = set(team_ids)
     if info.first_team not in team_names or info.second_team not in team_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -188,10 +207,24 @@ async def add_map_result_info_in_match(
         )
 
     # Add the new map result to the match
-    new_result = TableMapResultInfo(**info.model_dump())
+    new_result = TableMapResultInfo(
+        **info.model_dump(),
+        first_team_id=team_ids[info.first_team],
+        second_team_id=team_ids[info.second_team],
+    )
     match.result.append(new_result)
+
+    # Count the result in the map stats of both teams in the same transaction,
+    # in the won picks of their veto rollups and in the map rollup of the tournament
+    await update_team_map_stats(session, [new_result])
+    await update_team_veto_stats(session, match, results=[new_result])
+    await update_map_meta_stats(session, [new_result], match.tournament_id)
     await session.commit()
     await session.refresh(match)
+    await refresh_match_documents(session, [match.id])
+
+    # The map stats of both teams and of the maps depend on the map results
+    invalidate_tags(*(f"team:{team.name}" for team in match.teams), "map")
     return match
 
 
@@ -206,8 +239,15 @@ async def delete_last_map_result_info_from_match(
     if not match.result:
         return match
 
-    # Remove the last map result entry
-    match.result.pop()
+    # Remove the last map result entry and its share of the teams' map stats
+    removed_result = match.result.pop()
+    await update_team_map_stats(session, [removed_result], sign=-1)
+    await update_team_veto_stats(session, match, results=[removed_result], sign=-1)
+    await update_map_meta_stats(session, [removed_result], match.tournament_id, sign=-1)
     await session.commit()
     await session.refresh(match)
+    await refresh_match_documents(session, [match.id])
+
+    # The map stats of both teams and of the maps depend on the map results
+    invalidate_tags(*(f"team:{team.name}" for team in match.teams), "map")
     return match
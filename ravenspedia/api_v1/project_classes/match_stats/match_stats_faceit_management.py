@@ -16,6 +16,9 @@ from ravenspedia.core import (
 from ravenspedia.core.config import faceit_settings
 from .helpers import sync_player_tournaments
 from ..match.crud import update_general_match_info
+from ..match.documents import refresh_match_documents
+from ...cache import invalidate_tags
+from ...metrics import call_faceit
 from ..match.dependencies import find_steam_id_by_faceit_id
 from ..match.schemes import MatchGeneralInfoUpdate
 from ..player.crud import create_player
@@ -33,7 +36,9 @@ async def find_start_time_from_faceit_match(
     """
     Retrieve the start time of a Faceit match using the Faceit API.
     """
-    response = requests.get(
+    response = call_faceit(
+        "/matches/{match_id}",
+        requests.get,
         f"{faceit_settings.base_url}/matches/{faceit_match_id}",
         headers=headers,
     )
@@ -79,7 +84,9 @@ async def add_match_stats_from_faceit(
         )
     faceit_match_id = faceit_url.replace("/scoreboard", "")[start:]
 
-    response = requests.get(
+    response = call_faceit(
+        "/matches/{match_id}/stats",
+        requests.get,
         f"{faceit_settings.base_url}/matches/{faceit_match_id}/stats",
         headers=headers,
     )
@@ -120,6 +127,7 @@ async def add_match_stats_from_faceit(
     )
 
     # Process each round and player stats from the Faceit data
+    nicknames = set()
     for round_data in data["rounds"]:
         for team_data in round_data["teams"]:
             for player_data in team_data["players"]:
@@ -146,6 +154,7 @@ async def add_match_stats_from_faceit(
                     )
 
                 player_data["player_stats"]["nickname"] = player.nickname
+                nicknames.add(player.nickname)
                 player_stats = PlayerStats(**player_data["player_stats"])
                 round_player_stats = TableMatchStats(
                     player=player,
@@ -159,4 +168,6 @@ async def add_match_stats_from_faceit(
     await session.flush()
     await session.commit()
 
+    await refresh_match_documents(session, [match.id])
+    invalidate_tags(*(f"player:{nickname}" for nickname in nicknames))
     return match
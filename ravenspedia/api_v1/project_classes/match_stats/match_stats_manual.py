@@ -1,9 +1,18 @@
+import csv
+import io
+import json
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.api_v1.schedules.schedule_updater import manual_update_match_status
-from ravenspedia.core import TableMatch, TableMatchStats, MatchStatus
-from .helpers import sync_player_tournaments
-from .schemes import MatchStatsInput
+from ravenspedia.core import TableMatch, TableMatchStats, TablePlayer, MatchStatus
+from .helpers import sync_player_tournaments, sync_players_tournaments
+from .schemes import MatchStatsInput, ScoreboardRowError
+from ..match.documents import refresh_match_documents
+from ...cache import invalidate_tags
 from .. import get_player_by_nickname
 
 
@@ -55,6 +64,7 @@ async def add_manual_match_stats(
     # Now sync the player's tournaments
     await sync_player_tournaments(session=session, player=player)
 
+    await refresh_match_documents(session, [match.id])
     return match
 
 
@@ -70,7 +80,142 @@ async def delete_last_statistic_from_match(
         return match
 
     # Remove the last stat entry
-    match.stats.pop()
+    removed_stat = match.stats.pop()
     await session.commit()
     await session.refresh(match)
+    await refresh_match_documents(session, [match.id])
+    invalidate_tags(f"player:{removed_stat.player.nickname}")
+    return match
+
+
+def parse_scoreboard(body: bytes, content_type: str | None) -> list[dict]:
+    """
+    Read the rows of a scoreboard sent as a JSON array or as CSV with a header.
+    """
+    try:
+        text = body.decode("utf-8-sig")
+        if (content_type or "").startswith("text/csv"):
+            return list(csv.DictReader(io.StringIO(text)))
+        rows = json.loads(text)
+    except (UnicodeDecodeError, json.JSONDecodeError, csv.Error) as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid scoreboard: {error}",
+        )
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The scoreboard must be a JSON array of player rows",
+        )
+    return rows
+
+
+async def add_manual_scoreboard(
+    session: AsyncSession,
+    rows: list[dict],
+    match: TableMatch,
+) -> TableMatch:
+    """
+    Add the stats of every player on every map of a match at once. All rows are
+    validated first, and nothing is written unless every row is valid.
+    """
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The scoreboard is empty",
+        )
+
+    # Validate the rows and collect the problems of each one
+    stats_inputs: list[MatchStatsInput | None] = []
+    errors: dict[int, list[str]] = {}
+    for number, row in enumerate(rows, start=1):
+        try:
+            stats_inputs.append(MatchStatsInput.model_validate(row))
+        except ValidationError as error:
+            stats_inputs.append(None)
+            errors[number] = [
+                f"{'.'.join(map(str, item['loc']))}: {item['msg']}"
+                for item in error.errors()
+            ]
+
+    # Resolve every nickname with a single query
+    nicknames = {stats.nickname for stats in stats_inputs if stats is not None}
+    players = {
+        player.nickname: player
+        for player in await session.scalars(
+            select(TablePlayer).where(TablePlayer.nickname.in_(nicknames))
+        )
+    }
+
+    # A player has one row per map, including the rows already in the match
+    seen = {
+        (stat.match_stats["nickname"], stat.match_stats["round_of_match"])
+        for stat in match.stats
+    }
+    for number, stats in enumerate(stats_inputs, start=1):
+        if stats is None:
+            continue
+        row_errors = errors.setdefault(number, [])
+        if stats.nickname not in players:
+            row_errors.append(f"Player {stats.nickname} not found")
+        if not 1 <= stats.round_of_match <= match.best_of:
+            row_errors.append(f"round_of_match must be between 1 and {match.best_of}")
+        key = (stats.nickname, stats.round_of_match)
+        if key in seen:
+            row_errors.append(
+                f"{stats.nickname} already has stats for map {stats.round_of_match}"
+            )
+        seen.add(key)
+        if not row_errors:
+            del errors[number]
+
+    if errors:
+        # Only nicknames given as text are reported back
+        nicknames = [
+            nickname if isinstance(nickname, str) else None
+            for nickname in (row.get("nickname") for row in rows)
+        ]
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[
+                ScoreboardRowError(
+                    row=number,
+                    nickname=nicknames[number - 1],
+                    errors=row_errors,
+                ).model_dump()
+                for number, row_errors in sorted(errors.items())
+            ],
+        )
+
+    # Insert every row, sync the tournaments and commit in one transaction
+    match.status = MatchStatus.COMPLETED
+    session.add_all(
+        TableMatchStats(
+            player=players[stats.nickname],
+            match=match,
+            match_stats={
+                "nickname": stats.nickname,
+                "round_of_match": stats.round_of_match,
+                "match_id": match.id,
+                "map": stats.map,
+                "Result": stats.result,
+                "Kills": stats.kills,
+                "Assists": stats.assists,
+                "Deaths": stats.deaths,
+                "ADR": stats.adr,
+                "Headshots %": stats.headshots_percentage,
+            },
+        )
+        for stats in stats_inputs
+    )
+    await session.flush()
+    await sync_players_tournaments(session, {player.id for player in players.values()})
+    await session.commit()
+
+    await refresh_match_documents(session, [match.id])
+    invalidate_tags(
+        "tournament",
+        *(f"player:{nickname}" for nickname in players),
+    )
     return match
@@ -47,3 +47,10 @@ class MapResultInfo(BaseModel):
     second_half_score_second_team: int  # Second team's score in the second half
     overtime_score_second_team: int  # Second team's score in overtime
     total_score_second_team: int  # Second team's total score
+
+
+# Pydantic model for the errors of one row of a manual scoreboard
+class ScoreboardRowError(BaseModel):
+    row: int  # Position of the row in the scoreboard, starting at 1
+    nickname: str | None  # Nickname given in the row, if any
+    errors: list[str]  # Every problem found in the row
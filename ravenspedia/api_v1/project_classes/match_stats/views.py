@@ -1,11 +1,16 @@
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.api_v1.auth.dependencies import get_current_admin_user
 from ravenspedia.api_v1.project_classes import ResponseMatch
 from ravenspedia.core import TableMatch, db_helper, TableUser
 from . import match_stats_faceit_management, match_info
-from .match_stats_manual import add_manual_match_stats, delete_last_statistic_from_match
+from .match_stats_manual import (
+    add_manual_match_stats,
+    add_manual_scoreboard,
+    delete_last_statistic_from_match,
+    parse_scoreboard,
+)
 from .schemes import MatchStatsInput, MapPickBanInfo, MapResultInfo
 from ..match import match_management
 from ..match.dependencies import get_match_by_id
@@ -73,6 +78,41 @@ async def add_manual_stats(
     return table_to_response_form(match=match)
 
 
+# Add the stats of a whole match at once, as JSON or CSV (admin only).
+@router.patch(
+    "/{match_id}/add_scoreboard_manual/",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseMatch,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"type": "object"}}
+                },
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def add_manual_scoreboard_stats(
+    request: Request,
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin
+    match: TableMatch = Depends(get_match_by_id),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> ResponseMatch:
+    rows = parse_scoreboard(
+        body=await request.body(),
+        content_type=request.headers.get("content-type"),
+    )
+    match = await add_manual_scoreboard(
+        session=session,
+        rows=rows,
+        match=match,
+    )
+    return table_to_response_form(match=match)
+
+
 # Delete the last stat from a match (admin only).
 @router.delete(
     "/{match_id}/delete_last_stat_from_match/",
@@ -1,14 +1,35 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Iterable
+
 import requests
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import and_, delete, distinct, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .dependencies import get_player_by_nickname
-from .schemes import PlayerCreate, PlayerGeneralInfoUpdate
+from .schemes import (
+    PlayerCreate,
+    PlayerGeneralInfoUpdate,
+    PlayerMatch,
+    PlayerMatchesFilter,
+    PlayerMatchesPage,
+)
+from ..elo_history import record_elo_changes
+from ..match.documents import refresh_match_documents
+from ...cache import invalidate_tags
+from ...metrics import call_faceit
 
-from ravenspedia.core import TablePlayer
+from ravenspedia.core import (
+    TableMatch,
+    TableMatchStats,
+    TablePlayer,
+    TablePlayerEloHistory,
+    TableTournament,
+    PlayerStats,
+)
 from ravenspedia.core.config import faceit_settings
 
 headers = {
@@ -21,10 +42,10 @@ async def get_players(session: AsyncSession) -> list[TablePlayer]:
     """
     Retrieve all players from the database.
     """
+    # The stats are not loaded, the responses only carry their counts
     statement = (
         select(TablePlayer)
         .options(
-            selectinload(TablePlayer.stats),
             selectinload(TablePlayer.tournaments),
             selectinload(TablePlayer.team),
         )
@@ -42,13 +63,142 @@ async def get_player(
     """
     Retrieve a player by their nickname.
     """
-    player = await get_player_by_nickname(
-        session=session,
-        player_nickname=player_nickname,
+    player = await session.scalar(
+        select(TablePlayer)
+        .where(TablePlayer.nickname == player_nickname)
+        .options(
+            selectinload(TablePlayer.team),
+            selectinload(TablePlayer.tournaments),
+        ),
     )
+
+    if player is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Player {player_nickname} not found",
+        )
+
     return player
 
 
+async def get_match_counts(
+    session: AsyncSession,
+    player_ids: Iterable[int] | None = None,
+) -> dict[int, tuple[int, int]]:
+    """
+    Count the matches and maps each player has stats in, all players by default.
+    """
+    statement = select(
+        TableMatchStats.player_id,
+        func.count(distinct(TableMatchStats.match_id)),
+        func.count(),
+    ).group_by(TableMatchStats.player_id)
+    if player_ids is not None:
+        statement = statement.where(TableMatchStats.player_id.in_(list(player_ids)))
+
+    result = await session.execute(statement)
+    return {player_id: (matches, maps) for player_id, matches, maps in result}
+
+
+def encode_cursor(date: datetime, stat_id: int) -> str:
+    """
+    Encode the position of a history entry into an opaque cursor.
+    """
+    raw = f"{date.isoformat()}|{stat_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    """
+    try:
+        date, stat_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(date), int(stat_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+# Names of the stats fields, as they appear in the responses
+STATS_FIELDS = {field.alias or name for name, field in PlayerStats.model_fields.items()}
+
+
+async def get_player_matches(
+    session: AsyncSession,
+    player: TablePlayer,
+    matches_filter: PlayerMatchesFilter,
+) -> PlayerMatchesPage:
+    """
+    Retrieve one page of a player's match history, newest first.
+    """
+    # Check: only known stats fields can be selected
+    unknown_fields = set(matches_filter.fields or []) - STATS_FIELDS
+    if unknown_fields:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown stats fields: {', '.join(sorted(unknown_fields))}",
+        )
+
+    stmt = (
+        select(TableMatchStats, TableMatch.date, TableTournament.name)
+        .join(TableMatch, TableMatch.id == TableMatchStats.match_id)
+        .join(TableTournament, TableTournament.id == TableMatch.tournament_id)
+        .where(TableMatchStats.player_id == player.id)
+    )
+
+    # Apply filters if provided
+    if matches_filter.start_date:
+        stmt = stmt.where(TableMatch.date >= matches_filter.start_date)
+    if matches_filter.end_date:
+        stmt = stmt.where(TableMatch.date <= matches_filter.end_date)
+    if matches_filter.tournament_ids:
+        stmt = stmt.where(TableMatch.tournament_id.in_(matches_filter.tournament_ids))
+    if matches_filter.map:
+        stmt = stmt.where(
+            TableMatchStats.match_stats["map"].as_string() == matches_filter.map.value
+        )
+
+    # Continue after the last entry of the previous page
+    if matches_filter.cursor:
+        date, stat_id = decode_cursor(matches_filter.cursor)
+        stmt = stmt.where(
+            or_(
+                TableMatch.date < date,
+                and_(TableMatch.date == date, TableMatchStats.id < stat_id),
+            )
+        )
+
+    # Fetch one extra entry to know whether there is a next page
+    stmt = stmt.order_by(TableMatch.date.desc(), TableMatchStats.id.desc()).limit(
+        matches_filter.limit + 1
+    )
+    rows = list(await session.execute(stmt))
+
+    page = PlayerMatchesPage()
+    for stat, date, tournament in rows[: matches_filter.limit]:
+        stats = PlayerStats(**stat.match_stats).model_dump(by_alias=True)
+        if matches_filter.fields:
+            stats = {field: stats[field] for field in matches_filter.fields}
+        page.items.append(
+            PlayerMatch(
+                match_id=stat.match_id,
+                round_of_match=stat.match_stats["round_of_match"],
+                map=stat.match_stats["map"],
+                date=date,
+                tournament=tournament,
+                stats=stats,
+            )
+        )
+
+    if len(rows) > matches_filter.limit:
+        stat, date, _ = rows[matches_filter.limit - 1]
+        page.next_cursor = encode_cursor(date, stat.id)
+    return page
+
+
 async def find_player_faceit_profile(
     steam_id: str,
 ) -> dict:
@@ -59,7 +209,9 @@ async def find_player_faceit_profile(
         "game": "cs2",
         "game_player_id": steam_id,
     }
-    response = requests.get(
+    response = call_faceit(
+        "/players",
+        requests.get,
         f"{faceit_settings.base_url}/players",
         headers=headers,
         params=params,
@@ -99,6 +251,7 @@ async def create_player(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"A player with such data already exists",
         )
+    invalidate_tags(f"player:{player.nickname}")
 
     await session.refresh(player, attribute_names=["tournaments", "stats", "team"])
     return player
@@ -112,6 +265,8 @@ async def update_general_player_info(
     """
     Update a player's general information in the database.
     """
+    old_nickname = player.nickname
+
     for class_field, value in player_update.model_dump(exclude_unset=True).items():
         if class_field == "steam_id":
             faceit_profile = await find_player_faceit_profile(value)
@@ -120,6 +275,16 @@ async def update_general_player_info(
         setattr(player, class_field, value)
 
     await session.commit()
+    invalidate_tags(f"player:{old_nickname}", f"player:{player.nickname}")
+
+    # The nickname is part of the documents of the player's matches
+    if player.nickname != old_nickname:
+        await refresh_match_documents(
+            session,
+            {stat.match_id for stat in player.stats},
+        )
+        # ... and of the rosters of the teams and tournaments
+        invalidate_tags("team", "tournament")
     return player
 
 
@@ -130,8 +295,21 @@ async def delete_player(
     """
     Delete a player from the database.
     """
+    # The player's stats disappear from the documents of their matches
+    match_ids = {stat.match_id for stat in player.stats}
+
+    nickname = player.nickname
+
+    await session.execute(
+        delete(TablePlayerEloHistory)
+        .where(TablePlayerEloHistory.player_id == player.id)
+        .execution_options(synchronize_session=False)
+    )
     await session.delete(player)
     await session.commit()
+    invalidate_tags(f"player:{nickname}", "team", "tournament")
+
+    await refresh_match_documents(session, match_ids)
 
 
 async def update_faceit_elo(
@@ -151,11 +329,16 @@ async def update_faceit_elo(
     )
 
     players = await session.scalars(statement)
+    new_elo = {}
     for player in players:
         faceit_profile = await find_player_faceit_profile(steam_id=player.steam_id)
         setattr(player, "faceit_elo", faceit_profile["faceit_elo"])
+        new_elo[player.id] = faceit_profile["faceit_elo"]
 
+    # Keep the trend: append the ELO of the players whose ELO changed
+    await record_elo_changes(session, TablePlayerEloHistory, new_elo, datetime.now())
     await session.commit()
+    invalidate_tags("player")  # Every player may have a new ELO
 
 
 async def get_faceit_profile(
@@ -168,7 +351,9 @@ async def get_faceit_profile(
         "game": "cs2",
         "game_player_id": player.steam_id,
     }
-    response = requests.get(
+    response = call_faceit(
+        "/players",
+        requests.get,
         f"{faceit_settings.base_url}/players",
         headers=headers,
         params=params,
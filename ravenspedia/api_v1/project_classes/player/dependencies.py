@@ -1,11 +1,13 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Optional, List
 
-from fastapi import Depends, HTTPException, status, Path
+from fastapi import Depends, HTTPException, status, Path, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ravenspedia.core import db_helper, TablePlayer
+from ravenspedia.core import db_helper, MapName, TablePlayer
+from .schemes import PlayerMatchesFilter
 
 
 async def get_player_by_id(
@@ -60,3 +62,26 @@ async def get_player_by_nickname(
         )
 
     return player
+
+
+async def get_matches_filter(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    tournament_ids: Optional[List[int]] = Query(None),
+    map: Optional[MapName] = None,
+    fields: Optional[List[str]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+) -> PlayerMatchesFilter:
+    """
+    Create a PlayerMatchesFilter object from query parameters.
+    """
+    return PlayerMatchesFilter(
+        start_date=start_date,
+        end_date=end_date,
+        tournament_ids=tournament_ids,
+        map=map,
+        fields=fields,
+        limit=limit,
+        cursor=cursor,
+    )
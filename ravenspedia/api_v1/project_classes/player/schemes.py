@@ -1,8 +1,9 @@
-from typing import Union, List
+from datetime import datetime
+from typing import Union, List, Optional
 
 from pydantic import BaseModel
 
-from ravenspedia.core.faceit_models import PlayerStats
+from ravenspedia.core import MapName
 
 
 class PlayerBase(BaseModel):
@@ -17,9 +18,10 @@ class PlayerBase(BaseModel):
     faceit_id: Union[str | None] = None
     faceit_elo: Union[int | None] = None
     team: Union[str | None] = None  # The ID of the player's current team
-    matches: List[dict] = []  # The IDs of the matches the player participated in
+    matches_count: int = 0  # The number of matches the player has stats in
+    maps_count: int = 0  # The number of maps the player has stats in
+    matches_url: Union[str | None] = None  # Link to the player's match history
     tournaments: List[str] = []  # The IDs of the tournaments the team participated in
-    stats: List[PlayerStats] = []
 
 
 class PlayerCreate(BaseModel):
@@ -51,3 +53,39 @@ class ResponsePlayer(PlayerBase):
 
     class Config:
         from_attributes = True  # Enables compatibility with ORM models
+
+
+class PlayerMatchesFilter(BaseModel):
+    """
+    Pydantic model for filtering and paginating a player's match history.
+    """
+
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    tournament_ids: Optional[List[int]] = None
+    map: Optional[MapName] = None  # The map, e.g. "Mirage"
+    fields: Optional[List[str]] = None  # The stats fields to return, all if empty
+    limit: int = 20  # The maximum number of entries in a page
+    cursor: Optional[str] = None  # The position after which the page starts
+
+
+class PlayerMatch(BaseModel):
+    """
+    Pydantic model for one map of a player's match history.
+    """
+
+    match_id: int
+    round_of_match: int
+    map: str
+    date: datetime  # The date of the match
+    tournament: str  # The name of the tournament of the match
+    stats: dict  # The player's stats on the map, limited to the selected fields
+
+
+class PlayerMatchesPage(BaseModel):
+    """
+    Pydantic model for a page of a player's match history, newest first.
+    """
+
+    items: List[PlayerMatch] = []
+    next_cursor: Union[str | None] = None  # The cursor of the next page, if any
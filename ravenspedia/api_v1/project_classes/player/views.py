@@ -1,46 +1,60 @@
-from fastapi import APIRouter, status, Depends
+from datetime import datetime
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import APIRouter, status, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.api_v1.auth.dependencies import get_current_admin_user
-from ravenspedia.core import db_helper, TablePlayer, TableUser, PlayerStats
+from ravenspedia.api_v1.cache import cache_tags
+from ravenspedia.api_v1.rendering import FastJSONResponse
+from ravenspedia.core import db_helper, TablePlayer, TableUser
 from . import crud, dependencies
-from .schemes import ResponsePlayer, PlayerCreate, PlayerGeneralInfoUpdate
+from ..elo_history import ResponseEloCurve, get_player_elo_curve
+from .schemes import (
+    ResponsePlayer,
+    PlayerCreate,
+    PlayerGeneralInfoUpdate,
+    PlayerMatchesFilter,
+    PlayerMatchesPage,
+)
 
 router = APIRouter(tags=["Players"])
 
 
+def table_to_response_dict(
+    player: TablePlayer,
+    matches_count: int = 0,
+    maps_count: int = 0,
+) -> dict:
+    """
+    Convert a TablePlayer object to a plain dict shaped like ResponsePlayer.
+    The match history is not embedded, only counted and linked.
+    """
+    return {
+        "steam_id": player.steam_id,
+        "nickname": player.nickname,
+        "name": player.name,
+        "surname": player.surname,
+        "faceit_id": player.faceit_id,
+        "faceit_elo": player.faceit_elo,
+        "team": player.team.name if player.team is not None else None,
+        "matches_count": matches_count,
+        "maps_count": maps_count,
+        "matches_url": f"/players/{quote(player.nickname, safe='')}/matches/",
+        "tournaments": [tournament.name for tournament in player.tournaments],
+    }
+
+
 def table_to_response_form(
     player: TablePlayer,
+    matches_count: int = 0,
+    maps_count: int = 0,
 ) -> ResponsePlayer:
     """
     Convert a TablePlayer object to a ResponsePlayer schema for API responses.
     """
-    result = ResponsePlayer(
-        steam_id=player.steam_id,
-        faceit_id=player.faceit_id,
-        faceit_elo=player.faceit_elo,
-        nickname=player.nickname,
-        name=player.name,
-        surname=player.surname,
-        stats=[],
-    )
-
-    result.matches = [
-        {
-            "match_id": elem.match_stats["match_id"],
-            "round_of_match": elem.match_stats["round_of_match"],
-        }
-        for elem in player.stats
-    ]
-
-    result.tournaments = [tournament.name for tournament in player.tournaments]
-
-    if player.team is not None:
-        result.team = player.team.name
-
-    result.stats = [PlayerStats(**elem.match_stats) for elem in player.stats]
-
-    return result
+    return ResponsePlayer(**table_to_response_dict(player, matches_count, maps_count))
 
 
 @router.get(
@@ -62,27 +76,34 @@ async def get_faceit_profile(
     "/",
     response_model=list[ResponsePlayer],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("player"))],
 )
 async def get_players(
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> list[ResponsePlayer]:
+) -> FastJSONResponse:
     """
     Retrieve all players from the database.
     """
     players = await crud.get_players(session=session)
-    result = [table_to_response_form(player) for player in players]
-    return result
+    counts = await crud.get_match_counts(session=session)
+    return FastJSONResponse(
+        [
+            table_to_response_dict(player, *counts.get(player.id, (0, 0)))
+            for player in players
+        ]
+    )
 
 
 @router.get(
     "/{player_nickname}/",
     response_model=ResponsePlayer,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("player:{player_nickname}"))],
 )
 async def get_player(
     player_nickname: str,
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> ResponsePlayer:
+) -> FastJSONResponse:
     """
     Retrieve a player by their nickname.
     """
@@ -90,7 +111,35 @@ async def get_player(
         player_nickname=player_nickname,
         session=session,
     )
-    return table_to_response_form(player)
+    counts = await crud.get_match_counts(session=session, player_ids=[player.id])
+    return FastJSONResponse(
+        table_to_response_dict(player, *counts.get(player.id, (0, 0)))
+    )
+
+
+@router.get(
+    "/{player_nickname}/matches/",
+    response_model=PlayerMatchesPage,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("player:{player_nickname}", "match"))],
+)
+async def get_player_matches(
+    player_nickname: str,
+    matches_filter: PlayerMatchesFilter = Depends(dependencies.get_matches_filter),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> PlayerMatchesPage:
+    """
+    Retrieve a page of a player's match history, with optional filters.
+    """
+    player = await crud.get_player(
+        player_nickname=player_nickname,
+        session=session,
+    )
+    return await crud.get_player_matches(
+        session=session,
+        player=player,
+        matches_filter=matches_filter,
+    )
 
 
 @router.post(
@@ -113,6 +162,31 @@ async def create_player(
     return table_to_response_form(player)
 
 
+@router.get(
+    "/{player_nickname}/elo_history/",
+    response_model=ResponseEloCurve,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("player:{player_nickname}"))],
+)
+async def get_player_elo_history(
+    player_nickname: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    points: int = Query(200, ge=2, le=2000),  # Maximum number of points returned
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> ResponseEloCurve:
+    """
+    Retrieve the Faceit ELO curve of a player, downsampled for long ranges.
+    """
+    return await get_player_elo_curve(
+        session=session,
+        player_nickname=player_nickname,
+        start_date=start_date,
+        end_date=end_date,
+        max_points=points,
+    )
+
+
 @router.patch(
     "/update_faceit_elo/",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -146,7 +220,8 @@ async def update_general_player_info(
         player=player,
         player_update=player_update,
     )
-    return table_to_response_form(new_player)
+    counts = await crud.get_match_counts(session=session, player_ids=[new_player.id])
+    return table_to_response_form(new_player, *counts.get(new_player.id, (0, 0)))
 
 
 @router.delete(
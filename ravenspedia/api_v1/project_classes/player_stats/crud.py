@@ -1,6 +1,7 @@
-from typing import List
+from typing import Iterable, List
 
-from sqlalchemy import select
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -11,7 +12,13 @@ from .schemes import (
     DetailedPlayerStats,
     GENERAL_STATS_MAPPING,
     DETAILED_STATS_MAPPING,
+    DETAILED_AVERAGED_FIELDS,
+    MetricSeries,
+    PlayerTimeseries,
+    TimeseriesFilter,
+    TIMESERIES_METRICS,
 )
+from .timeseries import ratios, rolling_sums, window_starts
 
 
 async def get_player_stats(
@@ -51,6 +58,21 @@ async def get_player_stats(
         return process_general_stats(player, stats_list)
 
 
+def sum_match_stats(
+    stats_list: List[TableMatchStats],
+    fields: Iterable[str],
+) -> dict:
+    """
+    Sum the given fields of a list of match stats, missing values count as 0.
+    """
+    sums = dict.fromkeys(fields, 0)
+    for stat in stats_list:
+        for stats_field in sums:
+            value = stat.match_stats.get(stats_field, 0)
+            sums[stats_field] += value if value is not None else 0
+    return sums
+
+
 def process_general_stats(
     player: TablePlayer,
     stats_list: List[TableMatchStats],
@@ -58,31 +80,34 @@ def process_general_stats(
     """
     Process a player's general statistics from a list of match stats.
     """
+    sums = sum_match_stats(stats_list, GENERAL_STATS_MAPPING)
+    return general_stats_from_sums(player.nickname, len(stats_list), sums)
+
+
+def general_stats_from_sums(
+    nickname: str,
+    total_matches: int,
+    sums: dict,
+) -> GeneralPlayerStats:
+    """
+    Build a player's general statistics from the sums of the fields of their
+    match stats.
+    """
     # Initialize the result with the player's nickname and total matches
     result = GeneralPlayerStats(
-        nickname=player.nickname,
-        total_matches=len(stats_list),
+        nickname=nickname,
+        total_matches=total_matches,
     )
 
-    # Aggregate stats from each match
-    for stat in stats_list:
-        stats_data = stat.match_stats
-        for stats_field, result_field in GENERAL_STATS_MAPPING.items():
-            value = stats_data.get(stats_field, 0)
-            current_value = getattr(result, result_field)
-            if value is None:
-                value = 0
-            if current_value is None:
-                current_value = 0
-            setattr(result, result_field, current_value + value)
+    # Copy the summed stats
+    for stats_field, result_field in GENERAL_STATS_MAPPING.items():
+        setattr(result, result_field, sums.get(stats_field, 0))
 
     # Calculate averages and ratios if there are stats
-    if stats_list:
-        result.adr /= len(stats_list)
-        result.kpr /= len(stats_list)
-        result.win_rate = (
-            (result.wins / result.total_matches) * 100 if result.total_matches else 0
-        )
+    if total_matches:
+        result.adr /= total_matches
+        result.kpr /= total_matches
+        result.win_rate = (result.wins / result.total_matches) * 100
         result.kd_ratio = result.kills / result.deaths if result.deaths else 0
         result.headshots_rate = (
             (result.headshots / result.kills) * 100 if result.kills else 0
@@ -98,35 +123,36 @@ def process_detailed_stats(
     """
     Process a player's detailed statistics from a list of match stats.
     """
+    sums = sum_match_stats(
+        stats_list, [*DETAILED_STATS_MAPPING, *DETAILED_AVERAGED_FIELDS]
+    )
+    return detailed_stats_from_sums(player.nickname, len(stats_list), sums)
+
+
+def detailed_stats_from_sums(
+    nickname: str,
+    total_matches: int,
+    sums: dict,
+) -> DetailedPlayerStats:
+    """
+    Build a player's detailed statistics from the sums of the fields of their
+    match stats.
+    """
     # Initialize the result with the player's nickname and total matches
     result = DetailedPlayerStats(
-        nickname=player.nickname,
-        total_matches=len(stats_list),
+        nickname=nickname,
+        total_matches=total_matches,
     )
 
-    # Aggregate stats from each match
-    for stat in stats_list:
-        stats_data = stat.match_stats
-        for stats_field, result_field in DETAILED_STATS_MAPPING.items():
-            value = stats_data.get(stats_field, 0)
-            current_value = getattr(result, result_field)
-            if value is None:
-                value = 0
-            if current_value is None:
-                current_value = 0
-            setattr(result, result_field, current_value + value)
+    # Copy the summed stats
+    for stats_field, result_field in DETAILED_STATS_MAPPING.items():
+        setattr(result, result_field, sums.get(stats_field, 0))
 
     # Calculate averages, ratios, and percentages if there are stats
-    if stats_list:
-        result.adr = (
-            sum(stat.match_stats.get("ADR", 0) for stat in stats_list)
-            / result.total_matches
-        )
+    if total_matches:
+        result.adr = sums.get("ADR", 0) / total_matches
         result.kd = result.kills / result.deaths if result.deaths else 0
-        result.kpr = (
-            sum(stat.match_stats.get("K/R Ratio", 0) for stat in stats_list)
-            / result.total_matches
-        )
+        result.kpr = sums.get("K/R Ratio", 0) / total_matches
 
         result.headshots_percentage = (
             (result.headshots / result.kills) * 100 if result.kills else 0
@@ -139,26 +165,16 @@ def process_detailed_stats(
             (result.wins_1v2 / result.count_1v2) * 100 if result.count_1v2 else 0
         )
 
-        result.match_entry_rate = (
-            (result.entry_count / result.total_matches) if result.total_matches else 0
-        )
+        result.match_entry_rate = result.entry_count / result.total_matches
         result.match_entry_success_rate = (
             (result.entry_wins / result.entry_count) * 100 if result.entry_count else 0
         )
 
         result.utility_usage_per_round = (
-            sum(
-                stat.match_stats.get("Utility Usage per Round", 0)
-                for stat in stats_list
-            )
-            / result.total_matches
+            sums.get("Utility Usage per Round", 0) / total_matches
         )
         result.utility_damage_per_round_in_a_match = (
-            sum(
-                stat.match_stats.get("Utility Damage per Round in a Match", 0)
-                for stat in stats_list
-            )
-            / result.total_matches
+            sums.get("Utility Damage per Round in a Match", 0) / total_matches
         )
         result.utility_successes_rate_per_match = (
             (result.utility_successes / result.utility_count) * 100
@@ -171,18 +187,164 @@ def process_detailed_stats(
             else 0
         )
         result.flashes_per_round_in_a_match = (
-            sum(
-                stat.match_stats.get("Flashes per Round in a Match", 0)
-                for stat in stats_list
-            )
-            / result.total_matches
+            sums.get("Flashes per Round in a Match", 0) / total_matches
         )
         result.enemies_flashed_per_round_in_a_match = (
-            sum(
-                stat.match_stats.get("Enemies Flashed per Round in a Match", 0)
-                for stat in stats_list
-            )
-            / result.total_matches
+            sums.get("Enemies Flashed per Round in a Match", 0) / total_matches
+        )
+
+    return result
+
+
+async def get_players_stats(
+    session: AsyncSession,
+    players: list[tuple[int, str]],
+    stats_filter: PlayerStatsFilter,
+) -> list[GeneralPlayerStats | DetailedPlayerStats]:
+    """
+    Retrieve the statistics of several players, given as (id, nickname) pairs,
+    with a single query grouped by player.
+    """
+    if stats_filter.detailed:
+        mapping = DETAILED_STATS_MAPPING
+        fields = [*DETAILED_STATS_MAPPING, *DETAILED_AVERAGED_FIELDS]
+        model, from_sums = DetailedPlayerStats, detailed_stats_from_sums
+    else:
+        mapping = GENERAL_STATS_MAPPING
+        fields = list(GENERAL_STATS_MAPPING)
+        model, from_sums = GeneralPlayerStats, general_stats_from_sums
+
+    # One row per player: the number of stats and the summed fields
+    stmt = (
+        select(
+            TableMatchStats.player_id,
+            func.count(TableMatchStats.id),
+            *(
+                func.coalesce(
+                    func.sum(TableMatchStats.match_stats[field].as_float()), 0
+                )
+                for field in fields
+            ),
         )
+        .where(TableMatchStats.player_id.in_([player_id for player_id, _ in players]))
+        .group_by(TableMatchStats.player_id)
+    )
+    if stats_filter.start_date or stats_filter.end_date or stats_filter.tournament_ids:
+        stmt = stmt.join(TableMatchStats.match)
+    if stats_filter.start_date:
+        stmt = stmt.where(TableMatch.date >= stats_filter.start_date)
+    if stats_filter.end_date:
+        stmt = stmt.where(TableMatch.date <= stats_filter.end_date)
+    if stats_filter.tournament_ids:
+        stmt = stmt.where(TableMatch.tournament_id.in_(stats_filter.tournament_ids))
+    rows = {
+        player_id: (total_matches, dict(zip(fields, sums)))
+        for player_id, total_matches, *sums in await session.execute(stmt)
+    }
 
+    # The database sums as floats, counters are integers like in the match stats
+    integer_fields = [
+        stats_field
+        for stats_field, result_field in mapping.items()
+        if model.model_fields[result_field].annotation is int
+    ]
+    result = []
+    for player_id, nickname in players:
+        total_matches, sums = rows.get(player_id, (0, {}))
+        for stats_field in integer_fields:
+            if stats_field in sums:
+                sums[stats_field] = round(sums[stats_field])
+        result.append(from_sums(nickname, total_matches, sums))
     return result
+
+
+async def get_player_timeseries(
+    player_nickname: str,
+    timeseries_filter: TimeseriesFilter,
+    session: AsyncSession,
+) -> PlayerTimeseries:
+    """
+    Retrieve a player's metrics for each match and over a rolling window.
+    The database sums the stats of the maps of each match, the windows are then
+    computed over these columns at once.
+    """
+    player_id = await session.scalar(
+        select(TablePlayer.id).where(TablePlayer.nickname == player_nickname)
+    )
+    if player_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Player {player_nickname} not found",
+        )
+
+    # Stats fields needed by the requested metrics
+    fields = list(
+        dict.fromkeys(
+            field
+            for metric in timeseries_filter.metrics
+            for field in TIMESERIES_METRICS[metric][:2]
+            if field is not None
+        )
+    )
+
+    # One row per match: its date, number of maps and the summed fields
+    stmt = (
+        select(
+            TableMatch.id,
+            TableMatch.date,
+            func.count(TableMatchStats.id),
+            *(
+                func.coalesce(
+                    func.sum(TableMatchStats.match_stats[field].as_float()), 0
+                )
+                for field in fields
+            ),
+        )
+        .join(TableMatchStats.match)
+        .where(TableMatchStats.player_id == player_id)
+        .group_by(TableMatch.id)
+        .order_by(TableMatch.date, TableMatch.id)
+    )
+    if timeseries_filter.start_date:
+        stmt = stmt.where(TableMatch.date >= timeseries_filter.start_date)
+    if timeseries_filter.end_date:
+        stmt = stmt.where(TableMatch.date <= timeseries_filter.end_date)
+    if timeseries_filter.tournament_ids:
+        stmt = stmt.where(
+            TableMatch.tournament_id.in_(timeseries_filter.tournament_ids)
+        )
+    rows = (await session.execute(stmt)).all()
+
+    # Transpose the rows into columns
+    match_ids, dates, maps, *sums = zip(*rows) if rows else [()] * (3 + len(fields))
+    columns = dict(zip(fields, sums))
+
+    starts = window_starts(
+        list(dates), timeseries_filter.window, timeseries_filter.days
+    )
+    rolling_maps = rolling_sums(maps, starts)
+    series = {}
+    for metric in timeseries_filter.metrics:
+        numerator, denominator, scale = TIMESERIES_METRICS[metric]
+        per_match_total = maps if denominator is None else columns[denominator]
+        rolling_total = (
+            rolling_maps
+            if denominator is None
+            else rolling_sums(columns[denominator], starts)
+        )
+        series[metric] = MetricSeries(
+            per_match=ratios(columns[numerator], per_match_total, scale),
+            rolling=ratios(
+                rolling_sums(columns[numerator], starts), rolling_total, scale
+            ),
+        )
+
+    return PlayerTimeseries(
+        nickname=player_nickname,
+        window=timeseries_filter.window,
+        days=timeseries_filter.days,
+        match_ids=match_ids,
+        dates=dates,
+        maps=maps,
+        series=series,
+    )
@@ -1,9 +1,9 @@
 from datetime import datetime
 from typing import Optional, List
 
-from fastapi import Query
+from fastapi import HTTPException, Query, status
 
-from .schemes import PlayerStatsFilter
+from .schemes import PlayerStatsFilter, TimeseriesFilter, TIMESERIES_METRICS
 
 
 async def get_stats_filter(
@@ -21,3 +21,43 @@ async def get_stats_filter(
         tournament_ids=tournament_ids,
         detailed=detailed,
     )
+
+
+async def get_timeseries_filter(
+    metrics: Optional[List[str]] = Query(None),
+    window: Optional[int] = Query(None, ge=1),
+    days: Optional[int] = Query(None, ge=1),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    tournament_ids: Optional[List[int]] = Query(None),
+) -> TimeseriesFilter:
+    """
+    Create a TimeseriesFilter object from query parameters.
+    """
+    # Check the requested metrics, all of them by default
+    metrics = metrics or list(TIMESERIES_METRICS)
+    unknown = [metric for metric in metrics if metric not in TIMESERIES_METRICS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown metrics: {', '.join(unknown)}. "
+            f"Available: {', '.join(TIMESERIES_METRICS)}",
+        )
+
+    # The window is counted either in matches or in days
+    if window is not None and days is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pass either window or days, not both",
+        )
+    if window is None and days is None:
+        window = 5
+
+    return TimeseriesFilter(
+        metrics=list(dict.fromkeys(metrics)),
+        window=window,
+        days=days,
+        start_date=start_date,
+        end_date=end_date,
+        tournament_ids=tournament_ids,
+    )
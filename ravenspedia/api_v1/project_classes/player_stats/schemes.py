@@ -167,3 +167,63 @@ DETAILED_STATS_MAPPING = {
     "Enemies Flashed": "enemies_flashed",
     "Flash Successes": "flash_successes",
 }
+
+# Faceit API stat fields averaged over the matches in DetailedPlayerStats
+DETAILED_AVERAGED_FIELDS = (
+    "ADR",
+    "K/R Ratio",
+    "Utility Usage per Round",
+    "Utility Damage per Round in a Match",
+    "Flashes per Round in a Match",
+    "Enemies Flashed per Round in a Match",
+)
+
+
+class TimeseriesFilter(BaseModel):
+    """
+    Pydantic model for choosing the metrics and the window of a time series.
+    """
+
+    metrics: List[str]
+    window: Optional[int] = None  # Rolling window in matches
+    days: Optional[int] = None  # Rolling window in days, instead of matches
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    tournament_ids: Optional[List[int]] = None
+
+
+class MetricSeries(BaseModel):
+    """
+    Pydantic model for the values of one metric, aligned with the matches.
+    """
+
+    per_match: List[Optional[float]]
+    rolling: List[Optional[float]]
+
+
+class PlayerTimeseries(BaseModel):
+    """
+    Pydantic model for a player's performance over time, one entry per match.
+    """
+
+    nickname: str
+    window: Optional[int]
+    days: Optional[int]
+    match_ids: List[int]
+    dates: List[datetime]
+    maps: List[int]
+    series: dict[str, MetricSeries]
+
+
+# Metrics of the time series: stats field summed over the maps, field it is
+# divided by (None for the number of maps) and scale of the ratio
+TIMESERIES_METRICS = {
+    "kills": ("Kills", None, 1),
+    "deaths": ("Deaths", None, 1),
+    "assists": ("Assists", None, 1),
+    "adr": ("ADR", None, 1),
+    "kd": ("Kills", "Deaths", 1),
+    "kpr": ("K/R Ratio", None, 1),
+    "headshots_percentage": ("Headshots %", None, 1),
+    "win_rate": ("Result", None, 100),
+}
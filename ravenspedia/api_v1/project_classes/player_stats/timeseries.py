@@ -0,0 +1,64 @@
+import bisect
+import itertools
+import math
+from datetime import datetime
+
+try:  # The same windows are computed in Python only if NumPy is not installed
+    import numpy
+except ImportError:
+    numpy = None
+
+# Seconds in a day, windows in days are compared on timestamps
+DAY = 86400
+
+
+def window_starts(
+    dates: list[datetime],
+    window: int | None,
+    days: int | None,
+) -> list[int]:
+    """
+    Index of the first match in the rolling window ending at each match: the
+    last `window` matches, or the matches of the last `days` days.
+    """
+    count = len(dates)
+    if days is None:
+        if numpy is not None:
+            return numpy.maximum(numpy.arange(count) - window + 1, 0)
+        return [max(index - window + 1, 0) for index in range(count)]
+
+    timestamps = [date.timestamp() for date in dates]
+    if numpy is not None:
+        timestamps = numpy.asarray(timestamps)
+        return numpy.searchsorted(timestamps, timestamps - days * DAY, side="right")
+    return [
+        bisect.bisect_right(timestamps, timestamp - days * DAY)
+        for timestamp in timestamps
+    ]
+
+
+def rolling_sums(column: list[float], starts) -> list[float]:
+    """
+    Sum of a column over each window, from its prefix sums.
+    """
+    if numpy is not None:
+        prefix = numpy.concatenate(([0.0], numpy.cumsum(column, dtype=float)))
+        return prefix[1:] - prefix[starts]
+    prefix = [0.0, *itertools.accumulate(column)]
+    return [prefix[index + 1] - prefix[start] for index, start in enumerate(starts)]
+
+
+def ratios(numerator, denominator, scale: float) -> list[float | None]:
+    """
+    Divide two columns element-wise, None where the denominator is zero.
+    """
+    if numpy is not None:
+        numerator = numpy.asarray(numerator, dtype=float)
+        denominator = numpy.asarray(denominator, dtype=float)
+        values = numpy.full(len(numerator), math.nan)
+        numpy.divide(numerator * scale, denominator, out=values, where=denominator > 0)
+        return [None if math.isnan(value) else value for value in values.tolist()]
+    return [
+        value * scale / total if total > 0 else None
+        for value, total in zip(numerator, denominator)
+    ]
@@ -5,9 +5,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.core import db_helper, TablePlayer
 from . import crud
-from .dependencies import get_stats_filter
-from .schemes import PlayerStatsFilter, GeneralPlayerStats, DetailedPlayerStats
+from .dependencies import get_stats_filter, get_timeseries_filter
+from .schemes import (
+    PlayerStatsFilter,
+    GeneralPlayerStats,
+    DetailedPlayerStats,
+    PlayerTimeseries,
+    TimeseriesFilter,
+)
 from ..player.dependencies import get_player_by_nickname
+from ...cache import cache_tags
 
 router = APIRouter(tags=["Players Stats"])
 
@@ -16,6 +23,7 @@ router = APIRouter(tags=["Players Stats"])
     "/{player_nickname}/",
     response_model=Union[GeneralPlayerStats, DetailedPlayerStats],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("player:{player_nickname}", "match"))],
 )
 async def get_player_stats(
     player: TablePlayer = Depends(get_player_by_nickname),
@@ -27,3 +35,21 @@ async def get_player_stats(
     """
     stats = await crud.get_player_stats(player, stats_filter, session)
     return stats
+
+
+@router.get(
+    "/{player_nickname}/timeseries/",
+    response_model=PlayerTimeseries,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("player:{player_nickname}", "match"))],
+)
+async def get_player_timeseries(
+    player_nickname: str,
+    timeseries_filter: TimeseriesFilter = Depends(get_timeseries_filter),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> PlayerTimeseries:
+    """
+    Retrieve a player's metrics per match and over a rolling window of matches
+    or days, oldest match first.
+    """
+    return await crud.get_player_timeseries(player_nickname, timeseries_filter, session)
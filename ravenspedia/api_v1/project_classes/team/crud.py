@@ -1,5 +1,7 @@
+from datetime import datetime
+
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -7,13 +9,23 @@ from sqlalchemy.orm import selectinload
 from ravenspedia.core import (
     TableTeam,
     TableTournamentResult,
+    TableMapResultInfo,
+    TableMapPickBanInfo,
     MapName,
     TableTeamMapStats,
+    TableTeamVetoStats,
+    TableTeamEloHistory,
+    TablePlayer,
+    TeamMatchAssociation,
+    TeamTournamentAssociation,
+    PlayerTournamentAssociation,
 )
 from .dependencies import get_team_by_name
 from .schemes import TeamCreate, TeamGeneralInfoUpdate
 from .team_management import calculate_team_faceit_elo
-from ..team_stats.crud import delete_team_map_stats
+from ..elo_history import record_elo_changes
+from ..match.documents import refresh_match_documents
+from ...cache import invalidate_tags
 
 
 async def get_teams(session: AsyncSession) -> list[TableTeam]:
@@ -76,6 +88,7 @@ async def create_team(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Team {team_in.name} already exists",
         )
+    invalidate_tags(f"team:{team.name}")
 
     # Refresh the team object with related data
     await session.refresh(
@@ -88,23 +101,86 @@ async def create_team(
 async def delete_team(
     session: AsyncSession,
     team: TableTeam,
-) -> None:
+) -> dict:
     """
-    Delete a team from the database.
+    Delete a team from the database with a few bulk statements in one transaction.
     """
-    from .team_management import delete_player_from_team
-
-    # Remove all players from the team
-    for player in list(team.players):
-        await delete_player_from_team(session=session, team=team, player=player)
+    team_id = team.id
+    team_name = team.name
+
+    # Remember the matches of the team to regenerate their documents afterwards
+    match_ids = [match.id for match in team.matches]
+
+    # The players of the team leave the tournaments of the team
+    result = await session.execute(
+        delete(PlayerTournamentAssociation)
+        .where(
+            PlayerTournamentAssociation.player_id.in_(
+                select(TablePlayer.id).where(TablePlayer.team_id == team_id)
+            ),
+            PlayerTournamentAssociation.tournament_id.in_(
+                select(TeamTournamentAssociation.tournament_id).where(
+                    TeamTournamentAssociation.team_id == team_id
+                )
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    summary = {"player_tournaments": result.rowcount}
+
+    # Remove all players from the team and unlink its tournament results
+    for key, model in (
+        ("players", TablePlayer),
+        ("tournament_results", TableTournamentResult),
+    ):
+        result = await session.execute(
+            update(model)
+            .where(model.team_id == team_id)
+            .values(team_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        summary[key] = result.rowcount
+
+    # Unlink the team from the map results and vetoes, its name stays for display
+    for model, column in (
+        (TableMapResultInfo, "first_team_id"),
+        (TableMapResultInfo, "second_team_id"),
+        (TableMapPickBanInfo, "initiator_team_id"),
+    ):
+        await session.execute(
+            update(model)
+            .where(getattr(model, column) == team_id)
+            .values({column: None})
+            .execution_options(synchronize_session=False)
+        )
 
-    # Delete all map stats associated with the team
-    for map_stats in list(team.map_stats):
-        await delete_team_map_stats(session=session, team=team, map_stats=map_stats)
+    # Delete the map stats and the match and tournament links of the team
+    for key, model in (
+        ("map_stats", TableTeamMapStats),
+        ("veto_stats", TableTeamVetoStats),
+        ("elo_history", TableTeamEloHistory),
+        ("matches", TeamMatchAssociation),
+        ("tournaments", TeamTournamentAssociation),
+    ):
+        result = await session.execute(
+            delete(model)
+            .where(model.team_id == team_id)
+            .execution_options(synchronize_session=False)
+        )
+        summary[key] = result.rowcount
 
     # Delete the team from the database
-    await session.delete(team)
+    result = await session.execute(
+        delete(TableTeam)
+        .where(TableTeam.id == team_id)
+        .execution_options(synchronize_session=False)
+    )
+    summary["teams"] = result.rowcount
     await session.commit()
+    invalidate_tags(f"team:{team_name}", "player", "tournament")
+
+    await refresh_match_documents(session, match_ids)
+    return summary
 
 
 async def update_general_team_info(
@@ -115,10 +191,32 @@ async def update_general_team_info(
     """
     Update a team's general information (name, description).
     """
+    old_name = team.name
+
     # Update the team's fields with the provided data
     for class_field, value in team_update.model_dump(exclude_unset=True).items():
         setattr(team, class_field, value)
+
+    # Keep the names shown with the map results and vetoes of the team in sync
+    if team.name != old_name:
+        for model, column, name_column in (
+            (TableMapResultInfo, "first_team_id", "first_team"),
+            (TableMapResultInfo, "second_team_id", "second_team"),
+            (TableMapPickBanInfo, "initiator_team_id", "initiator"),
+        ):
+            await session.execute(
+                update(model)
+                .where(getattr(model, column) == team.id)
+                .values({name_column: team.name})
+            )
     await session.commit()
+    invalidate_tags(f"team:{old_name}", f"team:{team.name}")
+
+    # The team name is part of the documents of its matches
+    if team.name != old_name:
+        await refresh_match_documents(session, [match.id for match in team.matches])
+        # ... and of the responses of its players and tournaments
+        invalidate_tags("player", "tournament")
     return team
 
 
@@ -144,6 +242,12 @@ async def update_team_faceit_elo(
     teams = await session.scalars(stmt)
 
     # Recalculate the Faceit Elo for each team
+    new_elo = {}
     for team in teams:
         await calculate_team_faceit_elo(team, session)
+        new_elo[team.id] = team.average_faceit_elo
+
+    # Keep the trend: append the average ELO of the teams whose ELO changed
+    await record_elo_changes(session, TableTeamEloHistory, new_elo, datetime.now())
     await session.commit()
+    invalidate_tags("team")  # Every team may have a new average ELO
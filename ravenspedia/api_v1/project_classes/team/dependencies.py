@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status, Path
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from ravenspedia.core import db_helper, TableTeam, TableMatch, TableTournamentResult
 
@@ -80,3 +80,25 @@ async def get_team_by_name(
         )
 
     return table_team
+
+
+async def get_plain_team_by_name(
+    team_name: str,
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> TableTeam:
+    """
+    Retrieve a team by its name without loading its roster or other relationships.
+    """
+    # Only the columns are loaded, touching a relationship raises instead
+    table_team = await session.scalar(
+        select(TableTeam).where(TableTeam.name == team_name).options(raiseload("*"))
+    )
+
+    # Check if the team exists; if not, raise a 404 error
+    if table_team is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team {team_name} not found",
+        )
+
+    return table_team
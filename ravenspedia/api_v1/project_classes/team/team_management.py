@@ -3,6 +3,7 @@ from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.core import TableTeam, TablePlayer, PlayerTournamentAssociation
+from ...cache import invalidate_tags
 
 
 async def calculate_team_faceit_elo(
@@ -63,6 +64,7 @@ async def add_player_in_team(
     # Add the player to the team
     team.players.append(player)
     await session.commit()
+    invalidate_tags(f"team:{team.name}", f"player:{player.nickname}")
 
     # Recalculate the team's average Faceit Elo
     await calculate_team_faceit_elo(team, session)
@@ -100,6 +102,11 @@ async def delete_player_from_team(
         )
     )
     await session.commit()
+    invalidate_tags(
+        f"team:{team.name}",
+        f"player:{player.nickname}",
+        *(f"tournament:{tournament.name}" for tournament in team.tournaments),
+    )
 
     # Recalculate the team's average Faceit Elo
     await calculate_team_faceit_elo(team, session)
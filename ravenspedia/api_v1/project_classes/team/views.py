@@ -1,10 +1,18 @@
-from fastapi import APIRouter, status, Depends
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, status, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import crud, dependencies, team_management
 from .schemes import ResponseTeam, TeamCreate, TeamGeneralInfoUpdate
+from ..elo_history import ResponseEloCurve, get_team_elo_curve
 from ..player.dependencies import get_player_by_nickname
+from ..team_stats.crud import get_head_to_head
+from ..team_stats.schemes import ResponseHeadToHead
 from ...auth.dependencies import get_current_admin_user
+from ...cache import cache_tags
+from ...rendering import FastJSONResponse
 
 from ravenspedia.core import db_helper, TableTeam, TablePlayer, TableUser
 
@@ -12,58 +20,116 @@ router = APIRouter(tags=["Teams"])
 manager_team_router = APIRouter(tags=["Teams Manager"])
 
 
+def table_to_response_dict(
+    team: TableTeam,
+) -> dict:
+    """
+    Convert a TableTeam object to a plain dict shaped like ResponseTeam.
+    """
+    return {
+        "max_number_of_players": team.max_number_of_players,
+        "name": team.name,
+        "description": team.description,
+        "average_faceit_elo": team.average_faceit_elo,
+        "players": [player.nickname for player in team.players],
+        "matches_id": [match.id for match in team.matches],
+        "tournaments": [tournament.name for tournament in team.tournaments],
+        "tournament_results": [
+            {"place": result.place, "tournament_name": result.tournament.name}
+            for result in team.tournament_results
+        ],
+    }
+
+
 def table_to_response_form(
     team: TableTeam,
 ) -> ResponseTeam:
     """
     Convert a TableTeam object to a ResponseTeam model for API responses.
     """
-    result = ResponseTeam(
-        name=team.name,
-        description=team.description,
-        max_number_of_players=team.max_number_of_players,
-        average_faceit_elo=team.average_faceit_elo,
-    )
-    result.players = [player.nickname for player in team.players]
-    result.matches_id = [match.id for match in team.matches]
-    result.tournaments = [tournament.name for tournament in team.tournaments]
-    result.tournament_results = [
-        {"place": result.place, "tournament_name": result.tournament.name}
-        for result in team.tournament_results
-    ]
-    return result
+    return ResponseTeam(**table_to_response_dict(team))
 
 
 @router.get(
     "/",
     response_model=list[ResponseTeam],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("team"))],
 )
 async def get_teams(
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> list[ResponseTeam]:
+) -> FastJSONResponse:
     """
     Retrieve all teams from the database.
     """
     teams = await crud.get_teams(session=session)
-    result = [table_to_response_form(team=team) for team in teams]
-    return result
+    return FastJSONResponse([table_to_response_dict(team) for team in teams])
 
 
 @router.get(
     "/{team_name}/",
     response_model=ResponseTeam,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("team:{team_name}"))],
 )
 async def get_team(
     team_name: str,
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> ResponseTeam:
+) -> FastJSONResponse:
     """
     Retrieve a team by its name.
     """
     team = await crud.get_team(session=session, team_name=team_name)
-    return table_to_response_form(team=team)
+    return FastJSONResponse(table_to_response_dict(team))
+
+
+@router.get(
+    "/{team_name}/vs/{opponent_name}/",
+    response_model=ResponseHeadToHead,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("team:{team_name}", "team:{opponent_name}"))],
+)
+async def get_team_head_to_head(
+    team_name: str,
+    opponent_name: str,
+    recent: int = Query(5, ge=0, le=50),  # Number of latest meetings returned
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> ResponseHeadToHead:
+    """
+    Compare two teams: series and map records, round differential and latest
+    meetings, seen from the first team.
+    """
+    return await get_head_to_head(
+        session=session,
+        team_name=team_name,
+        opponent_name=opponent_name,
+        recent=recent,
+    )
+
+
+@router.get(
+    "/{team_name}/elo_history/",
+    response_model=ResponseEloCurve,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("team:{team_name}"))],
+)
+async def get_team_elo_history(
+    team_name: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    points: int = Query(200, ge=2, le=2000),  # Maximum number of points returned
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> ResponseEloCurve:
+    """
+    Retrieve the average Faceit ELO curve of a team, downsampled for long ranges.
+    """
+    return await get_team_elo_curve(
+        session=session,
+        team_name=team_name,
+        start_date=start_date,
+        end_date=end_date,
+        max_points=points,
+    )
 
 
 @router.post(
@@ -1,10 +1,53 @@
-from typing import List
+from collections import defaultdict
+from typing import Iterable, List
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import (
+    Float,
+    and_,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    true,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ravenspedia.core import TableTeam, TableTeamMapStats, MapName
+from ravenspedia.core import (
+    TableMatch,
+    TablePlayer,
+    TableTeam,
+    TableTeamMapStats,
+    TableTeamVetoStats,
+    TableTournament,
+    TableMapResultInfo,
+    TableMapPickBanInfo,
+    TeamMatchAssociation,
+    MapName,
+    MapStatus,
+)
+from .schemes import (
+    HeadToHeadMap,
+    HeadToHeadMeeting,
+    ResponseHeadToHead,
+    ResponseTeamVetoStats,
+    VetoStatsFilter,
+)
+from ..player_stats.crud import get_players_stats
+from ..player_stats.schemes import (
+    DetailedPlayerStats,
+    GeneralPlayerStats,
+    PlayerStatsFilter,
+)
+from ...cache import invalidate_tags
+
+# Counters of the veto rollup, in the order of the grouped query below
+VETO_COUNTERS = ("bans", "first_bans", "picks", "picks_played", "picks_won")
 
 
 async def get_team_map_stats(
@@ -12,57 +55,683 @@ async def get_team_map_stats(
     team: TableTeam,
 ) -> List[TableTeamMapStats]:
     """
-    Retrieve and calculate map statistics for a team based on its matches.
+    Retrieve the map statistics of a team.
+    """
+    # The stats are maintained on every map result change, so this is a plain read
+    stmt = (
+        select(TableTeamMapStats)
+        .where(TableTeamMapStats.team_id == team.id)
+        .order_by(TableTeamMapStats.id)
+    )
+    map_stats = await session.scalars(stmt)
+    return list(map_stats)
+
+
+async def get_team_players_stats(
+    session: AsyncSession,
+    team_name: str,
+    stats_filter: PlayerStatsFilter,
+) -> list[GeneralPlayerStats | DetailedPlayerStats]:
+    """
+    Retrieve the statistics of every current member of a team, aggregated for
+    all of them at once.
+    """
+    # Only the id of the team is needed, its relationships are not loaded
+    team_id = await session.scalar(
+        select(TableTeam.id).where(TableTeam.name == team_name)
+    )
+    if team_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team {team_name} not found",
+        )
+
+    # Members without stats in the window are reported with zeros
+    players = (
+        await session.execute(
+            select(TablePlayer.id, TablePlayer.nickname)
+            .where(TablePlayer.team_id == team_id)
+            .order_by(TablePlayer.nickname)
+        )
+    ).all()
+    if not players:
+        return []
+    return await get_players_stats(session, players, stats_filter)
+
+
+async def count_team_veto_stats(
+    session: AsyncSession,
+    team_ids: Iterable[int],
+    stats_filter: VetoStatsFilter | None = None,
+) -> list[dict]:
+    """
+    Count the bans, first bans, picks and won picks of the given teams per map,
+    optionally only in the matches of a window, with one grouped query.
     """
-    # Get all matches and their results for the team
-    matches = team.matches
-    map_results = [info for match in matches for info in match.result]
+    veto = TableMapPickBanInfo
+    result = TableMapResultInfo
+    team_filter = veto.initiator_team_id.in_(list(team_ids))
 
-    # Initialize a dictionary to store stats for each map
-    stats_dict = {
-        map_name: {
-            "matches_played": 0,
-            "matches_won": 0,
-            "win_rate": 0.0,
+    # First ban of each team in each match
+    first_ban_ids = (
+        select(func.min(veto.id))
+        .where(team_filter, veto.map_status == MapStatus.Banned)
+        .group_by(veto.match_id, veto.initiator_team_id)
+    )
+
+    # A picked map is won by its initiator when it scored more rounds
+    won = or_(
+        and_(
+            result.first_team_id == veto.initiator_team_id,
+            result.total_score_first_team > result.total_score_second_team,
+        ),
+        and_(
+            result.second_team_id == veto.initiator_team_id,
+            result.total_score_second_team > result.total_score_first_team,
+        ),
+    )
+    stmt = (
+        select(
+            veto.initiator_team_id,
+            veto.map,
+            func.sum(case((veto.map_status == MapStatus.Banned, 1), else_=0)),
+            func.sum(case((veto.id.in_(first_ban_ids), 1), else_=0)),
+            func.sum(case((veto.map_status == MapStatus.Picked, 1), else_=0)),
+            func.count(result.id),  # Only the picked maps are joined to a result
+            func.sum(case((won, 1), else_=0)),
+        )
+        .outerjoin(
+            result,
+            and_(
+                veto.map_status == MapStatus.Picked,
+                result.match_id == veto.match_id,
+                result.map == veto.map,
+            ),
+        )
+        .where(team_filter)
+        .group_by(veto.initiator_team_id, veto.map)
+    )
+
+    # Restrict the vetoes to the matches of the window
+    if stats_filter is not None and stats_filter.is_window:
+        stmt = stmt.join(TableMatch, TableMatch.id == veto.match_id)
+        if stats_filter.start_date is not None:
+            stmt = stmt.where(TableMatch.date >= stats_filter.start_date)
+        if stats_filter.end_date is not None:
+            stmt = stmt.where(TableMatch.date <= stats_filter.end_date)
+        if stats_filter.tournament_ids is not None:
+            stmt = stmt.where(TableMatch.tournament_id.in_(stats_filter.tournament_ids))
+
+    return [
+        {
+            "team_id": team_id,
+            "map": map_name,
+            "bans": bans,
+            "first_bans": first_bans,
+            "picks": picks,
+            "picks_played": picks_played,
+            "picks_won": picks_won,
         }
-        for map_name in MapName
-    }
-
-    # Calculate matches played and won for each map based on match results
-    for result in map_results:
-        map_name = result.map
-        stats_dict[map_name]["matches_played"] += 1
-        # Check if the team won the match on this map
-        if (
-            result.first_team == team.name
-            and result.total_score_first_team > result.total_score_second_team
-        ) or (
-            result.second_team == team.name
-            and result.total_score_second_team > result.total_score_first_team
-        ):
-            stats_dict[map_name]["matches_won"] += 1
-
-    # Calculate the win rate for each map
-    for map_name, stat in stats_dict.items():
-        if stat["matches_played"] > 0:
-            stat["win_rate"] = (stat["matches_won"] / stat["matches_played"]) * 100
-
-    # Update the existing map stats in the database
-    for map_name, stat in stats_dict.items():
-        existing_stat = await session.scalar(
-            select(TableTeamMapStats).where(
-                TableTeamMapStats.team_id == team.id,
+        for (
+            team_id,
+            map_name,
+            bans,
+            first_bans,
+            picks,
+            picks_played,
+            picks_won,
+        ) in await session.execute(stmt)
+    ]
+
+
+async def recalculate_team_veto_stats(
+    session: AsyncSession,
+    team_ids: Iterable[int | None],
+) -> None:
+    """
+    Replace the veto rollup of the given teams with a fixed number of statements.
+    The caller commits.
+    """
+    team_ids = {team_id for team_id in team_ids if team_id is not None}
+    if not team_ids:
+        return
+
+    # Count the vetoes and results added or removed in the transaction
+    await session.flush()
+    await session.execute(
+        delete(TableTeamVetoStats)
+        .where(TableTeamVetoStats.team_id.in_(team_ids))
+        .execution_options(synchronize_session=False)
+    )
+    rows = await count_team_veto_stats(session, team_ids)
+    if rows:
+        await session.execute(insert(TableTeamVetoStats), rows)
+
+
+def won_by(result: TableMapResultInfo, team_id: int) -> bool:
+    """
+    Whether a team scored more rounds than its opponent in a map result.
+    """
+    return (
+        team_id == result.first_team_id
+        and result.total_score_first_team > result.total_score_second_team
+    ) or (
+        team_id == result.second_team_id
+        and result.total_score_second_team > result.total_score_first_team
+    )
+
+
+def count_played_picks(
+    deltas: dict,
+    picked: list[tuple[int, MapName]],
+    results: Iterable[TableMapResultInfo],
+    sign: int,
+) -> None:
+    """
+    Add the map results played on the picked maps to the played and won picks
+    of the teams that picked them.
+    """
+    for result in results:
+        for team_id, map_name in picked:
+            if result.map == map_name:
+                deltas[(team_id, map_name)]["picks_played"] += sign
+                deltas[(team_id, map_name)]["picks_won"] += sign * int(
+                    won_by(result, team_id)
+                )
+
+
+async def update_team_veto_stats(
+    session: AsyncSession,
+    match: TableMatch,
+    vetoes: Iterable[TableMapPickBanInfo] = (),
+    results: Iterable[TableMapResultInfo] = (),
+    sign: int = 1,
+) -> None:
+    """
+    Add (sign=1) or subtract (sign=-1) vetoes or map results of a match from the
+    veto rollup of the teams. The other vetoes and results of the match must be
+    loaded, they decide the first bans and the played picks. The caller commits.
+    """
+    # Accumulate the changes of the counters per team and map
+    deltas = defaultdict(lambda: dict.fromkeys(VETO_COUNTERS, 0))
+    for veto in vetoes:
+        team_id = veto.initiator_team_id
+        if team_id is None:  # The vetoes of deleted teams are no longer counted
+            continue
+        if veto.map_status == MapStatus.Banned:
+            # A ban is the first of its team in the match if the team has no other
+            first = not any(
+                other is not veto
+                and other.initiator_team_id == team_id
+                and other.map_status == MapStatus.Banned
+                for other in match.veto
+            )
+            deltas[(team_id, veto.map)]["bans"] += sign
+            deltas[(team_id, veto.map)]["first_bans"] += sign * int(first)
+        elif veto.map_status == MapStatus.Picked:
+            deltas[(team_id, veto.map)]["picks"] += sign
+            count_played_picks(deltas, [(team_id, veto.map)], match.result, sign)
+
+    # A map result is a played pick of the team that picked its map
+    picked = [
+        (veto.initiator_team_id, veto.map)
+        for veto in match.veto
+        if veto.initiator_team_id is not None and veto.map_status == MapStatus.Picked
+    ]
+    count_played_picks(deltas, picked, results, sign)
+    if not deltas:
+        return
+
+    # Create the missing rollup entries of the teams, with zero counters
+    team_ids = {team_id for team_id, _ in deltas}
+    existing = set(
+        (
+            await session.execute(
+                select(TableTeamVetoStats.team_id, TableTeamVetoStats.map).where(
+                    TableTeamVetoStats.team_id.in_(team_ids)
+                )
+            )
+        ).tuples()
+    )
+    session.add_all(
+        TableTeamVetoStats(
+            team_id=team_id,
+            map=map_name,
+            **dict.fromkeys(VETO_COUNTERS, 0),
+        )
+        for team_id, map_name in deltas
+        if (team_id, map_name) not in existing
+    )
+    await session.flush()
+
+    # Apply the changes with a single UPDATE per team and map
+    for (team_id, map_name), delta in deltas.items():
+        await session.execute(
+            update(TableTeamVetoStats)
+            .where(
+                TableTeamVetoStats.team_id == team_id,
+                TableTeamVetoStats.map == map_name,
+            )
+            .values(
+                {
+                    name: getattr(TableTeamVetoStats, name) + value
+                    for name, value in delta.items()
+                }
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def percent(part: int, total: int) -> float:
+    """
+    Share of a total in percent, 0 for an empty total.
+    """
+    return round(part / total * 100, 2) if total else 0.0
+
+
+async def get_team_veto_stats(
+    session: AsyncSession,
+    team_name: str,
+    stats_filter: VetoStatsFilter,
+) -> list[ResponseTeamVetoStats]:
+    """
+    Retrieve the veto tendencies of a team on every map, from the rollup or, for
+    a window, from the vetoes of its matches.
+    """
+    # Only the id of the team is needed, its relationships are not loaded
+    team_id = await session.scalar(
+        select(TableTeam.id).where(TableTeam.name == team_name)
+    )
+    if team_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team {team_name} not found",
+        )
+
+    if stats_filter.is_window:
+        rows = await count_team_veto_stats(session, [team_id], stats_filter)
+    else:
+        rollup = await session.scalars(
+            select(TableTeamVetoStats).where(TableTeamVetoStats.team_id == team_id)
+        )
+        rows = [
+            {
+                "map": stats.map,
+                "bans": stats.bans,
+                "first_bans": stats.first_bans,
+                "picks": stats.picks,
+                "picks_played": stats.picks_played,
+                "picks_won": stats.picks_won,
+            }
+            for stats in rollup
+        ]
+
+    # Maps the team never picked or banned are reported with zeros
+    by_map = {row["map"]: row for row in rows}
+    empty = dict.fromkeys(VETO_COUNTERS, 0)
+    total_first_bans = sum(row["first_bans"] for row in rows)
+    total_picks = sum(row["picks"] for row in rows)
+    response = []
+    for map_name in MapName:
+        row = by_map.get(map_name, empty)
+        response.append(
+            ResponseTeamVetoStats(
+                map=map_name,
+                bans=row["bans"],
+                first_bans=row["first_bans"],
+                first_ban_rate=percent(row["first_bans"], total_first_bans),
+                picks=row["picks"],
+                pick_rate=percent(row["picks"], total_picks),
+                picks_played=row["picks_played"],
+                picks_won=row["picks_won"],
+                pick_win_rate=percent(row["picks_won"], row["picks_played"]),
+            )
+        )
+    return response
+
+
+async def get_head_to_head(
+    session: AsyncSession,
+    team_name: str,
+    opponent_name: str,
+    recent: int,
+) -> ResponseHeadToHead:
+    """
+    Compare two teams over the map results of the matches they played against
+    each other, with grouped queries using the team indexes of the results.
+    """
+    if team_name == opponent_name:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A team cannot be compared with itself",
+        )
+
+    # Resolve both names in one query
+    team_ids = dict(
+        (
+            await session.execute(
+                select(TableTeam.name, TableTeam.id).where(
+                    TableTeam.name.in_((team_name, opponent_name))
+                )
+            )
+        ).all()
+    )
+    for name in (team_name, opponent_name):
+        if name not in team_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Team {name} not found",
+            )
+    team_id, opponent_id = team_ids[team_name], team_ids[opponent_name]
+
+    # Rounds of each side of a result, seen from the team
+    result = TableMapResultInfo
+    is_first = result.first_team_id == team_id
+    team_rounds = case(
+        (is_first, result.total_score_first_team),
+        else_=result.total_score_second_team,
+    )
+    opponent_rounds = case(
+        (is_first, result.total_score_second_team),
+        else_=result.total_score_first_team,
+    )
+    round_difference = team_rounds - opponent_rounds
+    won = case((team_rounds > opponent_rounds, 1), else_=0)
+    lost = case((team_rounds < opponent_rounds, 1), else_=0)
+
+    # Results between the two teams, in matches both of them still play
+    meetings = (
+        select(TeamMatchAssociation.match_id)
+        .where(TeamMatchAssociation.team_id.in_((team_id, opponent_id)))
+        .group_by(TeamMatchAssociation.match_id)
+        .having(func.count() == 2)
+    )
+    pair_filter = (
+        or_(
+            and_(
+                result.first_team_id == team_id,
+                result.second_team_id == opponent_id,
+            ),
+            and_(
+                result.first_team_id == opponent_id,
+                result.second_team_id == team_id,
+            ),
+        ),
+        result.match_id.in_(meetings),
+    )
+
+    # Record on each map
+    maps = [
+        HeadToHeadMap(
+            map=map_name,
+            played=played,
+            won=won_count,
+            lost=lost_count,
+            average_round_difference=round(average, 2),
+        )
+        for map_name, played, won_count, lost_count, average in await session.execute(
+            select(
+                result.map,
+                func.count(),
+                func.sum(won),
+                func.sum(lost),
+                func.avg(round_difference),
+            )
+            .where(*pair_filter)
+            .group_by(result.map)
+            .order_by(func.count().desc(), result.map)
+        )
+    ]
+
+    # Maps and rounds of each match, a series is decided by a majority of its maps
+    per_match = (
+        select(
+            result.match_id,
+            func.sum(won).label("maps_won"),
+            func.sum(lost).label("maps_lost"),
+            func.sum(round_difference).label("round_difference"),
+        )
+        .where(*pair_filter)
+        .group_by(result.match_id)
+        .subquery()
+    )
+    series_played, series_won, series_lost, total_difference = (
+        await session.execute(
+            select(
+                func.count(),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (per_match.c.maps_won * 2 > TableMatch.best_of, 1), else_=0
+                        )
+                    ),
+                    0,
+                ),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (per_match.c.maps_lost * 2 > TableMatch.best_of, 1),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ),
+                func.coalesce(func.sum(per_match.c.round_difference), 0),
+            ).join(TableMatch, TableMatch.id == per_match.c.match_id)
+        )
+    ).one()
+
+    # Latest meetings, newest first
+    recent_meetings = [
+        HeadToHeadMeeting(
+            match_id=match_id,
+            date=date,
+            tournament=tournament,
+            best_of=best_of,
+            maps_won=maps_won,
+            maps_lost=maps_lost,
+            round_difference=difference,
+        )
+        for match_id, date, tournament, best_of, maps_won, maps_lost, difference in (
+            await session.execute(
+                select(
+                    per_match.c.match_id,
+                    TableMatch.date,
+                    TableTournament.name,
+                    TableMatch.best_of,
+                    per_match.c.maps_won,
+                    per_match.c.maps_lost,
+                    per_match.c.round_difference,
+                )
+                .join(TableMatch, TableMatch.id == per_match.c.match_id)
+                .join(TableTournament, TableTournament.id == TableMatch.tournament_id)
+                .order_by(TableMatch.date.desc(), TableMatch.id.desc())
+                .limit(recent)
+            )
+        )
+    ]
+
+    maps_played = sum(map_record.played for map_record in maps)
+    return ResponseHeadToHead(
+        team=team_name,
+        opponent=opponent_name,
+        series_played=series_played,
+        series_won=series_won,
+        series_lost=series_lost,
+        maps_played=maps_played,
+        maps_won=sum(map_record.won for map_record in maps),
+        maps_lost=sum(map_record.lost for map_record in maps),
+        average_round_difference=(
+            round(total_difference / maps_played, 2) if maps_played else 0.0
+        ),
+        maps=maps,
+        recent_meetings=recent_meetings,
+    )
+
+
+async def update_team_map_stats(
+    session: AsyncSession,
+    results: Iterable[TableMapResultInfo],
+    sign: int = 1,
+    team_ids: set[int] | None = None,
+) -> None:
+    """
+    Add (sign=1) or subtract (sign=-1) map results from the map stats of the teams
+    that played them, optionally only for the given teams. The caller commits.
+    """
+    # Accumulate the changes of matches played and won per team and map
+    deltas = defaultdict(lambda: [0, 0])
+    for result in results:
+        # A team on both sides of a result still plays it only once, and the
+        # results of deleted teams are no longer linked to any team
+        for team_id in {result.first_team_id, result.second_team_id} - {None}:
+            if team_ids is not None and team_id not in team_ids:
+                continue
+            won = (
+                team_id == result.first_team_id
+                and result.total_score_first_team > result.total_score_second_team
+            ) or (
+                team_id == result.second_team_id
+                and result.total_score_second_team > result.total_score_first_team
+            )
+            deltas[(team_id, result.map)][0] += sign
+            deltas[(team_id, result.map)][1] += sign * int(won)
+
+    # Apply the changes with a single UPDATE per team and map
+    for (team_id, map_name), (played, won) in deltas.items():
+        matches_played = TableTeamMapStats.matches_played + played
+        matches_won = TableTeamMapStats.matches_won + won
+        await session.execute(
+            update(TableTeamMapStats)
+            .where(
+                TableTeamMapStats.team_id == team_id,
                 TableTeamMapStats.map == map_name,
             )
+            .values(
+                matches_played=matches_played,
+                matches_won=matches_won,
+                win_rate=case(
+                    (
+                        matches_played > 0,
+                        cast(matches_won, Float) / matches_played * 100,
+                    ),
+                    else_=0.0,
+                ),
+            )
         )
-        # Update the fields of the existing map stats
-        setattr(existing_stat, "matches_played", stat["matches_played"])
-        setattr(existing_stat, "matches_won", stat["matches_won"])
-        setattr(existing_stat, "win_rate", stat["win_rate"])
 
-    await session.commit()
 
-    return team.map_stats
+async def recalculate_team_map_stats(
+    session: AsyncSession,
+    team_ids: Iterable[int] | None = None,
+) -> None:
+    """
+    Recalculate the map stats of the given teams (all teams by default) from the
+    map results with a fixed number of statements. The caller commits.
+    """
+    team_filter = TableTeam.id.in_(team_ids) if team_ids is not None else true()
+    stats_filter = (
+        TableTeamMapStats.team_id.in_(team_ids) if team_ids is not None else true()
+    )
+
+    # Make sure every team has a stats entry for every map
+    existing_team_ids = list(
+        await session.scalars(select(TableTeam.id).where(team_filter))
+    )
+    stats_keys = await session.execute(
+        select(TableTeamMapStats.team_id, TableTeamMapStats.map).where(stats_filter)
+    )
+    existing = {(team_id, map_name) for team_id, map_name in stats_keys}
+    session.add_all(
+        TableTeamMapStats(team_id=team_id, map=map_name)
+        for team_id in existing_team_ids
+        for map_name in MapName
+        if (team_id, map_name) not in existing
+    )
+    await session.flush()
+
+    # Reset the stats, the teams without results keep the zero values
+    await session.execute(
+        update(TableTeamMapStats)
+        .where(stats_filter)
+        .values(
+            matches_played=0,
+            matches_won=0,
+            win_rate=0.0,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    # Count the results of the matches of each team, grouped by map
+    match_team_id = TeamMatchAssociation.team_id
+    won = or_(
+        and_(
+            TableMapResultInfo.first_team_id == match_team_id,
+            TableMapResultInfo.total_score_first_team
+            > TableMapResultInfo.total_score_second_team,
+        ),
+        and_(
+            TableMapResultInfo.second_team_id == match_team_id,
+            TableMapResultInfo.total_score_second_team
+            > TableMapResultInfo.total_score_first_team,
+        ),
+    )
+    stmt = (
+        select(
+            match_team_id,
+            TableMapResultInfo.map,
+            func.count(),
+            func.sum(case((won, 1), else_=0)),
+        )
+        .join(
+            TableMapResultInfo,
+            and_(
+                TableMapResultInfo.match_id == TeamMatchAssociation.match_id,
+                or_(
+                    TableMapResultInfo.first_team_id == match_team_id,
+                    TableMapResultInfo.second_team_id == match_team_id,
+                ),
+            ),
+        )
+        .where(match_team_id.in_(team_ids) if team_ids is not None else true())
+        .group_by(match_team_id, TableMapResultInfo.map)
+    )
+    rows = [
+        {
+            "b_team_id": team_id,
+            "b_map": map_name,
+            "matches_played": played,
+            "matches_won": won_count,
+            "win_rate": (won_count / played) * 100,
+        }
+        for team_id, map_name, played, won_count in await session.execute(stmt)
+    ]
+
+    # Write the aggregated values in one executemany
+    if rows:
+        table = TableTeamMapStats.__table__
+        await session.execute(
+            update(table).where(
+                table.c.team_id == bindparam("b_team_id"),
+                table.c.map == bindparam("b_map"),
+            ),
+            rows,
+        )
+
+
+async def rebuild_team_map_stats(
+    session: AsyncSession,
+) -> None:
+    """
+    Recalculate the map stats and the veto rollup of all teams from the map
+    results and vetoes (e.g. for backfills).
+    """
+    await recalculate_team_map_stats(session)
+    await recalculate_team_veto_stats(
+        session, await session.scalars(select(TableTeam.id))
+    )
+    await session.commit()
+    invalidate_tags("team")
 
 
 async def delete_team_map_stats(
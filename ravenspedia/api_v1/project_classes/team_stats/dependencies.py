@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional, List
+
+from fastapi import Query
+
+from .schemes import VetoStatsFilter
+
+
+async def get_veto_filter(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    tournament_ids: Optional[List[int]] = Query(None),
+) -> VetoStatsFilter:
+    """
+    Create a VetoStatsFilter object from query parameters.
+    """
+    return VetoStatsFilter(
+        start_date=start_date,
+        end_date=end_date,
+        tournament_ids=tournament_ids,
+    )
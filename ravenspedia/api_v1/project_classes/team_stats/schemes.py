@@ -1,4 +1,6 @@
+from datetime import datetime
 from enum import Enum
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -27,3 +29,83 @@ class ResponseTeamMapStats(BaseModel):
     matches_played: int  # Number of matches played on the map
     matches_won: int  # Number of matches won on the map
     win_rate: float  # Win rate percentage on the map
+
+
+class HeadToHeadMap(BaseModel):
+    """
+    Pydantic model for the record of a team against an opponent on one map.
+    """
+
+    map: MapName  # The name of the map
+    played: int  # Number of times the map was played between the teams
+    won: int  # Number of times the team won the map
+    lost: int  # Number of times the team lost the map
+    average_round_difference: float  # Average of the team's rounds minus the opponent's
+
+
+class HeadToHeadMeeting(BaseModel):
+    """
+    Pydantic model for one match between two teams.
+    """
+
+    match_id: int  # ID of the match
+    date: datetime  # Date of the match
+    tournament: str  # Name of the tournament of the match
+    best_of: int  # Number of maps in the series
+    maps_won: int  # Maps won by the team
+    maps_lost: int  # Maps won by the opponent
+    round_difference: int  # Rounds of the team minus the opponent's, over all maps
+
+
+class ResponseHeadToHead(BaseModel):
+    """
+    Pydantic model for the response format of a head-to-head comparison,
+    seen from the first team.
+    """
+
+    team: str  # Name of the team
+    opponent: str  # Name of the opponent
+    series_played: int  # Matches between the teams with at least one map result
+    series_won: int  # Series won by the team (a majority of the best_of maps)
+    series_lost: int  # Series won by the opponent, the rest are undecided
+    maps_played: int  # Maps played between the teams
+    maps_won: int  # Maps won by the team
+    maps_lost: int  # Maps won by the opponent
+    average_round_difference: (
+        float  # Average per map of the team's rounds minus the opponent's
+    )
+    maps: list[HeadToHeadMap]  # Record on each map played between the teams
+    recent_meetings: list[HeadToHeadMeeting]  # Latest matches between the teams
+
+
+class VetoStatsFilter(BaseModel):
+    """
+    Pydantic model for restricting the veto statistics of a team to a window.
+    """
+
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    tournament_ids: Optional[List[int]] = None
+
+    @property
+    def is_window(self) -> bool:
+        return any(
+            value is not None
+            for value in (self.start_date, self.end_date, self.tournament_ids)
+        )
+
+
+class ResponseTeamVetoStats(BaseModel):
+    """
+    Pydantic model for the response format of the veto tendencies of a team on a map.
+    """
+
+    map: MapName  # The name of the map
+    bans: int  # Number of times the team banned the map
+    first_bans: int  # Number of times the map was the team's first ban of a match
+    first_ban_rate: float  # Share of the team's first bans on this map, in percent
+    picks: int  # Number of times the team picked the map
+    pick_rate: float  # Share of the team's picks on this map, in percent
+    picks_played: int  # Picks of the team with a map result
+    picks_won: int  # Picks of the team that it won
+    pick_win_rate: float  # Share of the played picks won by the team, in percent
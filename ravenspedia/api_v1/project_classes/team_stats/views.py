@@ -1,13 +1,27 @@
-from typing import List
+from typing import List, Union
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .crud import get_team_map_stats
-from .schemes import ResponseTeamMapStats
+from .crud import (
+    get_team_map_stats,
+    get_team_players_stats,
+    get_team_veto_stats,
+    rebuild_team_map_stats,
+)
+from .dependencies import get_veto_filter
+from .schemes import ResponseTeamMapStats, ResponseTeamVetoStats, VetoStatsFilter
+from ..player_stats import get_stats_filter
+from ..player_stats.schemes import (
+    DetailedPlayerStats,
+    GeneralPlayerStats,
+    PlayerStatsFilter,
+)
 from ..team.dependencies import get_team_by_name
+from ...auth.dependencies import get_current_admin_user
+from ...cache import cache_tags
 
-from ravenspedia.core import db_helper, TableTeam, TableTeamMapStats
+from ravenspedia.core import db_helper, TableTeam, TableTeamMapStats, TableUser
 
 # Define a router for team statistics endpoints
 router = APIRouter(tags=["Team Stats"])
@@ -27,10 +41,26 @@ def table_to_response_form(
     )
 
 
+@router.patch(
+    "/rebuild_map_stats/",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def rebuild_map_stats(
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> None:
+    """
+    Recalculate the map statistics and the veto rollup of all teams from the
+    match results and vetoes (admin only).
+    """
+    await rebuild_team_map_stats(session=session)
+
+
 @router.get(
     "/{team_name}/",
     response_model=List[ResponseTeamMapStats],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("team:{team_name}"))],
 )
 async def get_team_stats(
     team: TableTeam = Depends(get_team_by_name),
@@ -44,3 +74,47 @@ async def get_team_stats(
     # Convert each map stats object to the response format
     result = [table_to_response_form(map_name) for map_name in team_stats]
     return result
+
+
+@router.get(
+    "/{team_name}/veto/",
+    response_model=List[ResponseTeamVetoStats],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("team:{team_name}"))],
+)
+async def get_team_veto_tendencies(
+    team_name: str,
+    stats_filter: VetoStatsFilter = Depends(get_veto_filter),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> List[ResponseTeamVetoStats]:
+    """
+    Retrieve the first-ban rate, pick rate and pick-to-win conversion of a team
+    on every map, optionally within a date or tournament window.
+    """
+    return await get_team_veto_stats(
+        session=session,
+        team_name=team_name,
+        stats_filter=stats_filter,
+    )
+
+
+@router.get(
+    "/{team_name}/players/",
+    response_model=List[Union[GeneralPlayerStats, DetailedPlayerStats]],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("team:{team_name}", "player", "match"))],
+)
+async def get_team_players_statistics(
+    team_name: str,
+    stats_filter: PlayerStatsFilter = Depends(get_stats_filter),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> List[Union[GeneralPlayerStats, DetailedPlayerStats]]:
+    """
+    Retrieve the general (or detailed) statistics of every current member of a
+    team, optionally within a date or tournament window.
+    """
+    return await get_team_players_stats(
+        session=session,
+        team_name=team_name,
+        stats_filter=stats_filter,
+    )
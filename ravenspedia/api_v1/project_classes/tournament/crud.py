@@ -1,14 +1,25 @@
 from datetime import datetime
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .dependencies import get_tournament_by_name
 from .schemes import TournamentCreate, TournamentGeneralInfoUpdate
-from ravenspedia.core import TableTournament, TableTournamentResult, TournamentStatus
+from ..match.crud import delete_matches
+from ..match.documents import refresh_match_documents
+from ...cache import invalidate_tags
+from ravenspedia.core import (
+    TableTournament,
+    TableTournamentResult,
+    TableTournamentSummary,
+    TournamentStatus,
+    TableMatch,
+    TeamTournamentAssociation,
+    PlayerTournamentAssociation,
+)
 
 
 async def get_tournaments(session: AsyncSession) -> list[TableTournament]:
@@ -77,6 +88,7 @@ async def create_tournament(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Tournament {tournament_in.name} already exists",
         )
+    invalidate_tags(f"tournament:{tournament.name}")
 
     # Refresh the tournament with related data
     await session.refresh(
@@ -89,13 +101,47 @@ async def create_tournament(
 async def delete_tournament(
     session: AsyncSession,
     tournament: TableTournament,
-) -> None:
+) -> dict:
     """
-    Delete a tournament from the database.
+    Delete a tournament, its matches and its results in a single transaction.
     """
-    await session.delete(tournament)
+    tournament_id = tournament.id
+    tournament_name = tournament.name
+
+    # Delete the matches of the tournament with everything attached to them
+    match_ids = list(
+        await session.scalars(
+            select(TableMatch.id).where(TableMatch.tournament_id == tournament_id)
+        )
+    )
+    summary = await delete_matches(session, match_ids, sync_players=False)
+
+    # Delete the results and the team and player links of the tournament
+    for key, model in (
+        ("tournament_results", TableTournamentResult),
+        ("summaries", TableTournamentSummary),
+        ("teams", TeamTournamentAssociation),
+        ("players", PlayerTournamentAssociation),
+    ):
+        result = await session.execute(
+            delete(model)
+            .where(model.tournament_id == tournament_id)
+            .execution_options(synchronize_session=False)
+        )
+        summary[key] = result.rowcount
+
+    result = await session.execute(
+        delete(TableTournament)
+        .where(TableTournament.id == tournament_id)
+        .execution_options(synchronize_session=False)
+    )
+    summary["tournaments"] = result.rowcount
     await session.commit()
 
+    # Its matches, teams, players and map statistics all referenced the tournament
+    invalidate_tags(f"tournament:{tournament_name}", "match", "team", "player", "map")
+    return summary
+
 
 async def update_general_tournament_info(
     session: AsyncSession,
@@ -105,8 +151,20 @@ async def update_general_tournament_info(
     """
     Update a tournament's general information (e.g., name, prize, description).
     """
+    old_name = tournament.name
+
     for class_field, value in tournament_update.model_dump(exclude_unset=True).items():
         setattr(tournament, class_field, value)
     await session.commit()
+    invalidate_tags(f"tournament:{old_name}", f"tournament:{tournament.name}")
+
+    # The tournament name is part of the documents of its matches
+    if tournament.name != old_name:
+        await refresh_match_documents(
+            session,
+            [match.id for match in tournament.matches],
+        )
+        # ... and of the responses of its teams and players
+        invalidate_tags("team", "player")
 
     return tournament
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, status, Path
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.core import db_helper, TableTournament, TableTournamentResult
@@ -64,3 +64,26 @@ async def get_tournament_by_name(
         )
 
     return table_tournament
+
+
+async def get_plain_tournament_by_name(
+    tournament_name: str,
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> TableTournament:
+    """
+    Retrieve a tournament by its name without loading its relationships.
+    """
+    # Only the columns are loaded, touching a relationship raises instead
+    table_tournament = await session.scalar(
+        select(TableTournament)
+        .where(TableTournament.name == tournament_name)
+        .options(raiseload("*"))
+    )
+
+    if table_tournament is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_name} not found",
+        )
+
+    return table_tournament
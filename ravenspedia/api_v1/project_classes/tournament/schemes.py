@@ -4,6 +4,8 @@ from typing import Union, List, Optional
 from pydantic import BaseModel
 
 from ravenspedia.core import TournamentStatus
+from ..player_stats.schemes import GeneralPlayerStats
+from ..team_stats.schemes import MapName
 
 
 class TournamentResult(BaseModel):
@@ -68,3 +70,26 @@ class ResponseTournament(TournamentBase):
     class Config:
 
         from_attributes = True  # Enable compatibility with ORM models
+
+
+class TournamentMapCount(BaseModel):
+    """
+    Pydantic model for the number of times a map was played in a tournament.
+    """
+
+    map: MapName
+    played: int
+
+
+class ResponseTournamentSummary(BaseModel):
+    """
+    Pydantic model for the frozen summary of a completed tournament.
+    """
+
+    tournament: str
+    built_at: datetime
+    mvp_metric: str  # Field of the player stats the MVP was chosen by
+    mvp: Optional[GeneralPlayerStats] = None
+    players: List[GeneralPlayerStats] = []  # Sorted by the MVP metric, best first
+    standings: List[TournamentResult] = []
+    maps: List[TournamentMapCount] = []
@@ -0,0 +1,237 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from ravenspedia.core import (
+    TableMapMetaStats,
+    TableMatch,
+    TableMatchStats,
+    TableTeam,
+    TableTournament,
+    TableTournamentResult,
+    TableTournamentSummary,
+    TournamentStatus,
+)
+from ravenspedia.core.config import tournament_summary_settings
+from .schemes import ResponseTournamentSummary, TournamentMapCount, TournamentResult
+from ..player_stats.crud import process_general_stats
+from ...cache import invalidate_tags
+
+
+async def build_tournament_summary(
+    session: AsyncSession,
+    tournament: TableTournament,
+) -> ResponseTournamentSummary:
+    """
+    Compute the summary of a tournament: the stats of its players, its MVP, its
+    standings and the maps played.
+    """
+    # Stats of every player in the matches of the tournament, in one query
+    stats_records = await session.scalars(
+        select(TableMatchStats)
+        .join(TableMatchStats.match)
+        .where(TableMatch.tournament_id == tournament.id)
+        .options(selectinload(TableMatchStats.player))
+    )
+    stats_by_player = defaultdict(list)
+    for stat in stats_records:
+        stats_by_player[stat.player].append(stat)
+    players = [
+        process_general_stats(player, stats_list)
+        for player, stats_list in stats_by_player.items()
+    ]
+
+    # Best player first by the configured metric, the MVP among the regulars
+    metric = tournament_summary_settings.mvp_metric
+    players.sort(key=lambda stats: (-getattr(stats, metric), stats.nickname))
+    mvp = next(
+        (
+            stats
+            for stats in players
+            if stats.total_matches >= tournament_summary_settings.mvp_min_matches
+        ),
+        None,
+    )
+
+    # Final places of the teams
+    standings = await session.execute(
+        select(
+            TableTournamentResult.place,
+            TableTeam.name,
+            TableTournamentResult.prize,
+        )
+        .outerjoin(TableTeam, TableTeam.id == TableTournamentResult.team_id)
+        .where(TableTournamentResult.tournament_id == tournament.id)
+        .order_by(TableTournamentResult.place)
+    )
+
+    # Maps played, read from the map rollup of the tournament
+    maps = await session.execute(
+        select(TableMapMetaStats.map, TableMapMetaStats.played)
+        .where(
+            TableMapMetaStats.tournament_id == tournament.id,
+            TableMapMetaStats.played > 0,
+        )
+        .order_by(TableMapMetaStats.played.desc(), TableMapMetaStats.map)
+    )
+
+    return ResponseTournamentSummary(
+        tournament=tournament.name,
+        built_at=datetime.now(),
+        mvp_metric=metric,
+        mvp=mvp,
+        players=players,
+        standings=[
+            TournamentResult(place=place, team=team, prize=prize)
+            for place, team, prize in standings
+        ],
+        maps=[
+            TournamentMapCount(map=map_name.value, played=played)
+            for map_name, played in maps
+        ],
+    )
+
+
+async def refresh_tournament_summaries(
+    session: AsyncSession,
+    tournament_ids: Iterable[int | None],
+) -> None:
+    """
+    Rebuild the summaries of the given tournaments that are completed, and drop
+    those of the tournaments that are no longer completed.
+    """
+    tournament_ids = {id_ for id_ in tournament_ids if id_ is not None}
+    if not tournament_ids:
+        return
+
+    # Use a separate session so that the summaries reflect the committed state
+    # without touching the objects loaded in the caller's session
+    async with AsyncSession(bind=session.bind) as summary_session:
+        tournaments = list(
+            await summary_session.scalars(
+                select(TableTournament).where(TableTournament.id.in_(tournament_ids))
+            )
+        )
+        summaries = {
+            summary.tournament_id: summary
+            for summary in await summary_session.scalars(
+                select(TableTournamentSummary).where(
+                    TableTournamentSummary.tournament_id.in_(tournament_ids)
+                )
+            )
+        }
+
+        changed = []
+        for tournament in tournaments:
+            summary = summaries.get(tournament.id)
+            if tournament.status != TournamentStatus.COMPLETED:
+                # The numbers of a tournament in progress may still change
+                if summary is not None:
+                    await summary_session.delete(summary)
+                    changed.append(tournament.name)
+                continue
+
+            response = await build_tournament_summary(summary_session, tournament)
+            content = response.model_dump_json(by_alias=True)
+            if summary is None:
+                summary_session.add(
+                    TableTournamentSummary(
+                        tournament_id=tournament.id,
+                        content=content,
+                    )
+                )
+            else:
+                summary.content = content
+            changed.append(tournament.name)
+
+        await summary_session.commit()
+
+    # Cached summaries of the changed tournaments are now outdated
+    invalidate_tags(*(f"tournament:{name}" for name in changed))
+
+
+async def refresh_match_tournament_summaries(
+    session: AsyncSession,
+    match_ids: Iterable[int],
+) -> None:
+    """
+    Rebuild the summaries of the completed tournaments of the given matches.
+    """
+    match_ids = set(match_ids)
+    if not match_ids:
+        return
+    tournament_ids = await session.scalars(
+        select(TableTournament.id)
+        .join(TableMatch, TableMatch.tournament_id == TableTournament.id)
+        .where(
+            TableMatch.id.in_(match_ids),
+            TableTournament.status == TournamentStatus.COMPLETED,
+        )
+        .distinct()
+    )
+    await refresh_tournament_summaries(session, list(tournament_ids))
+
+
+async def delete_tournament_summaries(
+    session: AsyncSession,
+    tournament_ids: Iterable[int],
+) -> int:
+    """
+    Delete the summaries of the given tournaments in the caller's transaction.
+    """
+    result = await session.execute(
+        delete(TableTournamentSummary)
+        .where(TableTournamentSummary.tournament_id.in_(list(tournament_ids)))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def get_tournament_summary(
+    session: AsyncSession,
+    tournament_name: str,
+) -> str:
+    """
+    Retrieve the serialized summary of a completed tournament from its row,
+    building it if it is missing (e.g. after a migration).
+    """
+    tournament_row = (
+        await session.execute(
+            select(
+                TableTournament.id,
+                TableTournament.status,
+                TableTournamentSummary.content,
+            )
+            .outerjoin(
+                TableTournamentSummary,
+                TableTournamentSummary.tournament_id == TableTournament.id,
+            )
+            .where(TableTournament.name == tournament_name)
+        )
+    ).first()
+    if tournament_row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_name} not found",
+        )
+
+    tournament_id, tournament_status, content = tournament_row
+    if tournament_status != TournamentStatus.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The summary of the tournament {tournament_name} is available "
+            f"once it is completed",
+        )
+    if content is None:
+        await refresh_tournament_summaries(session, [tournament_id])
+        content = await session.scalar(
+            select(TableTournamentSummary.content).where(
+                TableTournamentSummary.tournament_id == tournament_id
+            )
+        )
+    return content
@@ -1,58 +1,192 @@
 from fastapi import HTTPException, status
-from sqlalchemy import delete
+from sqlalchemy import delete, exists, func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.core import (
+    TableMatch,
     TableTournament,
+    TablePlayer,
     TableTeam,
     TeamTournamentAssociation,
     PlayerTournamentAssociation,
     TableTournamentResult,
 )
 from .schemes import TournamentResult
+from .summary import refresh_tournament_summaries
+from ...cache import invalidate_tags
+
+
+async def is_team_in_tournament(
+    session: AsyncSession,
+    team_id: int,
+    tournament_id: int,
+) -> bool:
+    """
+    Check with an EXISTS query whether a team participates in a tournament.
+    """
+    return await session.scalar(
+        select(
+            exists().where(
+                TeamTournamentAssociation.team_id == team_id,
+                TeamTournamentAssociation.tournament_id == tournament_id,
+            )
+        )
+    )
+
+
+async def count_tournament_teams(
+    session: AsyncSession,
+    tournament_id: int,
+) -> int:
+    """
+    Count the teams participating in a tournament without loading them.
+    """
+    return await session.scalar(
+        select(func.count()).where(
+            TeamTournamentAssociation.tournament_id == tournament_id
+        )
+    )
+
+
+async def get_team_nicknames(
+    session: AsyncSession,
+    team_id: int,
+) -> list[str]:
+    """
+    Return the nicknames of a team's players without loading the players.
+    """
+    result = await session.scalars(
+        select(TablePlayer.nickname).where(TablePlayer.team_id == team_id)
+    )
+    return list(result)
+
+
+async def get_tournament_response_dict(
+    session: AsyncSession,
+    tournament: TableTournament,
+) -> dict:
+    """
+    Build the ResponseTournament fields of a tournament with column-only queries,
+    without loading its matches, teams, players or results.
+    """
+    matches_id = await session.scalars(
+        select(TableMatch.id)
+        .where(TableMatch.tournament_id == tournament.id)
+        .order_by(TableMatch.id)
+    )
+    teams = await session.scalars(
+        select(TableTeam.name)
+        .join(
+            TeamTournamentAssociation,
+            TeamTournamentAssociation.team_id == TableTeam.id,
+        )
+        .where(TeamTournamentAssociation.tournament_id == tournament.id)
+        .order_by(TeamTournamentAssociation.id)
+    )
+    players = await session.scalars(
+        select(TablePlayer.nickname)
+        .join(
+            PlayerTournamentAssociation,
+            PlayerTournamentAssociation.player_id == TablePlayer.id,
+        )
+        .where(PlayerTournamentAssociation.tournament_id == tournament.id)
+        .order_by(PlayerTournamentAssociation.id)
+    )
+    results = await session.execute(
+        select(
+            TableTournamentResult.place,
+            TableTeam.name,
+            TableTournamentResult.prize,
+        )
+        .outerjoin(TableTeam, TableTeam.id == TableTournamentResult.team_id)
+        .where(TableTournamentResult.tournament_id == tournament.id)
+        .order_by(TableTournamentResult.place)
+    )
+    return {
+        "max_count_of_teams": tournament.max_count_of_teams,
+        "name": tournament.name,
+        "start_date": tournament.start_date,
+        "end_date": tournament.end_date,
+        "prize": tournament.prize,
+        "description": tournament.description,
+        "matches_id": list(matches_id),
+        "teams": list(teams),
+        "players": list(players),
+        "results": [
+            {"place": place, "team": team_name, "prize": prize}
+            for place, team_name, prize in results
+        ],
+        "status": tournament.status,
+    }
 
 
 async def add_team_in_tournament(
     session: AsyncSession,
     team: TableTeam,
     tournament: TableTournament,
-) -> TableTournament:
+) -> dict:
     """
     Add a team to a tournament, including its players.
     """
     # Check: the team is already participating in the tournament
-    if team in tournament.teams:
+    if await is_team_in_tournament(session, team.id, tournament.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Team {team.name} already exists",
         )
 
     # Check: the maximum number of teams has been reached
-    if len(tournament.teams) == tournament.max_count_of_teams:
+    if (
+        await count_tournament_teams(session, tournament.id)
+        >= tournament.max_count_of_teams
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"The maximum number of teams will participate in the tournament",
         )
 
-    # Add the team and all its players to the tournament
-    tournament.teams.append(team)
-    for player in team.players:
-        tournament.players.append(player)
+    # Add the team to the tournament
+    await session.execute(
+        insert(TeamTournamentAssociation).values(
+            team_id=team.id,
+            tournament_id=tournament.id,
+        )
+    )
+
+    # Add all its players with one INSERT ... SELECT, skipping the linked ones
+    await session.execute(
+        insert(PlayerTournamentAssociation).from_select(
+            ["player_id", "tournament_id"],
+            select(TablePlayer.id, literal(tournament.id)).where(
+                TablePlayer.team_id == team.id,
+                ~exists().where(
+                    PlayerTournamentAssociation.player_id == TablePlayer.id,
+                    PlayerTournamentAssociation.tournament_id == tournament.id,
+                ),
+            ),
+        )
+    )
+    nicknames = await get_team_nicknames(session, team.id)
 
     await session.commit()
-    return tournament
+    invalidate_tags(
+        f"tournament:{tournament.name}",
+        f"team:{team.name}",
+        *(f"player:{nickname}" for nickname in nicknames),
+    )
+    return await get_tournament_response_dict(session, tournament)
 
 
 async def delete_team_from_tournament(
     session: AsyncSession,
     team: TableTeam,
     tournament: TableTournament,
-) -> TableTournament:
+) -> dict:
     """
     Remove a team from a tournament, including its players.
     """
     # Check: the team is not participating in the tournament
-    if team not in tournament.teams:
+    if not await is_team_in_tournament(session, team.id, tournament.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"The team is no longer participate in the tournament {tournament.name}",
@@ -67,18 +201,25 @@ async def delete_team_from_tournament(
     )
 
     # Remove all players of the team from the tournament
-    player_ids = [player.id for player in team.players]
-    if player_ids:
-        await session.execute(
-            delete(PlayerTournamentAssociation).where(
-                PlayerTournamentAssociation.tournament_id == tournament.id,
-                PlayerTournamentAssociation.player_id.in_(player_ids),
-            )
+    await session.execute(
+        delete(PlayerTournamentAssociation)
+        .where(
+            PlayerTournamentAssociation.tournament_id == tournament.id,
+            PlayerTournamentAssociation.player_id.in_(
+                select(TablePlayer.id).where(TablePlayer.team_id == team.id)
+            ),
         )
+        .execution_options(synchronize_session=False)
+    )
+    nicknames = await get_team_nicknames(session, team.id)
 
     await session.commit()
-    await session.refresh(tournament, ["matches", "teams", "players"])
-    return tournament
+    invalidate_tags(
+        f"tournament:{tournament.name}",
+        f"team:{team.name}",
+        *(f"player:{nickname}" for nickname in nicknames),
+    )
+    return await get_tournament_response_dict(session, tournament)
 
 
 async def add_result_to_tournament(
@@ -112,6 +253,9 @@ async def add_result_to_tournament(
 
     session.add(new_result)
     await session.commit()
+    # The standings are part of the summary of a completed tournament
+    await refresh_tournament_summaries(session, [tournament.id])
+    invalidate_tags(f"tournament:{tournament.name}")
     await session.refresh(tournament, ["results"])
     return tournament
 
@@ -134,6 +278,9 @@ async def delete_last_result(
     last_result = max(tournament.results, key=lambda x: x.place)
     await session.delete(last_result)
     await session.commit()
+    # The standings are part of the summary of a completed tournament
+    await refresh_tournament_summaries(session, [tournament.id])
+    invalidate_tags(f"tournament:{tournament.name}", "team")
     await session.refresh(tournament, ["results"])
     return tournament
 
@@ -148,7 +295,7 @@ async def assign_team_to_result(
     Assign a team to a specific place in a tournament's results.
     """
     # Check: the team is not participating in the tournament
-    if team not in tournament.teams:
+    if not await is_team_in_tournament(session, team.id, tournament.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Team {team.name} is not participating in the tournament",
@@ -172,6 +319,9 @@ async def assign_team_to_result(
     # Assign the team to the specified place
     result.team = team
     await session.commit()
+    # The standings are part of the summary of a completed tournament
+    await refresh_tournament_summaries(session, [tournament.id])
+    invalidate_tags(f"tournament:{tournament.name}", f"team:{team.name}")
     await session.refresh(tournament, ["results"])
     return tournament
 
@@ -195,5 +345,8 @@ async def remove_team_from_result(
     # Remove the team from the result
     result.team = None
     await session.commit()
+    # The standings are part of the summary of a completed tournament
+    await refresh_tournament_summaries(session, [tournament.id])
+    invalidate_tags(f"tournament:{tournament.name}", "team")
     await session.refresh(tournament, ["results"])
     return tournament
@@ -1,77 +1,91 @@
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, Response, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ravenspedia.core import db_helper, TableTournament, TableTeam, TableUser
 from . import crud, dependencies, tournament_management
 from .schemes import (
     ResponseTournament,
+    ResponseTournamentSummary,
     TournamentCreate,
     TournamentGeneralInfoUpdate,
     TournamentResult,
 )
-from ..team.dependencies import get_team_by_name
+from .summary import get_tournament_summary
+from ..team.dependencies import get_plain_team_by_name, get_team_by_name
 from ...auth.dependencies import get_current_admin_user
+from ...cache import cache_tags
+from ...rendering import FastJSONResponse
 
 router = APIRouter(tags=["Tournaments"])
 manager_tournament_router = APIRouter(tags=["Tournaments Manager"])
 
 
+def table_to_response_dict(
+    tournament: TableTournament,
+) -> dict:
+    """
+    Convert a TableTournament database model to a plain dict shaped like
+    ResponseTournament.
+    """
+    return {
+        "max_count_of_teams": tournament.max_count_of_teams,
+        "name": tournament.name,
+        "start_date": tournament.start_date,
+        "end_date": tournament.end_date,
+        "prize": tournament.prize,
+        "description": tournament.description,
+        "matches_id": [match.id for match in tournament.matches],
+        "teams": [team.name for team in tournament.teams],
+        "players": [player.nickname for player in tournament.players],
+        "results": [
+            {
+                "place": result.place,
+                "team": result.team.name if result.team else None,
+                "prize": result.prize,
+            }
+            for result in sorted(tournament.results, key=lambda x: x.place)
+        ],
+        "status": tournament.status,
+    }
+
+
 def table_to_response_form(
     tournament: TableTournament,
 ) -> ResponseTournament:
     """
     Convert a TableTournament database model to a ResponseTournament Pydantic model.
     """
-    result = ResponseTournament(
-        name=tournament.name,
-        description=tournament.description,
-        prize=tournament.prize,
-        max_count_of_teams=tournament.max_count_of_teams,
-        status=tournament.status,
-        start_date=tournament.start_date,
-        end_date=tournament.end_date,
-    )
-    result.matches_id = [match.id for match in tournament.matches]
-    result.teams = [team.name for team in tournament.teams]
-    result.players = [player.nickname for player in tournament.players]
-    result.results = [
-        TournamentResult(
-            place=result.place,
-            team=result.team.name if result.team else None,
-            prize=result.prize,
-        )
-        for result in sorted(tournament.results, key=lambda x: x.place)
-    ]
-    return result
+    return ResponseTournament(**table_to_response_dict(tournament))
 
 
 @router.get(
     "/",
     response_model=list[ResponseTournament],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("tournament"))],
 )
 async def get_tournaments(
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> list[ResponseTournament]:
+) -> FastJSONResponse:
     """
     Retrieve all tournaments from the database.
     """
     tournaments = await crud.get_tournaments(session=session)
-    result = [
-        table_to_response_form(tournament=tournament) for tournament in tournaments
-    ]
-    return result
+    return FastJSONResponse(
+        [table_to_response_dict(tournament) for tournament in tournaments]
+    )
 
 
 @router.get(
     "/{tournament_name}/",
     response_model=ResponseTournament,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("tournament:{tournament_name}"))],
 )
 async def get_tournament(
     tournament_name: str,
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> ResponseTournament:
+) -> FastJSONResponse:
     """
     Retrieve a tournament by its name.
     """
@@ -79,7 +93,28 @@ async def get_tournament(
         session=session,
         tournament_name=tournament_name,
     )
-    return table_to_response_form(tournament=tournament)
+    return FastJSONResponse(table_to_response_dict(tournament))
+
+
+@router.get(
+    "/{tournament_name}/summary/",
+    response_model=ResponseTournamentSummary,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("tournament:{tournament_name}"))],
+)
+async def get_summary(
+    tournament_name: str,
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> Response:
+    """
+    Retrieve the summary of a completed tournament: the stats of its players,
+    its MVP, its standings and the maps played.
+    """
+    content = await get_tournament_summary(
+        session=session,
+        tournament_name=tournament_name,
+    )
+    return Response(content=content, media_type="application/json")
 
 
 @router.post(
@@ -149,19 +184,19 @@ async def delete_tournament(
 )
 async def add_team_in_tournament(
     admin: TableUser = Depends(get_current_admin_user),
-    team: TableTeam = Depends(get_team_by_name),
-    tournament: TableTournament = Depends(dependencies.get_tournament_by_name),
+    team: TableTeam = Depends(get_plain_team_by_name),
+    tournament: TableTournament = Depends(dependencies.get_plain_tournament_by_name),
     session: AsyncSession = Depends(db_helper.session_dependency),
 ) -> ResponseTournament:
     """
     Add a team to a tournament. (admin only)
     """
-    tournament = await tournament_management.add_team_in_tournament(
+    tournament_dict = await tournament_management.add_team_in_tournament(
         team=team,
         tournament=tournament,
         session=session,
     )
-    return table_to_response_form(tournament)
+    return ResponseTournament(**tournament_dict)
 
 
 @manager_tournament_router.delete(
@@ -171,19 +206,19 @@ async def add_team_in_tournament(
 )
 async def delete_team_from_tournament(
     admin: TableUser = Depends(get_current_admin_user),
-    team: TableTeam = Depends(get_team_by_name),
-    tournament: TableTournament = Depends(dependencies.get_tournament_by_name),
+    team: TableTeam = Depends(get_plain_team_by_name),
+    tournament: TableTournament = Depends(dependencies.get_plain_tournament_by_name),
     session: AsyncSession = Depends(db_helper.session_dependency),
 ) -> ResponseTournament:
     """
     Remove a team from a tournament. (admin only)
     """
-    tournament = await tournament_management.delete_team_from_tournament(
+    tournament_dict = await tournament_management.delete_team_from_tournament(
         team=team,
         tournament=tournament,
         session=session,
     )
-    return table_to_response_form(tournament=tournament)
+    return ResponseTournament(**tournament_dict)
 
 
 @manager_tournament_router.patch(
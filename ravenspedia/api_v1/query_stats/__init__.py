@@ -0,0 +1,10 @@
+# Data for export
+__all__ = (
+    "QueryStats",
+    "instrument_engine",
+    "track_queries",
+    "QueryStatsMiddleware",
+)
+
+from .collector import QueryStats, instrument_engine, track_queries
+from .middleware import QueryStatsMiddleware
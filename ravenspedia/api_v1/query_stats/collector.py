@@ -0,0 +1,115 @@
+import hashlib
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ravenspedia.core.config import query_stats_settings
+
+
+# Statistics of the statements run on behalf of one request (or one measured block)
+@dataclass
+class QueryStats:
+    count: int = 0  # Number of statements sent to the database
+    total_time: float = 0.0  # Time spent in the database, in seconds
+    fingerprints: Counter = field(default_factory=Counter)  # Fingerprint -> runs
+    statements: dict[str, str] = field(default_factory=dict)  # Fingerprint -> SQL
+    parent: "QueryStats | None" = None  # Enclosing block, which also gets the stats
+
+    def record(self, key: str, statement: str, duration: float) -> None:
+        """
+        Account one statement to this block and to the enclosing ones.
+        """
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.total_time += duration
+            stats.fingerprints[key] += 1
+            stats.statements.setdefault(key, statement)
+            stats = stats.parent
+
+    def repeated(
+        self,
+        threshold: int = query_stats_settings.repeated_threshold,
+    ) -> dict[str, int]:
+        """
+        Return the fingerprints run at least threshold times, most frequent first.
+        """
+        return {
+            fingerprint: count
+            for fingerprint, count in self.fingerprints.most_common()
+            if count >= threshold
+        }
+
+
+# Statistics of the current request, None outside of a measured block
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats",
+    default=None,
+)
+
+# Lists of bound parameters, e.g. "IN (?, ?, ?)" of expanding parameters
+_PARAMETER_LIST = re.compile(
+    r"\(\s*(?:\?|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+))+\s*\)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Normalize a statement so that its runs with other parameters look the same.
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PARAMETER_LIST.sub("(?...)", statement)
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Short stable identifier of a normalized statement.
+    """
+    return hashlib.sha1(statement.encode()).hexdigest()[:8]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_query_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_query_stats.get()
+    if stats is None or not conn.info.get("query_start_time"):
+        return
+
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    normalized = normalize_statement(statement)
+    stats.record(fingerprint(normalized), normalized, duration)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Attribute the statements of an engine to the QueryStats of the current context.
+    """
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect the statements run inside the block into a new QueryStats.
+    Blocks can be nested, the enclosing blocks count the statements too.
+    """
+    stats = QueryStats(parent=current_query_stats.get())
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
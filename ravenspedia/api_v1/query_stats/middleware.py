@@ -0,0 +1,78 @@
+import json
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ravenspedia.core.config import query_stats_settings
+from .collector import QueryStats, track_queries
+
+logger = logging.getLogger("ravenspedia.queries")
+
+
+def stats_headers(stats: QueryStats) -> list[tuple[bytes, bytes]]:
+    """
+    Build the response headers describing the statements of a request.
+    """
+    headers = [
+        (b"x-db-query-count", str(stats.count).encode()),
+        (b"x-db-time-ms", f"{stats.total_time * 1000:.2f}".encode()),
+    ]
+    repeated = stats.repeated()
+    if repeated:
+        value = ",".join(f"{key}={count}" for key, count in repeated.items())
+        headers.append((b"x-db-repeated-queries", value.encode()))
+    return headers
+
+
+def log_stats(scope: Scope, status: int, stats: QueryStats) -> None:
+    """
+    Write a structured log record of the statements of a request.
+    """
+    repeated = stats.repeated()
+    record = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "status": status,
+        "query_count": stats.count,
+        "db_time_ms": round(stats.total_time * 1000, 2),
+        "repeated": {
+            key: {"count": count, "statement": stats.statements[key]}
+            for key, count in repeated.items()
+        },
+    }
+    # Repeated statements are usually queries run in a loop (N+1)
+    logger.log(logging.WARNING if repeated else logging.INFO, json.dumps(record))
+
+
+# ASGI middleware counting the database statements run by each request
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not query_stats_settings.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            status = 500
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    # The statements after this point (e.g. in background tasks)
+                    # are logged but cannot be reported in the headers anymore
+                    status = message["status"]
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            *stats_headers(stats),
+                        ],
+                    }
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                log_stats(scope, status, stats)
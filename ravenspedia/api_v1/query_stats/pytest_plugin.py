@@ -0,0 +1,53 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+
+import pytest
+
+from ravenspedia.core import test_db_helper
+from .collector import QueryStats, instrument_engine, track_queries
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Count the statements of the database used by the tests
+    instrument_engine(test_db_helper.engine)
+
+
+def describe(stats: QueryStats) -> str:
+    """
+    List the statements of a block, most frequent first, for assertion messages.
+    """
+    return "\n".join(
+        f"  {count} x {stats.statements[key]}"
+        for key, count in stats.fingerprints.most_common()
+    )
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[QueryStats]]:
+    """
+    Measure the statements run inside a block and check them against a budget:
+
+        with query_budget(5) as stats:
+            response = await client.get("/teams/")
+
+    Without max_queries the block is only measured. With allow_repeated=False
+    no statement may be repeated as often as in an N+1 loop.
+    """
+
+    @contextmanager
+    def budget(
+        max_queries: int | None = None,
+        allow_repeated: bool = True,
+    ) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+
+        if max_queries is not None:
+            assert stats.count <= max_queries, (
+                f"{stats.count} queries over the budget of {max_queries}:\n"
+                f"{describe(stats)}"
+            )
+        if not allow_repeated:
+            assert not stats.repeated(), f"Repeated queries:\n{describe(stats)}"
+
+    return budget
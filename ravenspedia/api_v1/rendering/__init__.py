@@ -0,0 +1,7 @@
+# Data for export
+__all__ = (
+    "dumps",
+    "FastJSONResponse",
+)
+
+from .encoder import dumps, FastJSONResponse
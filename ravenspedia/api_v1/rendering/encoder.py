@@ -0,0 +1,45 @@
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import Response
+
+try:  # The standard encoder is only used if orjson is not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_default(value: Any) -> Any:
+    """
+    Encode the values the standard JSON encoder does not know, like pydantic does.
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode plain dicts, lists and scalars to compact JSON in one step.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=encode_default)
+    return json.dumps(
+        content,
+        default=encode_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+# JSON response for content already shaped like its response model. Returned by
+# an endpoint, it skips the response_model validation and the jsonable_encoder
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,48 @@
+import asyncio
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ravenspedia.api_v1.project_classes.match.live import (
+    RESYNC,
+    Subscriber,
+    encode_event,
+    match_broadcaster,
+)
+from ravenspedia.core.config import live_settings
+from .schedule_matches import get_in_progress_matches
+
+
+async def live_match_events(
+    subscriber: Subscriber,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[bytes]:
+    """
+    Stream a snapshot of the in-progress matches, then the changes of every
+    match as they are published. A viewer that falls behind gets a new snapshot.
+    """
+    try:
+        snapshot = True
+        while True:
+            if snapshot:
+                # Do not hold a session or a connection while streaming
+                async with session_factory() as session:
+                    documents = await get_in_progress_matches(session=session)
+                yield encode_event("snapshot", "[" + ",".join(documents) + "]")
+                snapshot = False
+
+            try:
+                message = await asyncio.wait_for(
+                    subscriber.queue.get(),
+                    timeout=live_settings.heartbeat_seconds,
+                )
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"  # Keep-alive comment, ignored by EventSource
+                continue
+
+            if message is RESYNC:
+                snapshot = True
+            else:
+                yield message
+    finally:
+        match_broadcaster.unsubscribe(subscriber)
@@ -1,9 +1,14 @@
 from datetime import datetime
 
-from sqlalchemy import update
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ravenspedia.core import TableMatch, TableTournament
+from ravenspedia.api_v1.cache import invalidate_tags
+from ravenspedia.api_v1.project_classes.match.documents import refresh_match_documents
+from ravenspedia.api_v1.project_classes.tournament.summary import (
+    refresh_tournament_summaries,
+)
+from ravenspedia.core import TableMatch, TableTournament, TableTournamentSummary
 from ravenspedia.core.project_models.table_match import MatchStatus
 from ravenspedia.core.project_models.table_tournament import TournamentStatus
 
@@ -16,6 +21,7 @@ async def manual_update_match_status(
     """Manually update the status of a given match and commit the change to the database."""
     setattr(match, "status", new_status)
     await session.commit()
+    await refresh_match_documents(session, [match.id])
     return match
 
 
@@ -27,6 +33,10 @@ async def manual_update_tournament_status(
     """Manually update the status of a given tournament and commit the change to the database."""
     setattr(tournament, "status", new_status)
     await session.commit()
+    invalidate_tags(f"tournament:{tournament.name}")
+
+    # A completed tournament gets its summary, a reopened one loses it
+    await refresh_tournament_summaries(session, [tournament.id])
     return tournament
 
 
@@ -35,23 +45,33 @@ async def auto_update_matches_statuses(session: AsyncSession) -> dict:
     current_time = datetime.now()
 
     # Update future matches to SCHEDULED
-    await session.execute(
+    scheduled_ids = await session.scalars(
         update(TableMatch)
-        .where(TableMatch.date > current_time)
+        .where(
+            TableMatch.date > current_time,
+            TableMatch.status != MatchStatus.SCHEDULED,
+        )
         .values(status=MatchStatus.SCHEDULED)
+        .returning(TableMatch.id)
     )
+    changed_ids = set(scheduled_ids)
 
     # Update past or current scheduled matches to IN_PROGRESS
-    await session.execute(
+    in_progress_ids = await session.scalars(
         update(TableMatch)
         .where(
             TableMatch.date <= current_time,
             TableMatch.status == MatchStatus.SCHEDULED,
         )
         .values(status=MatchStatus.IN_PROGRESS)
+        .returning(TableMatch.id)
     )
+    changed_ids.update(in_progress_ids)
 
     await session.commit()
+
+    # Regenerate the documents of the matches whose status has changed
+    await refresh_match_documents(session, changed_ids)
     return {"message": "Matches statuses updated successfully"}
 
 
@@ -60,11 +80,16 @@ async def auto_update_tournaments_statuses(session: AsyncSession) -> dict:
     current_time = datetime.now()
 
     # Update past tournaments to COMPLETED
-    await session.execute(
+    completed_ids = await session.scalars(
         update(TableTournament)
-        .where(TableTournament.end_date <= current_time)
+        .where(
+            TableTournament.end_date <= current_time,
+            TableTournament.status != TournamentStatus.COMPLETED,
+        )
         .values(status=TournamentStatus.COMPLETED)
+        .returning(TableTournament.id)
     )
+    completed_ids = list(completed_ids)
 
     # Update current tournaments to IN_PROGRESS
     await session.execute(
@@ -84,4 +109,16 @@ async def auto_update_tournaments_statuses(session: AsyncSession) -> dict:
     )
 
     await session.commit()
+    invalidate_tags("tournament")
+
+    # Build the summaries of the newly completed tournaments and drop those of
+    # the tournaments that are no longer completed
+    reopened_ids = await session.scalars(
+        select(TableTournamentSummary.tournament_id)
+        .join(
+            TableTournament, TableTournament.id == TableTournamentSummary.tournament_id
+        )
+        .where(TableTournament.status != TournamentStatus.COMPLETED)
+    )
+    await refresh_tournament_summaries(session, [*completed_ids, *reopened_ids])
     return {"message": "Tournaments statuses updated successfully"}
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, status, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, status, Depends, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ravenspedia.api_v1.auth.dependencies import get_current_admin_user
+from ravenspedia.api_v1.cache import cache_tags
+from ravenspedia.api_v1.coalescing import CoalescingRoute
 from ravenspedia.api_v1.project_classes import ResponseMatch, ResponseTournament
 from ravenspedia.core import (
     db_helper,
@@ -12,14 +15,17 @@ from ravenspedia.core import (
     TournamentStatus,
 )
 from . import schedule_matches, schedule_tournaments, schedule_updater
+from .schedule_live import live_match_events
 from ..project_classes.match.dependencies import get_match_by_id
-from ..project_classes.match.views import table_to_response_form as match_response_form
+from ..project_classes.match.documents import documents_to_response
+from ..project_classes.match.live import match_broadcaster
 from ..project_classes.tournament.dependencies import get_tournament_by_name
 from ..project_classes.tournament.views import (
     table_to_response_form as tournament_response_form,
 )
 
-router = APIRouter(tags=["Schedules"])
+# Identical concurrent reads of the routes in CoalescingSettings share one response
+router = APIRouter(tags=["Schedules"], route_class=CoalescingRoute)
 
 
 # Endpoint to retrieve completed matches
@@ -27,15 +33,15 @@ router = APIRouter(tags=["Schedules"])
     "/matches/get_last_completed/",
     response_model=list[ResponseMatch],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("match"))],
 )
 async def get_last_completed_matches(
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> list[ResponseMatch]:
+) -> Response:
     matches = await schedule_matches.get_completed_matches(
         session=session,
     )
-    result = [match_response_form(match) for match in matches]
-    return result
+    return documents_to_response(matches)
 
 
 # Endpoint to retrieve upcoming scheduled matches
@@ -43,15 +49,15 @@ async def get_last_completed_matches(
     "/matches/get_upcoming_scheduled/",
     response_model=list[ResponseMatch],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("match"))],
 )
 async def get_upcoming_scheduled_matches(
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> list[ResponseMatch]:
+) -> Response:
     matches = await schedule_matches.get_upcoming_matches(
         session=session,
     )
-    result = [match_response_form(match) for match in matches]
-    return result
+    return documents_to_response(matches)
 
 
 # Endpoint to retrieve in-progress matches
@@ -59,15 +65,37 @@ async def get_upcoming_scheduled_matches(
     "/matches/get_in_progress/",
     response_model=list[ResponseMatch],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("match"))],
 )
 async def get_in_progress_matches(
     session: AsyncSession = Depends(db_helper.session_dependency),
-) -> list[ResponseMatch]:
+) -> Response:
     matches = await schedule_matches.get_in_progress_matches(
         session=session,
     )
-    result = [match_response_form(match) for match in matches]
-    return result
+    return documents_to_response(matches)
+
+
+# Endpoint to stream the in-progress matches and their updates as Server-Sent
+# Events: one query per viewer, then one shared broadcast per change
+@router.get(
+    "/matches/live/",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stream_live_matches(
+    # The snapshots are read while the body is sent, after the request's dependencies
+    session_factory: async_sessionmaker[AsyncSession] = Depends(
+        db_helper.session_factory_dependency
+    ),
+) -> StreamingResponse:
+    # Subscribe before the snapshot is read, so that no change is missed
+    subscriber = match_broadcaster.subscribe()
+    return StreamingResponse(
+        live_match_events(subscriber, session_factory),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # Endpoint to retrieve completed tournaments
@@ -75,6 +103,7 @@ async def get_in_progress_matches(
     "/tournaments/get_completed/",
     response_model=list[ResponseTournament],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("tournament"))],
 )
 async def get_completed_tournaments(
     session: AsyncSession = Depends(db_helper.session_dependency),
@@ -91,6 +120,7 @@ async def get_completed_tournaments(
     "/tournaments/get_upcoming_scheduled/",
     response_model=list[ResponseTournament],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("tournament"))],
 )
 async def get_upcoming_scheduled_tournaments(
     session: AsyncSession = Depends(db_helper.session_dependency),
@@ -107,6 +137,7 @@ async def get_upcoming_scheduled_tournaments(
     "/tournaments/get_in_progress/",
     response_model=list[ResponseTournament],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("tournament"))],
 )
 async def get_in_progress_tournaments(
     session: AsyncSession = Depends(db_helper.session_dependency),
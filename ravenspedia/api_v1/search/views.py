@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ravenspedia.core import db_helper
 from .crud import search_entities
 from .schemes import SearchResult
+from ..cache import cache_tags
 
 router = APIRouter(tags=["Search"])
 
@@ -13,6 +14,7 @@ router = APIRouter(tags=["Search"])
     "/",
     response_model=SearchResult,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_tags("player", "team", "tournament"))],
 )
 async def search(
     query: str,
@@ -0,0 +1,167 @@
+from datetime import datetime
+from typing import Iterable, get_args
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import (
+    MatchStatus,
+    PlayerStats,
+    TableMapPickBanInfo,
+    TableMapResultInfo,
+    TableMatch,
+    TableMatchStats,
+    TableTournament,
+)
+
+
+def column_type(annotation) -> str:
+    """
+    Logical type of a column from the annotation of a model field.
+    """
+    types = [arg for arg in get_args(annotation) if arg is not type(None)]
+    annotation = types[0] if types else annotation
+    return {int: "int", float: "float", datetime: "datetime"}.get(annotation, "str")
+
+
+# Flattened match_stats: one column per field of the FACEIT stats model
+STATS_FIELDS = {
+    name: field.alias or name
+    for name, field in PlayerStats.model_fields.items()
+    if name != "match_id"
+}
+
+# Columns of each snapshot table with their logical types
+SNAPSHOT_TABLES: dict[str, dict[str, str]] = {
+    "player_stats": {
+        "stat_id": "int",
+        "match_id": "int",
+        "player_id": "int",
+        **{
+            name: column_type(PlayerStats.model_fields[name].annotation)
+            for name in STATS_FIELDS
+        },
+    },
+    "matches": {
+        "match_id": "int",
+        "date": "datetime",
+        "status": "str",
+        "best_of": "int",
+        "tournament_id": "int",
+        "tournament": "str",
+        "description": "str",
+        "original_source": "str",
+    },
+    "map_result_info": {
+        "match_id": "int",
+        "map": "str",
+        "first_team": "str",
+        "second_team": "str",
+        "first_half_score_first_team": "int",
+        "second_half_score_first_team": "int",
+        "overtime_score_first_team": "int",
+        "total_score_first_team": "int",
+        "first_half_score_second_team": "int",
+        "second_half_score_second_team": "int",
+        "overtime_score_second_team": "int",
+        "total_score_second_team": "int",
+    },
+    "map_pick_ban_info": {
+        "match_id": "int",
+        "map": "str",
+        "map_status": "str",
+        "initiator": "str",
+    },
+}
+
+
+def plain(value):
+    """
+    Store enums by value, like the API returns them.
+    """
+    return getattr(value, "value", value)
+
+
+async def get_new_completed_match_ids(
+    session: AsyncSession,
+    exported_ids: Iterable[int],
+) -> list[int]:
+    """
+    Return the completed matches that are not in a snapshot yet, oldest first.
+    """
+    completed = await session.scalars(
+        select(TableMatch.id)
+        .where(TableMatch.status == MatchStatus.COMPLETED)
+        .order_by(TableMatch.id)
+    )
+    exported_ids = set(exported_ids)
+    return [match_id for match_id in completed if match_id not in exported_ids]
+
+
+async def get_snapshot_columns(
+    session: AsyncSession,
+    match_ids: list[int],
+) -> dict[str, dict[str, list]]:
+    """
+    Read the rows of the given matches in every snapshot table, as columns.
+    """
+    columns = {
+        table: {column: [] for column in spec}
+        for table, spec in SNAPSHOT_TABLES.items()
+    }
+
+    # Player stats, with match_stats flattened into one column per field
+    stats = columns["player_stats"]
+    rows = await session.execute(
+        select(
+            TableMatchStats.id,
+            TableMatchStats.match_id,
+            TableMatchStats.player_id,
+            TableMatchStats.match_stats,
+        )
+        .where(TableMatchStats.match_id.in_(match_ids))
+        .order_by(TableMatchStats.id)
+    )
+    for stat_id, match_id, player_id, match_stats in rows:
+        stats["stat_id"].append(stat_id)
+        stats["match_id"].append(match_id)
+        stats["player_id"].append(player_id)
+        for name, key in STATS_FIELDS.items():
+            stats[name].append(match_stats.get(key))
+
+    matches = columns["matches"]
+    rows = await session.execute(
+        select(
+            TableMatch.id,
+            TableMatch.date,
+            TableMatch.status,
+            TableMatch.best_of,
+            TableMatch.tournament_id,
+            TableTournament.name,
+            TableMatch.description,
+            TableMatch.original_source,
+        )
+        .join(TableTournament, TableTournament.id == TableMatch.tournament_id)
+        .where(TableMatch.id.in_(match_ids))
+        .order_by(TableMatch.id)
+    )
+    for row in rows:
+        for column, value in zip(matches, row):
+            matches[column].append(plain(value))
+
+    # Map results and vetoes have the same column names as their tables
+    for table, model in (
+        ("map_result_info", TableMapResultInfo),
+        ("map_pick_ban_info", TableMapPickBanInfo),
+    ):
+        table_columns = columns[table]
+        rows = await session.execute(
+            select(*(getattr(model, column) for column in table_columns))
+            .where(model.match_id.in_(match_ids))
+            .order_by(model.id)
+        )
+        for row in rows:
+            for column, value in zip(table_columns, row):
+                table_columns[column].append(plain(value))
+
+    return columns
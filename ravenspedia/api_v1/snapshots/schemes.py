@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+# Define the schema describing a snapshot file
+class SnapshotInfo(BaseModel):
+    table: str
+    name: str
+    url: str  # Where the file is served, with range support
+    rows: int
+    size: int
+    matches: int
+    created_at: datetime
@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.api_v1.auth.dependencies import get_current_admin_user
+from ravenspedia.core import TableUser, db_helper
+from ravenspedia.core.config import snapshot_settings
+from .schemes import SnapshotInfo
+from .writer import SnapshotFile, read_manifest, take_snapshot
+
+router = APIRouter(tags=["Snapshots"])
+
+# Content types of the snapshot files
+MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+
+# Convert a SnapshotFile to SnapshotInfo schema for API output.
+def file_to_response_form(file: SnapshotFile) -> SnapshotInfo:
+    return SnapshotInfo(
+        table=file.table,
+        name=file.name,
+        url=f"/snapshots/{file.table}/{file.name}",
+        rows=file.rows,
+        size=file.size,
+        matches=file.matches,
+        created_at=file.created_at,
+    )
+
+
+# Define an endpoint to list the snapshot files, oldest first
+@router.get(
+    "/",
+    response_model=list[SnapshotInfo],
+    status_code=status.HTTP_200_OK,
+)
+async def get_snapshots() -> list[SnapshotInfo]:
+    manifest = await run_in_threadpool(read_manifest, snapshot_settings.directory)
+    return [file_to_response_form(file) for file in manifest.files]
+
+
+# Define an endpoint to snapshot the matches completed since the last snapshot
+@router.post(
+    "/",
+    response_model=list[SnapshotInfo],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_snapshot(
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    admin: TableUser = Depends(get_current_admin_user),  # Ensure user is admin.
+) -> list[SnapshotInfo]:
+    files = await take_snapshot(session)
+    return [file_to_response_form(file) for file in files]
+
+
+# Define an endpoint to download a snapshot file, ranges are supported
+@router.get(
+    "/{table}/{file_name}",
+    response_class=FileResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_snapshot_file(
+    table: str,
+    file_name: str,
+) -> FileResponse:
+    # Only files listed in the manifest are served, never an arbitrary path
+    manifest = await run_in_threadpool(read_manifest, snapshot_settings.directory)
+    if not any(
+        file.table == table and file.name == file_name for file in manifest.files
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Snapshot file {table}/{file_name} not found",
+        )
+
+    extension = file_name.rpartition(".")[2]
+    return FileResponse(
+        snapshot_settings.directory / table / file_name,
+        media_type=MEDIA_TYPES.get(extension, "application/octet-stream"),
+        filename=f"{table}-{file_name}",
+    )
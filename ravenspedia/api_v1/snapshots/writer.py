@@ -0,0 +1,228 @@
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core.config import snapshot_settings
+from .crud import SNAPSHOT_TABLES, get_new_completed_match_ids, get_snapshot_columns
+
+try:  # pyarrow is optional, snapshots cannot be written without it
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# File extension of each snapshot format
+EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+
+# Held while a snapshot is written, by the scheduler or by an admin
+_snapshot_lock = threading.Lock()
+
+
+# A file written by a snapshot, listed in the manifest
+@dataclass
+class SnapshotFile:
+    table: str  # Snapshot table, e.g. "player_stats"
+    name: str  # File name inside the directory of the table
+    rows: int  # Number of rows in the file
+    size: int  # Size of the file in bytes
+    matches: int  # Number of matches whose rows the file holds
+    created_at: str  # Time of the snapshot, in ISO format
+
+
+# Manifest of the snapshot directory: the files and the matches they hold
+@dataclass
+class SnapshotManifest:
+    match_ids: list[int] = field(default_factory=list)
+    files: list[SnapshotFile] = field(default_factory=list)
+
+
+def manifest_path(directory: Path) -> Path:
+    return directory / "manifest.json"
+
+
+def read_manifest(directory: Path) -> SnapshotManifest:
+    """
+    Read the manifest of a snapshot directory, empty before the first snapshot.
+    """
+    path = manifest_path(directory)
+    if not path.exists():
+        return SnapshotManifest()
+    data = json.loads(path.read_text())
+    return SnapshotManifest(
+        match_ids=data["match_ids"],
+        files=[SnapshotFile(**file) for file in data["files"]],
+    )
+
+
+def write_manifest(directory: Path, manifest: SnapshotManifest) -> None:
+    """
+    Replace the manifest atomically, readers never see a partial one.
+    """
+    path = manifest_path(directory)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(asdict(manifest)))
+    os.replace(temporary, path)
+
+
+def arrow_schema(table: str):
+    """
+    Arrow schema of a snapshot table, fixed so that every part can be read as one
+    dataset even when a column only holds nulls.
+    """
+    types = {
+        "int": pyarrow.int64(),
+        "float": pyarrow.float64(),
+        "str": pyarrow.string(),
+        "datetime": pyarrow.timestamp("us"),
+    }
+    return pyarrow.schema(
+        [(column, types[kind]) for column, kind in SNAPSHOT_TABLES[table].items()]
+    )
+
+
+def open_writer(path: Path, table: str, file_format: str):
+    """
+    Open a writer appending record batches to a Parquet or Arrow IPC file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    schema = arrow_schema(table)
+    if file_format == "parquet":
+        return pyarrow.parquet.ParquetWriter(path, schema)
+    return pyarrow.ipc.new_file(str(path), schema)
+
+
+def write_batch(writer, table: str, columns: dict[str, list]) -> int:
+    """
+    Encode the columns of a batch and append them to the file of a table.
+    """
+    batch = pyarrow.Table.from_pydict(columns, schema=arrow_schema(table))
+    writer.write_table(batch)
+    return batch.num_rows
+
+
+def close_part_files(writers: dict, paths: dict[str, Path], complete: bool) -> None:
+    """
+    Close the temporary files of a snapshot, removing them unless it is complete.
+    """
+    try:
+        for writer in writers.values():
+            writer.close()
+    finally:
+        if not complete:
+            for path in paths.values():
+                path.unlink(missing_ok=True)
+
+
+def publish_part_files(
+    paths: dict[str, Path],
+    name: str,
+    rows: dict[str, int],
+    matches: int,
+    created_at: datetime,
+) -> list[SnapshotFile]:
+    """
+    Give the complete temporary files their final name.
+    """
+    files = []
+    for table, path in paths.items():
+        os.replace(path, path.with_name(name))
+        files.append(
+            SnapshotFile(
+                table=table,
+                name=name,
+                rows=rows[table],
+                size=path.with_name(name).stat().st_size,
+                matches=matches,
+                created_at=created_at.isoformat(),
+            )
+        )
+    return files
+
+
+async def take_snapshot(session: AsyncSession) -> list[SnapshotFile]:
+    """
+    Append the matches completed since the last snapshot to the snapshot files:
+    one new file per table, written batch by batch and listed in the manifest.
+    """
+    if pyarrow is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Snapshots require the pyarrow package",
+        )
+    if snapshot_settings.format not in EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unknown snapshot format: {snapshot_settings.format}",
+        )
+
+    if not _snapshot_lock.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A snapshot is already being written",
+        )
+    try:
+        return await write_snapshot(
+            session=session,
+            directory=snapshot_settings.directory,
+            file_format=snapshot_settings.format,
+            batch_size=snapshot_settings.batch_size,
+        )
+    finally:
+        _snapshot_lock.release()
+
+
+async def write_snapshot(
+    session: AsyncSession,
+    directory: Path,
+    file_format: str,
+    batch_size: int,
+) -> list[SnapshotFile]:
+    """
+    Write the new completed matches to one new file per table. Encoding and file
+    access run in the thread pool, so the event loop keeps serving requests.
+    """
+    manifest = await run_in_threadpool(read_manifest, directory)
+    match_ids = await get_new_completed_match_ids(session, manifest.match_ids)
+    if not match_ids:
+        return []
+
+    created_at = datetime.now()
+    name = f"part-{created_at:%Y%m%dT%H%M%S%f}.{EXTENSIONS[file_format]}"
+    paths, writers, rows = {}, {}, dict.fromkeys(SNAPSHOT_TABLES, 0)
+    complete = False
+    try:
+        for table in SNAPSHOT_TABLES:
+            # Written under a temporary name, renamed once complete
+            paths[table] = directory / table / f".{name}.tmp"
+            writers[table] = await run_in_threadpool(
+                open_writer, paths[table], table, file_format
+            )
+
+        for start in range(0, len(match_ids), batch_size):
+            columns = await get_snapshot_columns(
+                session, match_ids[start : start + batch_size]
+            )
+            for table, table_columns in columns.items():
+                rows[table] += await run_in_threadpool(
+                    write_batch, writers[table], table, table_columns
+                )
+        complete = True
+    finally:
+        # A failed snapshot leaves no temporary file behind
+        await run_in_threadpool(close_part_files, writers, paths, complete)
+
+    files = await run_in_threadpool(
+        publish_part_files, paths, name, rows, len(match_ids), created_at
+    )
+    manifest.match_ids.extend(match_ids)
+    manifest.files.extend(files)
+    await run_in_threadpool(write_manifest, directory, manifest)
+    return files
@@ -0,0 +1,13 @@
+# Data for export
+__all__ = (
+    "BenchScale",
+    "SCALES",
+    "generate_dataset",
+    "DEFAULT_MIX",
+    "RouteReport",
+    "run_load",
+    "format_report",
+)
+
+from .generator import BenchScale, SCALES, generate_dataset
+from .load import DEFAULT_MIX, RouteReport, run_load, format_report
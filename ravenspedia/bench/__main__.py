@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+
+from ravenspedia.core import DatabaseHelper
+from ravenspedia.core.config import bench_settings
+from .generator import SCALES, generate_dataset
+from .load import DEFAULT_MIX, format_report, run_load
+
+
+def parse_route(value: str) -> tuple[str, int]:
+    """
+    Parse a "ROUTE=WEIGHT" command line argument.
+    """
+    route, _, weight = value.rpartition("=")
+    if not route or not weight.isdigit():
+        raise argparse.ArgumentTypeError(f"Expected ROUTE=WEIGHT, got {value}")
+    return route, int(weight)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m ravenspedia.bench",
+        description="Generate a synthetic dataset and measure the API under load.",
+    )
+    parser.add_argument("--db-url", default=bench_settings.db_url)
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--seed", type=int, default=bench_settings.seed)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="(Re)create the dataset")
+    generate.add_argument(
+        "--no-documents",
+        action="store_true",
+        help="Skip precomputing the match documents",
+    )
+
+    load = commands.add_parser("load", help="Replay an endpoint mix")
+    load.add_argument("--requests", type=int, default=1000)
+    load.add_argument("--concurrency", type=int, default=8)
+    load.add_argument(
+        "--route",
+        type=parse_route,
+        action="append",
+        help=f"ROUTE=WEIGHT, repeatable (default: {len(DEFAULT_MIX)} read routes)",
+    )
+    load.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the response cache to measure the handlers themselves",
+    )
+
+    args = parser.parse_args()
+    helper = DatabaseHelper(url=args.db_url)
+    scale = SCALES[args.scale]
+
+    if args.command == "generate":
+        asyncio.run(
+            generate_dataset(
+                helper=helper,
+                scale=scale,
+                seed=args.seed,
+                documents=not args.no_documents,
+            )
+        )
+        print(
+            f"Generated {scale.players} players, {scale.teams} teams, "
+            f"{scale.tournaments} tournaments, {scale.matches} matches "
+            f"and {scale.stats} stats rows"
+        )
+    else:
+        reports = asyncio.run(
+            run_load(
+                scale=scale,
+                helper=helper,
+                mix=dict(args.route) if args.route else None,
+                total_requests=args.requests,
+                concurrency=args.concurrency,
+                seed=args.seed,
+                use_cache=not args.no_cache,
+            )
+        )
+        print(format_report(reports))
+
+
+if __name__ == "__main__":
+    main()
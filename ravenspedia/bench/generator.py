@@ -0,0 +1,407 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.api_v1.project_classes.map_stats import recalculate_map_meta_stats
+from ravenspedia.api_v1.project_classes.match.documents import (
+    refresh_match_documents,
+)
+from ravenspedia.api_v1.project_classes.team_stats.crud import (
+    recalculate_team_map_stats,
+)
+from ravenspedia.core import (
+    Base,
+    TableMatch,
+    TableMatchStats,
+    TableMapResultInfo,
+    TablePlayer,
+    TableTeam,
+    TableTournament,
+    TeamMatchAssociation,
+    TeamTournamentAssociation,
+    PlayerTournamentAssociation,
+    MapName,
+    MatchStatus,
+    TournamentStatus,
+    DatabaseHelper,
+)
+from ravenspedia.core.config import bench_settings
+
+
+# Number of rows of each kind created by the generator
+@dataclass(frozen=True)
+class BenchScale:
+    players: int
+    teams: int
+    tournaments: int
+    matches: int
+    teams_per_tournament: int = 16  # Teams registered in each tournament
+    best_of: int = 1  # Maps played in each match
+
+    @property
+    def players_per_team(self) -> int:
+        return self.players // self.teams
+
+    @property
+    def stats(self) -> int:
+        # One stats row per player of both teams on every map
+        return self.matches * self.best_of * 2 * self.players_per_team
+
+
+# Predefined dataset sizes, "full" is the production-like volume
+SCALES = {
+    "tiny": BenchScale(
+        players=40,
+        teams=8,
+        tournaments=2,
+        matches=20,
+        teams_per_tournament=4,
+    ),
+    "small": BenchScale(players=1_000, teams=200, tournaments=50, matches=5_000),
+    "full": BenchScale(players=10_000, teams=2_000, tournaments=500, matches=50_000),
+}
+
+# Date of the first generated tournament
+START_DATE = datetime(2020, 1, 1)
+
+# Length of every generated tournament
+TOURNAMENT_LENGTH = timedelta(days=10)
+
+
+def player_nickname(index: int) -> str:
+    """
+    Nickname of the generated player with the given index.
+    """
+    return f"player_{index:05d}"
+
+
+def team_name(index: int) -> str:
+    """
+    Name of the generated team with the given index.
+    """
+    return f"Team {index:04d}"
+
+
+def tournament_name(index: int) -> str:
+    """
+    Name of the generated tournament with the given index.
+    """
+    return f"Tournament {index:03d}"
+
+
+def make_player_stats(
+    rng: random.Random,
+    nickname: str,
+    match_id: int,
+    round_of_match: int,
+    map_name: str,
+    won: bool,
+    rounds: int,
+) -> dict:
+    """
+    Build the FACEIT-shaped stats of a player on one map, as stored in match_stats.
+    """
+    kills = max(0, round(rng.gauss(0.7 * rounds, 5)))
+    deaths = max(1, round(rng.gauss(0.68 * rounds, 4)))
+    assists = max(0, round(rng.gauss(0.15 * rounds, 2)))
+    headshots = round(kills * rng.uniform(0.3, 0.7))
+    damage = round(kills * rng.uniform(85, 110) + assists * 30)
+    double = rng.randint(0, kills // 4)
+    triple = rng.randint(0, double // 2)
+    quadro = rng.randint(0, triple // 2)
+    penta = rng.randint(0, quadro)
+    count_1v1 = rng.randint(0, 4)
+    count_1v2 = rng.randint(0, 3)
+    wins_1v1 = rng.randint(0, count_1v1)
+    wins_1v2 = rng.randint(0, count_1v2)
+    entry_count = rng.randint(0, 8)
+    entry_wins = rng.randint(0, entry_count)
+    sniper_kills = rng.randint(0, kills // 3)
+    utility_count = rng.randint(5, 25)
+    utility_successes = rng.randint(0, utility_count)
+    utility_damage = rng.randint(0, 400)
+    flash_count = rng.randint(0, 15)
+    flash_successes = rng.randint(0, flash_count)
+    enemies_flashed = rng.randint(flash_successes, flash_successes * 2)
+
+    return {
+        "nickname": nickname,
+        "round_of_match": round_of_match,
+        "match_id": match_id,
+        "map": map_name,
+        "Result": int(won),
+        "Kills": kills,
+        "Assists": assists,
+        "Deaths": deaths,
+        "ADR": round(damage / rounds, 1),
+        "Headshots %": round(100 * headshots / kills) if kills else 0,
+        "MVPs": rng.randint(0, 6),
+        "Damage": damage,
+        "Headshots": headshots,
+        "K/D Ratio": round(kills / deaths, 2),
+        "K/R Ratio": round(kills / rounds, 2),
+        "Double Kills": double,
+        "Triple Kills": triple,
+        "Quadro Kills": quadro,
+        "Penta Kills": penta,
+        "Clutch Kills": rng.randint(0, 4),
+        "1v1Count": count_1v1,
+        "1v2Count": count_1v2,
+        "1v1Wins": wins_1v1,
+        "1v2Wins": wins_1v2,
+        "Match 1v1 Win Rate": round(wins_1v1 / count_1v1, 2) if count_1v1 else 0.0,
+        "Match 1v2 Win Rate": round(wins_1v2 / count_1v2, 2) if count_1v2 else 0.0,
+        "First Kills": rng.randint(0, entry_wins + 2),
+        "Entry Count": entry_count,
+        "Entry Wins": entry_wins,
+        "Match Entry Rate": round(entry_count / rounds, 2),
+        "Match Entry Success Rate": (
+            round(entry_wins / entry_count, 2) if entry_count else 0.0
+        ),
+        "Sniper Kills": sniper_kills,
+        "Sniper Kill Rate per Round": round(sniper_kills / rounds, 2),
+        "Sniper Kill Rate per Match": round(sniper_kills / rounds, 2),
+        "Pistol Kills": float(rng.randint(0, 4)),
+        "Knife Kills": rng.randint(0, 1),
+        "Zeus Kills": float(rng.randint(0, 1)),
+        "Utility Count": utility_count,
+        "Utility Successes": utility_successes,
+        "Utility Enemies": rng.randint(0, utility_successes * 2),
+        "Utility Damage": utility_damage,
+        "Utility Usage per Round": round(utility_count / rounds, 2),
+        "Utility Damage Success Rate per Match": round(rng.uniform(0, 1), 2),
+        "Utility Success Rate per Match": round(utility_successes / utility_count, 2),
+        "Utility Damage per Round in a Match": round(utility_damage / rounds, 2),
+        "Flash Count": flash_count,
+        "Enemies Flashed": enemies_flashed,
+        "Flash Successes": flash_successes,
+        "Flashes per Round in a Match": round(flash_count / rounds, 2),
+        "Enemies Flashed per Round in a Match": round(enemies_flashed / rounds, 2),
+        "Flash Success Rate per Match": (
+            round(flash_successes / flash_count, 2) if flash_count else 0.0
+        ),
+    }
+
+
+def make_map_score(rng: random.Random) -> tuple[tuple[int, int], tuple[int, int]]:
+    """
+    Build the half scores of a regulation map as ((first team), (second team)).
+    """
+    winner_first_half = rng.randint(3, 9)
+    loser_first_half = 12 - winner_first_half
+    winner_second_half = 13 - winner_first_half
+    # The loser has at most 11 rounds and the second half at most 12 rounds
+    loser_second_half = rng.randint(0, winner_first_half - 1)
+    winner = (winner_first_half, winner_second_half)
+    loser = (loser_first_half, loser_second_half)
+    return (winner, loser) if rng.random() < 0.5 else (loser, winner)
+
+
+async def insert_rows(
+    session: AsyncSession,
+    model: type[Base],
+    rows: Iterable[dict],
+) -> None:
+    """
+    Insert rows of a model with ORM bulk INSERTs of batch_size rows each.
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == bench_settings.batch_size:
+            await session.execute(insert(model), batch)
+            batch = []
+    if batch:
+        await session.execute(insert(model), batch)
+
+
+async def generate_dataset(
+    helper: DatabaseHelper,
+    scale: BenchScale,
+    seed: int = bench_settings.seed,
+    documents: bool = True,
+) -> None:
+    """
+    Recreate the database with a reproducible synthetic dataset of the given scale.
+    """
+    rng = random.Random(seed)
+    maps = [map_name for map_name in MapName]
+    per_team = scale.players_per_team
+    matches_per_tournament = scale.matches // scale.tournaments
+
+    async with helper.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with helper.session_factory() as session:
+        # Teams with a full roster each
+        await insert_rows(
+            session,
+            TableTeam,
+            (
+                {
+                    "id": team_id,
+                    "name": team_name(team_id),
+                    "max_number_of_players": per_team,
+                    "average_faceit_elo": None,
+                }
+                for team_id in range(1, scale.teams + 1)
+            ),
+        )
+        await insert_rows(
+            session,
+            TablePlayer,
+            (
+                {
+                    "id": player_id,
+                    "nickname": player_nickname(player_id),
+                    "steam_id": f"7656119{player_id:010d}",
+                    "faceit_elo": rng.randint(500, 3500),
+                    "team_id": (player_id - 1) // per_team + 1,
+                }
+                for player_id in range(1, scale.players + 1)
+            ),
+        )
+
+        # Tournaments following each other, with a random subset of the teams
+        tournament_teams = {}
+        tournaments = []
+        for tournament_id in range(1, scale.tournaments + 1):
+            start = START_DATE + (tournament_id - 1) * TOURNAMENT_LENGTH
+            tournaments.append(
+                {
+                    "id": tournament_id,
+                    "name": tournament_name(tournament_id),
+                    "max_count_of_teams": scale.teams_per_tournament,
+                    "prize": f"{rng.randint(1, 100) * 100}$",
+                    "status": TournamentStatus.COMPLETED,
+                    "start_date": start,
+                    "end_date": start + TOURNAMENT_LENGTH,
+                }
+            )
+            tournament_teams[tournament_id] = rng.sample(
+                range(1, scale.teams + 1),
+                scale.teams_per_tournament,
+            )
+        await insert_rows(session, TableTournament, tournaments)
+        await insert_rows(
+            session,
+            TeamTournamentAssociation,
+            (
+                {"team_id": team_id, "tournament_id": tournament_id}
+                for tournament_id, team_ids in tournament_teams.items()
+                for team_id in team_ids
+            ),
+        )
+        await insert_rows(
+            session,
+            PlayerTournamentAssociation,
+            (
+                {"player_id": player_id, "tournament_id": tournament_id}
+                for tournament_id, team_ids in tournament_teams.items()
+                for team_id in team_ids
+                for player_id in range(
+                    (team_id - 1) * per_team + 1,
+                    team_id * per_team + 1,
+                )
+            ),
+        )
+
+        # Matches between two teams of a tournament, with results and stats
+        matches, team_links, results, stats = [], [], [], []
+        for match_id in range(1, scale.matches + 1):
+            tournament_id = min(
+                (match_id - 1) // matches_per_tournament + 1,
+                scale.tournaments,
+            )
+            first_team, second_team = rng.sample(tournament_teams[tournament_id], 2)
+            start = tournaments[tournament_id - 1]["start_date"]
+            matches.append(
+                {
+                    "id": match_id,
+                    "tournament_id": tournament_id,
+                    "best_of": scale.best_of,
+                    "max_number_of_teams": 2,
+                    "max_number_of_players": 2 * per_team,
+                    "date": start + timedelta(minutes=rng.randrange(14400)),
+                    "status": MatchStatus.COMPLETED,
+                }
+            )
+            team_links += [
+                {"team_id": first_team, "match_id": match_id},
+                {"team_id": second_team, "match_id": match_id},
+            ]
+
+            for round_of_match, map_name in enumerate(
+                rng.sample(maps, scale.best_of), start=1
+            ):
+                first_score, second_score = make_map_score(rng)
+                results.append(
+                    {
+                        "match_id": match_id,
+                        "map": map_name,
+                        "first_team": team_name(first_team),
+                        "second_team": team_name(second_team),
+                        "first_team_id": first_team,
+                        "second_team_id": second_team,
+                        "first_half_score_first_team": first_score[0],
+                        "second_half_score_first_team": first_score[1],
+                        "overtime_score_first_team": 0,
+                        "total_score_first_team": sum(first_score),
+                        "first_half_score_second_team": second_score[0],
+                        "second_half_score_second_team": second_score[1],
+                        "overtime_score_second_team": 0,
+                        "total_score_second_team": sum(second_score),
+                    }
+                )
+                rounds = sum(first_score) + sum(second_score)
+                for team_id, won in (
+                    (first_team, sum(first_score) > sum(second_score)),
+                    (second_team, sum(second_score) > sum(first_score)),
+                ):
+                    for player_id in range(
+                        (team_id - 1) * per_team + 1,
+                        team_id * per_team + 1,
+                    ):
+                        stats.append(
+                            {
+                                "player_id": player_id,
+                                "match_id": match_id,
+                                "match_stats": make_player_stats(
+                                    rng,
+                                    player_nickname(player_id),
+                                    match_id,
+                                    round_of_match,
+                                    map_name.value,
+                                    won,
+                                    rounds,
+                                ),
+                            }
+                        )
+
+            # Flush periodically to keep the memory bounded
+            if len(stats) >= bench_settings.batch_size:
+                await insert_rows(session, TableMatch, matches)
+                await insert_rows(session, TeamMatchAssociation, team_links)
+                await insert_rows(session, TableMapResultInfo, results)
+                await insert_rows(session, TableMatchStats, stats)
+                matches, team_links, results, stats = [], [], [], []
+
+        await insert_rows(session, TableMatch, matches)
+        await insert_rows(session, TeamMatchAssociation, team_links)
+        await insert_rows(session, TableMapResultInfo, results)
+        await insert_rows(session, TableMatchStats, stats)
+
+        # Derived data is computed by the application code itself
+        await recalculate_team_map_stats(session)
+        await recalculate_map_meta_stats(session)
+        await session.commit()
+
+        if documents:
+            match_ids = list(await session.scalars(select(TableMatch.id)))
+            for start in range(0, len(match_ids), 1000):
+                await refresh_match_documents(session, match_ids[start : start + 1000])
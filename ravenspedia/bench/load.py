@@ -0,0 +1,149 @@
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass
+
+from httpx import ASGITransport, AsyncClient
+
+from ravenspedia.api_v1.cache import response_cache
+from ravenspedia.core import db_helper, DatabaseHelper
+from ravenspedia.core.config import bench_settings, cache_settings
+from .generator import BenchScale, player_nickname, team_name, tournament_name
+
+# Default endpoint mix: route template -> relative weight.
+# Placeholders are replaced with random entities of the generated dataset.
+DEFAULT_MIX = {
+    "/players/{player}/": 20,
+    "/players/{player}/matches/": 15,
+    "/players/stats/{player}/": 10,
+    "/teams/{team}/": 10,
+    "/teams/stats/{team}/": 5,
+    "/tournaments/{tournament}/": 10,
+    "/matches/{match}/": 20,
+    "/search/?query={player}": 5,
+    "/schedules/matches/get_last_completed/": 5,
+}
+
+
+# Latency and throughput measured for one route template
+@dataclass
+class RouteReport:
+    route: str  # Route template, e.g. "/players/{player}/"
+    requests: int  # Number of requests sent
+    errors: int  # Number of responses with a status other than 200 or 304
+    p50: float  # Median latency in milliseconds
+    p95: float  # 95th percentile latency in milliseconds
+    p99: float  # 99th percentile latency in milliseconds
+    throughput: float  # Requests per second over the whole run
+
+
+def percentile(latencies: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of sorted latencies.
+    """
+    if not latencies:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(latencies))
+    return latencies[max(rank, 1) - 1]
+
+
+def fill_route(route: str, rng: random.Random, scale: BenchScale) -> str:
+    """
+    Replace the placeholders of a route template with random generated entities.
+    """
+    return route.format(
+        player=player_nickname(rng.randint(1, scale.players)),
+        team=team_name(rng.randint(1, scale.teams)),
+        tournament=tournament_name(rng.randint(1, scale.tournaments)),
+        match=rng.randint(1, scale.matches),
+    )
+
+
+async def run_load(
+    scale: BenchScale,
+    helper: DatabaseHelper,
+    mix: dict[str, int] | None = None,
+    total_requests: int = 1000,
+    concurrency: int = 8,
+    seed: int = bench_settings.seed,
+    use_cache: bool = True,
+) -> list[RouteReport]:
+    """
+    Replay a weighted mix of GET requests against the application in-process.
+    """
+    # Imported here so that the generator can be used without the whole application
+    from ravenspedia.main import app
+
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+
+    # The same seed always sends the same requests in the same order
+    routes = rng.choices(list(mix), weights=list(mix.values()), k=total_requests)
+    plan = [(route, fill_route(route, rng, scale)) for route in routes]
+    latencies = {route: [] for route in mix}
+    errors = {route: 0 for route in mix}
+
+    cache_enabled = cache_settings.enabled
+    cache_settings.enabled = use_cache
+    response_cache.clear()
+    app.dependency_overrides[db_helper.session_dependency] = helper.session_dependency
+
+    async def worker(client: AsyncClient, queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            route, url = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.get(url)
+            latencies[route].append((time.perf_counter() - start) * 1000)
+            if response.status_code not in (200, 304):
+                errors[route] += 1
+
+    queue = asyncio.Queue()
+    for request in plan:
+        queue.put_nowait(request)
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://bench",
+        ) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(worker(client, queue) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+    finally:
+        cache_settings.enabled = cache_enabled
+        app.dependency_overrides.pop(db_helper.session_dependency, None)
+
+    reports = []
+    for route, values in latencies.items():
+        values.sort()
+        reports.append(
+            RouteReport(
+                route=route,
+                requests=len(values),
+                errors=errors[route],
+                p50=percentile(values, 50),
+                p95=percentile(values, 95),
+                p99=percentile(values, 99),
+                throughput=len(values) / elapsed,
+            )
+        )
+    return reports
+
+
+def format_report(reports: list[RouteReport]) -> str:
+    """
+    Render the reports as a plain text table.
+    """
+    width = max([len("route")] + [len(report.route) for report in reports])
+    lines = [
+        f"{'route':<{width}} {'requests':>8} {'errors':>6} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}"
+    ]
+    for report in reports:
+        lines.append(
+            f"{report.route:<{width}} {report.requests:>8} {report.errors:>6} "
+            f"{report.p50:>8.2f} {report.p95:>8.2f} {report.p99:>8.2f} "
+            f"{report.throughput:>8.1f}"
+        )
+    return "\n".join(lines)
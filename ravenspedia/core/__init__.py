@@ -9,6 +9,7 @@ __all__ = (
     "TableTeam",
     "TableTournament",
     "TableMatchStats",
+    "TableMatchDocument",
     "TableUser",
     "TableToken",
     "TeamTournamentAssociation",
@@ -17,8 +18,14 @@ __all__ = (
     "TableNews",
     "TableMapResultInfo",
     "TableMapPickBanInfo",
+    "TableMapMetaStats",
+    "TablePlayerEloHistory",
+    "TableTeamEloHistory",
     "TableTeamMapStats",
+    "TableTeamVetoStats",
     "TableTournamentResult",
+    "TableTournamentSummary",
+    "TableChange",
     "MatchStatus",
     "TournamentStatus",
     "RoundInfo",
@@ -30,6 +37,7 @@ __all__ = (
     "GeneralPlayerStats",
     "MapStatus",
     "MapName",
+    "ChangeOperation",
 )
 
 from .associations_models import (
@@ -55,13 +63,21 @@ from .project_models import (
     TablePlayer,
     TableTournament,
     TableMatchStats,
+    TableMatchDocument,
     TableNews,
     TableMapResultInfo,
     TableMapPickBanInfo,
+    TableMapMetaStats,
+    TablePlayerEloHistory,
+    TableTeamEloHistory,
     TableTeamMapStats,
+    TableTeamVetoStats,
     TableTournamentResult,
+    TableTournamentSummary,
+    TableChange,
     MatchStatus,
     TournamentStatus,
     MapStatus,
     MapName,
+    ChangeOperation,
 )
@@ -56,6 +56,120 @@ class FaceitSettings:
     api_key = os.getenv("FACEIT_API_KEY")
 
 
+# Defines settings for the HTTP response cache
+class CacheSettings(BaseModel):
+    # Flag to enable/disable the server-side response cache
+    enabled: bool = True
+
+    # Maximum number of responses kept in the cache, the least recently used are evicted
+    max_entries: int = 1024
+
+    # Responses with a bigger body (in bytes) are not stored in the cache
+    max_entry_size: int = 2 * 1024 * 1024
+
+
+# Defines settings for coalescing concurrent identical GET requests
+class CoalescingSettings(BaseModel):
+    # Flag to enable/disable request coalescing
+    enabled: bool = True
+
+    # Route templates whose concurrent identical requests share one response
+    routes: list[str] = [
+        "/schedules/matches/get_last_completed/",
+        "/schedules/matches/get_upcoming_scheduled/",
+        "/schedules/matches/get_in_progress/",
+        "/matches/{match_id}/",
+    ]
+
+
+# Defines settings for the per-request database query statistics
+class QueryStatsSettings(BaseModel):
+    # Flag to enable/disable counting the queries of each request
+    enabled: bool = True
+
+    # Statements run at least this many times in one request are reported as N+1
+    repeated_threshold: int = 5
+
+
+# Defines settings for the synthetic data generator and the load benchmark
+class BenchSettings(BaseModel):
+    # Database filled by the generator, kept apart from the real and test databases
+    db_url: str = f"sqlite+aiosqlite:///{BASE_DIR}/bench.sqlite3"
+
+    # Seed of the random generators, the same seed always produces the same data
+    seed: int = 42
+
+    # Number of rows sent to the database in one INSERT
+    batch_size: int = 5000
+
+
+# Defines settings for the Prometheus metrics
+class MetricsSettings(BaseModel):
+    # Flag to enable/disable recording the latency of each request
+    enabled: bool = True
+
+
+# Defines settings for the streaming exports
+class ExportSettings(BaseModel):
+    # Number of rows fetched from the database and encoded at a time
+    batch_size: int = 1000
+
+    # Compression level of the gzip-encoded exports (1 is fastest, 9 is smallest)
+    gzip_level: int = 6
+
+
+# Defines settings for the columnar snapshots of the match data
+class SnapshotSettings(BaseModel):
+    # Directory of the snapshot files and of their manifest
+    directory: Path = BASE_DIR / "snapshots"
+
+    # File format of the snapshots: "parquet" or "arrow" (Arrow IPC)
+    format: str = "parquet"
+
+    # Interval between two scheduled snapshots
+    interval_minutes: int = 60
+
+    # Number of matches read from the database and written at a time
+    batch_size: int = 500
+
+
+# Defines settings for the live stream of match updates
+class LiveSettings(BaseModel):
+    # Events buffered for a slow viewer before it is sent a new snapshot instead
+    queue_size: int = 256
+
+    # Seconds without events after which a keep-alive comment is sent
+    heartbeat_seconds: float = 15.0
+
+
+# Defines settings for the summaries of completed tournaments
+class TournamentSummarySettings(BaseModel):
+    # Field of GeneralPlayerStats the MVP of a tournament is chosen by
+    mvp_metric: str = "kd_ratio"
+
+    # Players with fewer matches in the tournament cannot be its MVP
+    mvp_min_matches: int = 1
+
+
+# Defines settings for the on-demand request profiler
+class ProfilingSettings(BaseModel):
+    # Time between two samples of the stack of a profiled request
+    interval_ms: float = 5.0
+
+    # Rolling capture: profile 1 in sample_every requests (0 disables it)
+    sample_every: int = 0
+
+    # Route templates sampled by the rolling capture (empty for every route)
+    routes: list[str] = []
+
+    # Rolling profiles faster than this are not kept
+    min_duration_ms: float = 0.0
+
+    # Number of explicit profiles and of slowest rolling profiles kept in memory
+    keep_recent: int = 20
+    keep_worst: int = 20
+
+
 # Defines test data for use in automated tests
 class DataForTests:
     # Steam IDs for test players, loaded from environment variables
@@ -97,3 +211,33 @@ data_for_tests = DataForTests()
 
 # Initialize the JWT authentication settings instance
 auth_settings = AuthJWT()
+
+# Initialize the HTTP response cache settings instance
+cache_settings = CacheSettings()
+
+# Initialize the request coalescing settings instance
+coalescing_settings = CoalescingSettings()
+
+# Initialize the query statistics settings instance
+query_stats_settings = QueryStatsSettings()
+
+# Initialize the benchmark settings instance
+bench_settings = BenchSettings()
+
+# Initialize the metrics settings instance
+metrics_settings = MetricsSettings()
+
+# Initialize the profiler settings instance
+profiling_settings = ProfilingSettings()
+
+# Initialize the export settings instance
+export_settings = ExportSettings()
+
+# Initialize the snapshot settings instance
+snapshot_settings = SnapshotSettings()
+
+# Initialize the live stream settings instance
+live_settings = LiveSettings()
+
+# Initialize the tournament summary settings instance
+tournament_summary_settings = TournamentSummarySettings()
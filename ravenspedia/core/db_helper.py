@@ -46,6 +46,11 @@ class DatabaseHelper:
             yield session  # Yield the session for use in a context manager
             await session.close()  # Ensure the session is closed after use
 
+    # Method providing the session factory as a dependency, for streamed responses
+    # whose body is sent after the dependencies with yield have finished
+    def session_factory_dependency(self) -> async_sessionmaker[AsyncSession]:
+        return self.session_factory
+
 
 # Initialize DatabaseHelper instance for the main application
 db_helper = DatabaseHelper(
@@ -4,17 +4,28 @@ __all__ = (
     "TableTeam",
     "TableTournament",
     "TableMatchStats",
+    "TableMatchDocument",
     "TableNews",
     "TableMapResultInfo",
     "TableMapPickBanInfo",
+    "TableMapMetaStats",
+    "TablePlayerEloHistory",
+    "TableTeamEloHistory",
     "TableTeamMapStats",
+    "TableTeamVetoStats",
     "TableTournamentResult",
+    "TableTournamentSummary",
+    "TableChange",
+    "ChangeOperation",
     "MatchStatus",
     "TournamentStatus",
     "MapStatus",
     "MapName",
 )
 
+from .table_change import TableChange, ChangeOperation
+from .table_elo_history import TablePlayerEloHistory, TableTeamEloHistory
+from .table_map_meta_stats import TableMapMetaStats
 from .table_match import TableMatch, MatchStatus
 from .table_match_info import (
     TableMapResultInfo,
@@ -23,9 +34,11 @@ from .table_match_info import (
     MapName,
 )
 from .table_match_stats import TableMatchStats
+from .table_match_document import TableMatchDocument
 from .table_news import TableNews
 from .table_player import TablePlayer
 from .table_team import TableTeam
-from .table_team_stats import TableTeamMapStats
+from .table_team_stats import TableTeamMapStats, TableTeamVetoStats
 from .table_tournament import TableTournament, TournamentStatus
 from .table_tournament_results import TableTournamentResult
+from .table_tournament_summary import TableTournamentSummary
@@ -0,0 +1,40 @@
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Index, String, func, Enum as SQLAlchemyEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ravenspedia.core import Base
+
+
+# Enum to represent the kinds of change recorded in the change log
+class ChangeOperation(Enum):
+    INSERT = "INSERT"  # The entity was created
+    UPDATE = "UPDATE"  # The entity or one of its parts was modified
+    DELETE = "DELETE"  # The entity was deleted
+
+
+# Defines the append-only change log read by the change feed
+class TableChange(Base):
+    __tablename__ = "changes"  # Name of the table in the database
+
+    # Index to find the last version of an entity
+    __table_args__ = (Index("index_changes_entity", "entity", "entity_id", "version"),)
+
+    # Kind of entity that changed, e.g. "match" or "player"
+    entity: Mapped[str] = mapped_column(String(20))
+
+    # ID of the entity that changed
+    entity_id: Mapped[int]
+
+    # What happened to the entity
+    operation: Mapped[ChangeOperation] = mapped_column(SQLAlchemyEnum(ChangeOperation))
+
+    # Number of changes of the entity so far, this one included
+    version: Mapped[int]
+
+    # Date and time of the change
+    changed_at: Mapped[datetime] = mapped_column(
+        default=datetime.now,
+        server_default=func.now(),
+    )
@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ravenspedia.core import Base
+
+
+# Defines the PlayerEloHistory table, one row per change of the Faceit ELO of a player
+class TablePlayerEloHistory(Base):
+    __tablename__ = "player_elo_history"  # Name of the table in the database
+
+    # Index used to read the curve of a player over a time range
+    __table_args__ = (Index("index_player_elo_history_player_ts", "player_id", "ts"),)
+
+    # Foreign key linking to the player
+    player_id: Mapped[int] = mapped_column(ForeignKey("players.id", ondelete="CASCADE"))
+
+    # Date and time of the refresh that recorded the new ELO
+    ts: Mapped[datetime] = mapped_column(nullable=False)
+
+    # The Faceit ELO of the player from this moment on
+    elo: Mapped[int] = mapped_column(nullable=False)
+
+
+# Defines the TeamEloHistory table, one row per change of the average Faceit ELO of a team
+class TableTeamEloHistory(Base):
+    __tablename__ = "team_elo_history"  # Name of the table in the database
+
+    # Index used to read the curve of a team over a time range
+    __table_args__ = (Index("index_team_elo_history_team_ts", "team_id", "ts"),)
+
+    # Foreign key linking to the team
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"))
+
+    # Date and time of the refresh that recorded the new average ELO
+    ts: Mapped[datetime] = mapped_column(nullable=False)
+
+    # The average Faceit ELO of the team players from this moment on
+    elo: Mapped[float] = mapped_column(nullable=False)
@@ -0,0 +1,53 @@
+from sqlalchemy import ForeignKey, Enum as SQLAlchemyEnum, Integer, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ravenspedia.core import Base
+from .table_match_info import MapName
+
+
+# Defines the MapMetaStats table, a rollup of the map results per tournament and map
+class TableMapMetaStats(Base):
+    __tablename__ = "map_meta_stats"  # Name of the table in the database
+
+    # Index used to read and update the rollup of a tournament on a map directly
+    __table_args__ = (
+        Index(
+            "index_unique_map_meta_stats",
+            "tournament_id",
+            "map",
+            unique=True,  # Ensures a single rollup entry per tournament and map
+        ),
+    )
+
+    # Foreign key linking to the tournament of the matches
+    tournament_id: Mapped[int] = mapped_column(
+        ForeignKey("tournaments.id", ondelete="CASCADE")
+    )
+
+    # The map the results were played on
+    map: Mapped[MapName] = mapped_column(
+        SQLAlchemyEnum(MapName),
+        nullable=False,
+    )
+
+    # Number of map results
+    played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Total number of rounds played, overtime included
+    rounds: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Number of maps that went to overtime
+    overtimes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Sum of the half swings: how much the round margin changed between the halves
+    half_swing: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Number of maps with a team leading after the first half
+    first_half_leads: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Number of maps won by the team leading after the first half
+    first_half_leader_wins: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
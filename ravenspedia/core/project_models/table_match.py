@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from .table_tournament import TableTournament
     from .table_match_stats import TableMatchStats
     from .table_match_info import TableMapResultInfo, TableMapPickBanInfo
+    from .table_match_document import TableMatchDocument
 
 
 # Enum to represent the possible statuses of a match
@@ -87,3 +88,9 @@ class TableMatch(Base):
         default=None,
         server_default="null",
     )
+
+    # Relationship to the precomputed response document of the match
+    document: Mapped["TableMatchDocument | None"] = relationship(
+        back_populates="match",  # Reverse relationship in TableMatchDocument
+        cascade="all, delete-orphan",  # Deletes the document if match is deleted
+    )
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, Integer, func, Text as TextType
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ravenspedia.core import Base
+
+# Type checking import to avoid circular dependencies
+if TYPE_CHECKING:
+    from .table_match import TableMatch
+
+
+# Defines the MatchDocument table storing the serialized API response of a match
+class TableMatchDocument(Base):
+    __tablename__ = "match_documents"  # Name of the table in the database
+
+    # Foreign key linking to the match, one document per match
+    match_id: Mapped[int] = mapped_column(
+        ForeignKey("matches.id", ondelete="CASCADE"),
+        unique=True,
+    )
+
+    # Relationship to the match this document describes
+    match: Mapped["TableMatch"] = relationship(back_populates="document")
+
+    # Version of the document, incremented every time its content changes
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+    )
+
+    # The ResponseMatch of the match, serialized to JSON
+    content: Mapped[str] = mapped_column(TextType(), nullable=False)
+
+    # Date and time of the last regeneration of the document
+    updated_at: Mapped[datetime] = mapped_column(
+        default=datetime.now,
+        server_default=func.now(),
+        onupdate=datetime.now,
+    )
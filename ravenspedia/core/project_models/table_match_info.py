@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, ForeignKey, Enum as SQLAlchemyEnum
+from sqlalchemy import Integer, ForeignKey, Enum as SQLAlchemyEnum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ravenspedia.core import Base
@@ -34,6 +34,11 @@ class MapName(Enum):
 class TableMapPickBanInfo(Base):
     __tablename__ = "map_pick_ban_info"  # Name of the table in the database
 
+    # Index used to read the vetoes of a team, optionally on one map
+    __table_args__ = (
+        Index("index_map_pick_ban_info_initiator_team", "initiator_team_id", "map"),
+    )
+
     # The map involved in the pick/ban process
     map: Mapped[MapName] = mapped_column(SQLAlchemyEnum(MapName), nullable=False)
     # Status of the map (Banned, Picked, Default)
@@ -43,6 +48,11 @@ class TableMapPickBanInfo(Base):
     )
     # Entity (team/player) that initiated the pick/ban action
     initiator: Mapped[str] = mapped_column(nullable=False)
+    # Team that initiated the pick/ban action, the name above is kept for display
+    # (None once the team is deleted)
+    initiator_team_id: Mapped[int | None] = mapped_column(
+        ForeignKey("teams.id", ondelete="SET NULL")
+    )
 
     # Foreign key linking to the match
     match_id: Mapped[int] = mapped_column(ForeignKey("matches.id", ondelete="CASCADE"))
@@ -54,6 +64,12 @@ class TableMapPickBanInfo(Base):
 class TableMapResultInfo(Base):
     __tablename__ = "map_result_info"  # Name of the table in the database
 
+    # Indexes used to read the results of a team, optionally on one map
+    __table_args__ = (
+        Index("index_map_result_info_first_team", "first_team_id", "map"),
+        Index("index_map_result_info_second_team", "second_team_id", "map"),
+    )
+
     # The map played in the match
     map: Mapped[MapName] = mapped_column(SQLAlchemyEnum(MapName), nullable=False)
 
@@ -63,6 +79,15 @@ class TableMapResultInfo(Base):
     # Name of the second team
     second_team: Mapped[str] = mapped_column(nullable=False)
 
+    # Teams of the result, the names above are kept for display
+    # (None once the team is deleted)
+    first_team_id: Mapped[int | None] = mapped_column(
+        ForeignKey("teams.id", ondelete="SET NULL")
+    )
+    second_team_id: Mapped[int | None] = mapped_column(
+        ForeignKey("teams.id", ondelete="SET NULL")
+    )
+
     # Scores for the first team across different halves and overtime
     first_half_score_first_team: Mapped[int] = mapped_column(Integer, nullable=False)
     second_half_score_first_team: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Enum as SQLAlchemyEnum, Integer, Float
+from sqlalchemy import ForeignKey, Enum as SQLAlchemyEnum, Integer, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ravenspedia.core import Base
@@ -15,6 +15,16 @@ if TYPE_CHECKING:
 class TableTeamMapStats(Base):
     __tablename__ = "team_map_stats"  # Name of the table in the database
 
+    # Index used to read and update the stats of a team on a map directly
+    __table_args__ = (
+        Index(
+            "index_unique_team_map_stats",
+            "team_id",
+            "map",
+            unique=True,  # Ensures a team has a single stats entry per map
+        ),
+    )
+
     # Foreign key linking to the team
     team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"))
 
@@ -50,3 +60,42 @@ class TableTeamMapStats(Base):
         default=0.0,
         server_default="0",
     )
+
+
+# Defines the TeamVetoStats table, a rollup of the picks and bans of a team per map
+class TableTeamVetoStats(Base):
+    __tablename__ = "team_veto_stats"  # Name of the table in the database
+
+    # Index used to read and replace the rollup of a team directly
+    __table_args__ = (
+        Index(
+            "index_unique_team_veto_stats",
+            "team_id",
+            "map",
+            unique=True,  # Ensures a team has a single rollup entry per map
+        ),
+    )
+
+    # Foreign key linking to the team
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"))
+
+    # The map picked or banned
+    map: Mapped[MapName] = mapped_column(
+        SQLAlchemyEnum(MapName),
+        nullable=False,
+    )
+
+    # Number of times the team banned the map
+    bans: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Number of times the map was the first ban of the team in a match
+    first_bans: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Number of times the team picked the map
+    picks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Number of picks of the team that have a map result
+    picks_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Number of picks of the team that it won
+    picks_won: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, func, Text as TextType
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ravenspedia.core import Base
+
+
+# Defines the TournamentSummary table storing the frozen summary of a completed tournament
+class TableTournamentSummary(Base):
+    __tablename__ = "tournament_summaries"  # Name of the table in the database
+
+    # Foreign key linking to the tournament, one summary per tournament
+    tournament_id: Mapped[int] = mapped_column(
+        ForeignKey("tournaments.id", ondelete="CASCADE"),
+        unique=True,
+    )
+
+    # The ResponseTournamentSummary of the tournament, serialized to JSON
+    content: Mapped[str] = mapped_column(TextType(), nullable=False)
+
+    # Date and time of the last rebuild of the summary
+    updated_at: Mapped[datetime] = mapped_column(
+        default=datetime.now,
+        server_default=func.now(),
+        onupdate=datetime.now,
+    )
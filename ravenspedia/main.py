@@ -7,7 +7,14 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from ravenspedia.core import db_helper
 from ravenspedia.api_v1 import router as router_v1
+from ravenspedia.api_v1.cache import ResponseCacheMiddleware
+from ravenspedia.api_v1.changes import track_changes
+from ravenspedia.api_v1.metrics import MetricsMiddleware, instrument_pool, timed_job
+from ravenspedia.api_v1.profiling import ProfilingMiddleware
+from ravenspedia.api_v1.query_stats import QueryStatsMiddleware, instrument_engine
 from ravenspedia.api_v1.auth.crud import delete_revoked_tokens
+from ravenspedia.api_v1.snapshots import writer as snapshot_writer
+from ravenspedia.core.config import snapshot_settings
 
 
 # Asynchronous function to delete revoked tokens from the database
@@ -17,10 +24,23 @@ async def scheduled_delete_revoked_tokens():
 
 
 # Wrapper function to run the async token deletion in a synchronous context
+@timed_job("delete_revoked_tokens")
 def run_scheduled_delete():
     asyncio.run(scheduled_delete_revoked_tokens())
 
 
+# Asynchronous function to snapshot the matches completed since the last run
+async def scheduled_snapshot():
+    async with db_helper.session_factory() as session:
+        await snapshot_writer.take_snapshot(session)
+
+
+# Wrapper function to run the async snapshot in a synchronous context
+@timed_job("snapshot")
+def run_scheduled_snapshot():
+    asyncio.run(scheduled_snapshot())
+
+
 # Define the application lifespan to manage startup and shutdown tasks
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -33,6 +53,14 @@ async def lifespan(app: FastAPI):
         minutes=20,  # Interval duration
     )
 
+    # Add a job to snapshot the new completed matches, if pyarrow is installed
+    if snapshot_writer.pyarrow is not None:
+        scheduler.add_job(
+            run_scheduled_snapshot,
+            "interval",
+            minutes=snapshot_settings.interval_minutes,
+        )
+
     scheduler.start()  # Start the scheduler on app startup
 
     yield  # Yield control to the FastAPI app, allowing it to run
@@ -59,12 +87,49 @@ origins = [
     "https://90.156.158.26/",
 ]
 
+# Store the profiles of the requests profiled by the profile_request dependency
+# (added first, so that the profiles measure the endpoints without the middlewares)
+app.add_middleware(ProfilingMiddleware)
+
+# Serve tagged GET responses from the server-side cache (added before CORS so that
+# the CORS headers are still applied to cached responses)
+app.add_middleware(ResponseCacheMiddleware)
+
+# Count the database statements of each request (added after the cache, so that
+# responses served from the cache are reported with their zero queries)
+instrument_engine(db_helper.engine)
+app.add_middleware(QueryStatsMiddleware)
+
+# Record the latency and in-flight count of the requests, the pool checkouts, the
+# FACEIT calls and the scheduled jobs for /metrics (added after the cache, so that
+# cached responses are measured too)
+instrument_pool(db_helper.engine)
+app.add_middleware(MetricsMiddleware)
+
+# Log every change of the public entities for the /changes feed
+track_changes()
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,  # Whitelist of origins allowed to access the API
     allow_credentials=True,  # Allow cookies and authentication headers
     allow_methods=["GET", "POST", "OPTIONS", "PATCH", "DELETE"],
-    allow_headers=["Content-Type", "Authorization", "Accept", "Origin"],
+    allow_headers=[
+        "Content-Type",
+        "Authorization",
+        "Accept",
+        "Origin",
+        "If-None-Match",
+        "X-Profile",
+    ],
+    # Let browsers read the validators of responses and the query statistics
+    expose_headers=[
+        "ETag",
+        "X-DB-Query-Count",
+        "X-DB-Time-Ms",
+        "X-DB-Repeated-Queries",
+        "X-Profile-Id",
+    ],
 )
 
 app.include_router(router=router_v1)
@@ -3,9 +3,13 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ravenspedia.api_v1.cache import response_cache
 from ravenspedia.core import Base, db_helper, test_db_helper, TableUser
 from ravenspedia.main import app
 
+# Provides the query_budget fixture
+pytest_plugins = ("ravenspedia.api_v1.query_stats.pytest_plugin",)
+
 
 @pytest_asyncio.fixture(scope="module", autouse=True)
 async def setup_database():
@@ -17,6 +21,9 @@ async def setup_database():
     # Create all tables in the test database
     async with test_db_helper.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+    # Responses cached by previous modules describe a database that no longer exists
+    response_cache.clear()
     yield  # Allow tests to run
 
     # Drop all tables after tests are complete
@@ -42,6 +49,9 @@ async def client() -> AsyncClient:
     app.dependency_overrides[db_helper.session_dependency] = (
         test_db_helper.session_dependency
     )
+    app.dependency_overrides[db_helper.session_factory_dependency] = (
+        test_db_helper.session_factory_dependency
+    )
 
     # Create an async HTTP client for the FastAPI app
     async with AsyncClient(
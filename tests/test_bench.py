@@ -0,0 +1,31 @@
+import pytest
+from sqlalchemy import func, select
+
+from ravenspedia.bench import SCALES, generate_dataset, run_load
+from ravenspedia.core import DatabaseHelper, PlayerStats, TableMatchStats
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_and_run_load(tmp_path):
+    """
+    Test that the generator creates the requested volumes of valid data
+    and that the load driver reports every route of the mix without errors.
+    """
+    scale = SCALES["tiny"]
+    helper = DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path}/bench.sqlite3")
+    await generate_dataset(helper=helper, scale=scale)
+
+    async with helper.session_factory() as session:
+        assert await session.scalar(select(func.count(TableMatchStats.id))) == (
+            scale.stats
+        )
+        # The stats have the shape of the ones imported from FACEIT
+        stats = await session.scalar(select(TableMatchStats.match_stats).limit(1))
+        PlayerStats(**stats)
+
+    reports = await run_load(scale=scale, helper=helper, total_requests=100)
+    assert sum(report.requests for report in reports) == 100
+    assert all(report.errors == 0 for report in reports)
+    assert all(report.p50 <= report.p95 <= report.p99 for report in reports)
+
+    await helper.engine.dispose()
@@ -0,0 +1,104 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import TableTeam
+
+
+@pytest.mark.asyncio
+async def test_read_sends_validators(
+    client: AsyncClient,
+):
+    """Verify that read endpoints send an ETag and ask clients to revalidate."""
+    response = await client.get("/teams/")
+    assert response.status_code == 200
+    assert response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_not_modified(
+    client: AsyncClient,
+):
+    """Ensure a matching If-None-Match is answered with an empty 304."""
+    etag = (await client.get("/teams/")).headers["etag"]
+
+    response = await client.get("/teams/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    # Weak validators and lists of validators match as well
+    response = await client.get(
+        "/teams/",
+        headers={"If-None-Match": f'"other", W/{etag}'},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_not_cached(
+    client: AsyncClient,
+    authorized_admin_client: AsyncClient,
+):
+    """Check that a 404 is not served from the cache once the entity exists."""
+    response = await client.get("/teams/Cached/")
+    assert response.status_code == 404
+
+    data = {"name": "Cached", "max_number_of_players": 5}
+    response = await authorized_admin_client.post("/teams/", json=data)
+    assert response.status_code == 201
+
+    response = await client.get("/teams/Cached/")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Cached"
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_tags(
+    client: AsyncClient,
+    authorized_admin_client: AsyncClient,
+):
+    """Verify that a write changes the ETags of the entity and of its list only."""
+    list_etag = (await client.get("/teams/")).headers["etag"]
+    team_etag = (await client.get("/teams/Cached/")).headers["etag"]
+    news_etag = (await client.get("/news/")).headers["etag"]
+
+    response = await authorized_admin_client.patch(
+        "/teams/Cached/",
+        json={"description": "Updated"},
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/teams/Cached/", headers={"If-None-Match": team_etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != team_etag
+    assert response.json()["description"] == "Updated"
+
+    response = await client.get("/teams/", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+    assert response.json()[0]["description"] == "Updated"
+
+    # Unrelated entities keep their validators
+    response = await client.get("/news/", headers={"If-None-Match": news_etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_response_served_from_cache(
+    client: AsyncClient,
+    session: AsyncSession,
+):
+    """Ensure a cached response is reused until one of its tags is invalidated."""
+    response = await client.get("/teams/Cached/")
+    assert response.json()["description"] == "Updated"
+
+    # A change that bypasses the CRUD functions emits no tag
+    team = await session.scalar(select(TableTeam).where(TableTeam.name == "Cached"))
+    team.description = "Changed directly"
+    await session.commit()
+
+    response = await client.get("/teams/Cached/")
+    assert response.status_code == 200
+    assert response.json()["description"] == "Updated"
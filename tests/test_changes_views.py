@@ -0,0 +1,67 @@
+import pytest
+from httpx import AsyncClient
+
+
+async def get_feed(client: AsyncClient, **params) -> dict:
+    response = await client.get("/changes/", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_change_feed(authorized_admin_client: AsyncClient):
+    """
+    Test that writes are logged in order and can be read page by page.
+    """
+    cursor = (await get_feed(authorized_admin_client, limit=1000))["cursor"]
+
+    data = {
+        "name": "Feed Cup",
+        "max_count_of_teams": 4,
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-10",
+    }
+    response = await authorized_admin_client.post("/tournaments/", json=data)
+    assert response.status_code == 201
+    response = await authorized_admin_client.post(
+        "/teams/", json={"name": "Feed Team", "max_number_of_players": 5}
+    )
+    assert response.status_code == 201
+    response = await authorized_admin_client.patch(
+        "/tournaments/Feed Cup/add_team/Feed Team/"
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.delete("/teams/Feed Team/")
+    assert response.status_code == 204
+
+    feed = await get_feed(authorized_admin_client, since=cursor)
+    changes = [
+        (change["entity"], change["operation"], change["version"])
+        for change in feed["changes"]
+    ]
+    assert changes == [
+        ("tournament", "INSERT", 1),
+        ("team", "INSERT", 1),
+        ("tournament", "UPDATE", 2),
+        ("team", "UPDATE", 2),
+        ("team", "DELETE", 3),
+        ("tournament", "UPDATE", 3),
+    ]
+    for entity in ("tournament", "team"):
+        ids = {c["entity_id"] for c in feed["changes"] if c["entity"] == entity}
+        assert len(ids) == 1
+    assert feed["cursor"] == feed["changes"][-1]["cursor"]
+    assert not feed["has_more"]
+
+    # Pages of one change follow each other through the cursor
+    first = await get_feed(authorized_admin_client, since=cursor, limit=1)
+    assert first["has_more"]
+    second = await get_feed(authorized_admin_client, since=first["cursor"], limit=1)
+    assert [first["changes"][0], second["changes"][0]] == feed["changes"][:2]
+
+    feed = await get_feed(authorized_admin_client, since=cursor, entity="team")
+    assert [change["operation"] for change in feed["changes"]] == [
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+    ]
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from ravenspedia.api_v1.schedules import schedule_matches
+from ravenspedia.core.config import cache_settings
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_computation(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Verify that concurrent identical GETs run the endpoint once and share its response."""
+    calls = 0
+
+    async def slow_completed_matches(session):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.2)  # Keep the first request in flight
+        return []
+
+    # Without the cache every request would reach the endpoint
+    monkeypatch.setattr(cache_settings, "enabled", False)
+    monkeypatch.setattr(
+        schedule_matches, "get_completed_matches", slow_completed_matches
+    )
+
+    responses = await asyncio.gather(
+        *(client.get("/schedules/matches/get_last_completed/") for _ in range(5))
+    )
+    assert calls == 1
+    assert all(response.status_code == 200 for response in responses)
+    assert all(response.json() == [] for response in responses)
+
+    # Requests with other query parameters are computed separately
+    await asyncio.gather(
+        client.get("/schedules/matches/get_last_completed/"),
+        client.get("/schedules/matches/get_last_completed/?page=2"),
+    )
+    assert calls == 3
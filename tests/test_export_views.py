@@ -0,0 +1,107 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from ravenspedia.bench import SCALES, generate_dataset
+from ravenspedia.core import DatabaseHelper, TableMatch, TableMatchStats, db_helper
+from ravenspedia.core.config import export_settings
+from ravenspedia.main import app
+
+
+@pytest.fixture
+async def export_database(tmp_path, client: AsyncClient):
+    """
+    Serve a generated dataset, fetched in small batches to cross their bounds.
+    """
+    helper = DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path}/export.sqlite3")
+    await generate_dataset(helper=helper, scale=SCALES["tiny"], documents=False)
+
+    previous = app.dependency_overrides[db_helper.session_factory_dependency]
+    batch_size = export_settings.batch_size
+    app.dependency_overrides[db_helper.session_factory_dependency] = (
+        helper.session_factory_dependency
+    )
+    export_settings.batch_size = 7
+    yield helper
+
+    export_settings.batch_size = batch_size
+    app.dependency_overrides[db_helper.session_factory_dependency] = previous
+    await helper.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_export_match_stats(client: AsyncClient, export_database):
+    """
+    Verify that every stats row is streamed as NDJSON and as gzip-compressed CSV.
+    """
+    async with export_database.session_factory() as session:
+        total = await session.scalar(select(func.count(TableMatchStats.id)))
+        tournament_id, tournament_total = (
+            await session.execute(
+                select(TableMatch.tournament_id, func.count(TableMatchStats.id))
+                .join(TableMatchStats.match)
+                .group_by(TableMatch.tournament_id)
+                .limit(1)
+            )
+        ).one()
+
+    response = await client.get(
+        "/export/match_stats/", headers={"Accept-Encoding": "identity"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == total
+    assert [row["stat_id"] for row in rows] == sorted(row["stat_id"] for row in rows)
+    assert {"nickname", "map", "Kills", "ADR", "tournament"} <= set(rows[0])
+
+    async with client.stream(
+        "GET",
+        "/export/match_stats/",
+        params={"format": "csv", "tournament_ids": [tournament_id]},
+        headers={"Accept-Encoding": "gzip"},
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/csv")
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    text = gzip.decompress(body).decode()
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert len(rows) == tournament_total
+    assert {row["tournament_id"] for row in rows} == {str(tournament_id)}
+
+
+@pytest.mark.asyncio
+async def test_export_matches(client: AsyncClient, export_database):
+    """
+    Ensure matches are exported with their teams and filtered by date.
+    """
+    response = await client.get("/export/matches/")
+    assert response.status_code == 200
+    matches = [json.loads(line) for line in response.text.splitlines()]
+    assert len(matches) == SCALES["tiny"].matches
+    assert all(len(match["teams"]) == 2 for match in matches)
+
+    dates = sorted(match["date"] for match in matches)
+    response = await client.get(
+        "/export/matches/",
+        params={"format": "csv", "start_date": dates[10], "end_date": dates[-1]},
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == len([date for date in dates if date >= dates[10]])
+    assert all("|" in row["teams"] for row in rows)
+
+    # Without rows, a CSV export still has its header
+    response = await client.get(
+        "/export/matches/", params={"format": "csv", "tournament_ids": [0]}
+    )
+    assert response.text.strip() == ",".join(
+        ["match_id", "date", "status", "best_of", "tournament_id", "tournament"]
+        + ["teams", "description", "original_source"]
+    )
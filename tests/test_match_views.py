@@ -1,5 +1,11 @@
+import json
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import TableMatchDocument
 
 
 @pytest.mark.asyncio
@@ -522,3 +528,55 @@ async def test_update_match_with_invalid_date(authorized_admin_client: AsyncClie
     )
     assert response.status_code == 400
     assert "Match date must be between tournament dates" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_match_document_is_stored_and_versioned(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test that a match document is regenerated only when the match changes.
+    """
+    document = await session.scalar(
+        select(TableMatchDocument).where(TableMatchDocument.match_id == 1)
+    )
+    assert document is not None
+    version = document.version
+
+    response = await authorized_admin_client.patch(
+        f"/matches/1/",
+        json={"description": "Updated by document test"},
+    )
+    assert response.status_code == 200
+
+    await session.refresh(document)
+    assert document.version == version + 1
+    assert json.loads(document.content) == response.json()
+
+    response = await authorized_admin_client.get(f"/matches/1/")
+    assert response.status_code == 200
+    assert response.json()["description"] == "Updated by document test"
+
+
+@pytest.mark.asyncio
+async def test_rebuild_match_documents(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test that missing match documents are rendered on read and rebuilt on demand.
+    """
+    await session.execute(delete(TableMatchDocument))
+    await session.commit()
+
+    response = await authorized_admin_client.get(f"/matches/")
+    assert response.status_code == 200
+    matches = response.json()
+    assert [match["id"] for match in matches] == [1]
+
+    response = await authorized_admin_client.patch(f"/matches/rebuild_documents/")
+    assert response.status_code == 204
+
+    documents = await session.scalars(select(TableMatchDocument))
+    assert [json.loads(doc.content) for doc in documents] == matches
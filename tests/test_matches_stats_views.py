@@ -200,10 +200,13 @@ async def test_player_stats_connection_after_bo1(authorized_admin_client: AsyncC
     data = response.json()
 
     assert response.status_code == 200
-    assert len(data["stats"]) == 1
-    assert data["nickname"] == data["stats"][0]["nickname"]
-    assert data["stats"][0]["match_id"] == 1
-    assert data["stats"][0]["round_of_match"] == 1
+    assert data["matches_count"] == 1
+    assert data["maps_count"] == 1
+
+    response = await authorized_admin_client.get(data["matches_url"])
+    items = response.json()["items"]
+    assert data["nickname"] == items[0]["stats"]["nickname"]
+    assert (items[0]["match_id"], items[0]["round_of_match"]) == (1, 1)
 
 
 @pytest.mark.asyncio
@@ -261,13 +264,17 @@ async def test_player_stats_connection_after_bo2(authorized_admin_client: AsyncC
     data = response.json()
 
     assert response.status_code == 200
-    assert len(data["stats"]) == 3
-    assert data["nickname"] == data["stats"][1]["nickname"]
-    assert data["nickname"] == data["stats"][2]["nickname"]
-    assert data["stats"][1]["match_id"] == 2
-    assert data["stats"][1]["round_of_match"] == 1
-    assert data["stats"][2]["match_id"] == 2
-    assert data["stats"][2]["round_of_match"] == 2
+    assert data["matches_count"] == 2
+    assert data["maps_count"] == 3
+
+    response = await authorized_admin_client.get(data["matches_url"])
+    items = response.json()["items"]
+    assert all(item["stats"]["nickname"] == data["nickname"] for item in items)
+    assert sorted((item["match_id"], item["round_of_match"]) for item in items) == [
+        (1, 1),
+        (2, 1),
+        (2, 2),
+    ]
 
 
 @pytest.mark.asyncio
@@ -325,13 +332,17 @@ async def test_player_stats_connection_after_bo3(client: AsyncClient):
     data = response.json()
 
     assert response.status_code == 200
-    assert len(data["stats"]) == 5
-    assert data["nickname"] == data["stats"][3]["nickname"]
-    assert data["nickname"] == data["stats"][4]["nickname"]
-    assert data["stats"][3]["match_id"] == 3
-    assert data["stats"][3]["round_of_match"] == 1
-    assert data["stats"][4]["match_id"] == 3
-    assert data["stats"][4]["round_of_match"] == 2
+    assert data["matches_count"] == 3
+    assert data["maps_count"] == 5
+
+    response = await client.get(data["matches_url"])
+    items = response.json()["items"]
+    assert all(item["stats"]["nickname"] == data["nickname"] for item in items)
+    assert sorted(
+        (item["match_id"], item["round_of_match"])
+        for item in items
+        if item["match_id"] == 3
+    ) == [(3, 1), (3, 2)]
 
 
 @pytest.mark.asyncio
@@ -363,7 +374,7 @@ async def test_delete_stats_from_match(authorized_admin_client: AsyncClient):
 
     response = await authorized_admin_client.get("/players/Zatt0x/")
     assert response.status_code == 200
-    assert len(response.json()["stats"]) == 3
+    assert response.json()["maps_count"] == 3
 
 
 @pytest.mark.asyncio
@@ -376,7 +387,7 @@ async def test_delete_match_with_stats(authorized_admin_client: AsyncClient):
 
     response = await authorized_admin_client.get("/players/Zatt0x/")
     assert response.status_code == 200
-    assert len(response.json()["stats"]) == 1
+    assert response.json()["maps_count"] == 1
 
 
 @pytest.mark.asyncio
@@ -599,3 +610,94 @@ async def test_delete_stats_from_match_no_stats(authorized_admin_client: AsyncCl
     )
     assert response.status_code == 200
     assert response.json()["stats"] == []
+
+
+@pytest.mark.asyncio
+async def test_add_manual_scoreboard(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test adding a whole scoreboard at once, rejected as a whole if a row is invalid.
+    """
+    session.add_all(
+        [
+            TablePlayer(nickname="Board1", steam_id="76561190000000001"),
+            TablePlayer(nickname="Board2", steam_id="76561190000000002"),
+        ]
+    )
+    await session.commit()
+
+    match_data = {
+        "max_number_of_teams": 2,
+        "max_number_of_players": 10,
+        "tournament": "Final MSCL",
+        "date": "2024-02-10",
+        "best_of": 3,
+    }
+    response = await authorized_admin_client.post("/matches/", json=match_data)
+    assert response.status_code == 201
+    match_id = response.json()["id"]
+
+    header = "nickname,round_of_match,map,Result,Kills,Assists,Deaths,ADR,Headshots %"
+    rows = [
+        "Board1,1,Dust2,1,20,5,10,80.5,40",
+        "Board2,1,Dust2,0,12,3,18,61.2,35",
+        "Board1,2,Mirage,0,15,4,16,70.1,50",
+        "Board2,2,Mirage,1,19,6,14,85.0,45",
+    ]
+
+    # Invalid rows: every problem is reported and nothing is written
+    scoreboard = [
+        {"nickname": "Board1", "round_of_match": 1, "map": "Dust2", "Result": 1},
+        {
+            "nickname": "Unknown",
+            "round_of_match": 4,
+            "map": "Dust2",
+            "Result": 1,
+            "Kills": 20,
+            "Assists": 5,
+            "Deaths": 10,
+            "ADR": 80.5,
+            "Headshots %": 40,
+        },
+        {"nickname": 5, "round_of_match": 1},
+    ]
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_scoreboard_manual/",
+        json=scoreboard,
+    )
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert [error["row"] for error in errors] == [1, 2, 3]
+    assert [error["nickname"] for error in errors] == ["Board1", "Unknown", None]
+    assert len(errors[0]["errors"]) == 5
+    assert errors[1]["errors"] == [
+        "Player Unknown not found",
+        "round_of_match must be between 1 and 3",
+    ]
+    response = await authorized_admin_client.get(f"/matches/{match_id}/")
+    assert response.json()["stats"] == []
+
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_scoreboard_manual/",
+        content="\n".join([header, *rows]),
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "COMPLETED"
+    assert len(response.json()["stats"]) == 4
+
+    response = await authorized_admin_client.get("/players/Board2/")
+    assert response.json()["tournaments"] == ["Final MSCL"]
+
+    # Rows already in the match are duplicates
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_scoreboard_manual/",
+        content="\n".join([header, rows[0]]),
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["errors"] == [
+        "Board1 already has stats for map 1"
+    ]
@@ -0,0 +1,85 @@
+from unittest.mock import Mock
+
+import pytest
+from httpx import AsyncClient
+
+from ravenspedia.api_v1.metrics import call_faceit, timed_job
+from ravenspedia.api_v1.metrics.instruments import (
+    cache_requests,
+    faceit_errors,
+    faceit_request_duration,
+    http_request_duration,
+    scheduler_job_duration,
+)
+
+
+@pytest.mark.asyncio
+async def test_request_metrics(
+    client: AsyncClient, authorized_admin_client: AsyncClient
+):
+    """
+    Verify that requests are measured by route template and cache result.
+    """
+    data = {"name": "Measured", "max_number_of_players": 5}
+    response = await authorized_admin_client.post("/teams/", json=data)
+    assert response.status_code == 201
+
+    route = ("GET", "/teams/{team_name}/", "200")
+    count = http_request_duration.count(*route)
+    hits, misses = cache_requests.value("hit"), cache_requests.value("miss")
+
+    # The second request is served from the cache but keeps its route label
+    for _ in range(2):
+        response = await client.get("/teams/Measured/")
+        assert response.status_code == 200
+    assert http_request_duration.count(*route) == count + 2
+    assert cache_requests.value("miss") == misses + 1
+    assert cache_requests.value("hit") == hits + 1
+
+    # A parameter equal to a literal segment of the path keeps its template
+    route = ("GET", "/teams/{team_name}/", "404")
+    count = http_request_duration.count(*route)
+    response = await client.get("/teams/teams/")
+    assert response.status_code == 404
+    assert http_request_duration.count(*route) == count + 1
+
+    # Unknown paths share one label instead of one series per path
+    await client.get("/no-such-path/")
+    assert http_request_duration.count("GET", "unmatched", "404") >= 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    """
+    Check the text exposition format of the metrics endpoint.
+    """
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    body = response.text
+    assert "# TYPE ravenspedia_http_request_duration_seconds histogram" in body
+    assert 'route="/teams/{team_name}/"' in body
+    assert 'le="+Inf"' in body
+    assert "ravenspedia_http_requests_in_flight 1" in body  # This very request
+    assert body.endswith("\n")
+
+
+def test_faceit_and_job_metrics():
+    """
+    Ensure FACEIT calls and scheduled jobs record their latency and errors.
+    """
+    endpoint = "/test/{id}"
+    request = Mock(side_effect=[Mock(status_code=200), Mock(status_code=503)])
+    call_faceit(endpoint, request, "https://faceit/test/1")
+    call_faceit(endpoint, request, "https://faceit/test/2")
+    assert faceit_request_duration.count(endpoint) == 2
+    assert faceit_errors.value(endpoint, "503") == 1
+
+    @timed_job("failing")
+    def failing_job():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        failing_job()
+    assert scheduler_job_duration.count("failing", "error") == 1
@@ -2,8 +2,19 @@ from unittest.mock import patch, Mock
 
 import pytest
 from httpx import AsyncClient
-
+from sqlalchemy import func, select
+
+from ravenspedia.api_v1.project_classes.player_stats import timeseries
+from ravenspedia.bench import SCALES, generate_dataset
+from ravenspedia.core import (
+    DatabaseHelper,
+    TableMatch,
+    TableMatchStats,
+    TablePlayer,
+    db_helper,
+)
 from ravenspedia.core.config import data_for_tests
+from ravenspedia.main import app
 
 
 @pytest.mark.asyncio
@@ -484,3 +495,101 @@ async def test_get_player_stats_invalid_player(client: AsyncClient):
     assert response.json() == {
         "detail": "Player InvalidPlayer not found",
     }
+
+
+@pytest.fixture
+async def timeseries_database(tmp_path, client: AsyncClient):
+    """
+    Serve a generated dataset with many matches per player.
+    """
+    helper = DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path}/timeseries.sqlite3")
+    await generate_dataset(helper=helper, scale=SCALES["tiny"], documents=False)
+
+    previous = app.dependency_overrides[db_helper.session_dependency]
+    app.dependency_overrides[db_helper.session_dependency] = helper.session_dependency
+    yield helper
+
+    app.dependency_overrides[db_helper.session_dependency] = previous
+    await helper.engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_numpy", [True, False])
+async def test_get_player_timeseries(
+    client: AsyncClient,
+    timeseries_database,
+    monkeypatch,
+    use_numpy: bool,
+):
+    """
+    Test the per-match and rolling series against a plain computation.
+    """
+    if not use_numpy:  # The fallback used without NumPy gives the same series
+        monkeypatch.setattr(timeseries, "numpy", None)
+
+    async with timeseries_database.session_factory() as session:
+        nickname = await session.scalar(
+            select(TablePlayer.nickname)
+            .join(TablePlayer.stats)
+            .group_by(TablePlayer.id)
+            .order_by(func.count(TableMatchStats.id).desc())
+            .limit(1)
+        )
+        stats = (
+            await session.execute(
+                select(TableMatch.id, TableMatchStats.match_stats)
+                .join(TableMatchStats.match)
+                .join(TableMatchStats.player)
+                .where(TablePlayer.nickname == nickname)
+                .order_by(TableMatch.date, TableMatch.id)
+            )
+        ).all()
+
+    # Kills and deaths summed per match, in match order
+    matches = {}
+    for match_id, match_stats in stats:
+        kills, deaths, maps = matches.get(match_id, (0, 0, 0))
+        matches[match_id] = (
+            kills + match_stats["Kills"],
+            deaths + match_stats["Deaths"],
+            maps + 1,
+        )
+    totals = list(matches.values())
+
+    response = await client.get(
+        f"/players/stats/{nickname}/timeseries/",
+        params={"metrics": ["kd", "kills"], "window": 3},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["match_ids"] == list(matches)
+    assert set(data["series"]) == {"kd", "kills"}
+
+    kd = data["series"]["kd"]
+    for index, (kills, deaths, maps) in enumerate(totals):
+        assert kd["per_match"][index] == pytest.approx(kills / deaths)
+        window = totals[max(index - 2, 0) : index + 1]
+        assert kd["rolling"][index] == pytest.approx(
+            sum(kills for kills, _, _ in window)
+            / sum(deaths for _, deaths, _ in window)
+        )
+        assert data["series"]["kills"]["rolling"][index] == pytest.approx(
+            sum(kills for kills, _, _ in window) / sum(maps for _, _, maps in window)
+        )
+
+    # A window of days that covers every match is a cumulative series
+    response = await client.get(
+        f"/players/stats/{nickname}/timeseries/",
+        params={"metrics": "kd", "days": 100000},
+    )
+    assert response.status_code == 200
+    rolling = response.json()["series"]["kd"]["rolling"]
+    assert rolling[-1] == pytest.approx(
+        sum(kills for kills, _, _ in totals) / sum(deaths for _, deaths, _ in totals)
+    )
+
+    response = await client.get(
+        f"/players/stats/{nickname}/timeseries/",
+        params={"metrics": "rating"},
+    )
+    assert response.status_code == 400
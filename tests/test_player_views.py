@@ -2,7 +2,9 @@ from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ravenspedia.core import TablePlayer
 from ravenspedia.core.config import data_for_tests
 
 
@@ -67,9 +69,9 @@ async def test_create_player_with_full_info(authorized_admin_client: AsyncClient
         "steam_id": data_for_tests.player1_steam_id,
         "faceit_id": data_for_tests.player1_faceit_id,
         "team": None,
-        "matches": [],
+        "matches_count": 0,
+        "maps_count": 0,
         "tournaments": [],
-        "stats": [],
     }
 
     for key, value in expected_data.items():
@@ -95,9 +97,9 @@ async def test_read_player_with_full_info(client: AsyncClient):
         "steam_id": data_for_tests.player1_steam_id,
         "faceit_id": data_for_tests.player1_faceit_id,
         "team": None,
-        "matches": [],
+        "matches_count": 0,
+        "maps_count": 0,
         "tournaments": [],
-        "stats": [],
     }
 
     for key, value in expected_data.items():
@@ -128,9 +130,9 @@ async def test_create_player_with_partial_info(authorized_admin_client: AsyncCli
         "steam_id": data_for_tests.player2_steam_id,
         "faceit_id": data_for_tests.player2_faceit_id,
         "team": None,
-        "matches": [],
+        "matches_count": 0,
+        "maps_count": 0,
         "tournaments": [],
-        "stats": [],
     }
 
     for key, value in expected_data.items():
@@ -156,9 +158,9 @@ async def test_read_player_with_partial_info(client: AsyncClient):
         "steam_id": data_for_tests.player2_steam_id,
         "faceit_id": data_for_tests.player2_faceit_id,
         "team": None,
-        "matches": [],
+        "matches_count": 0,
+        "maps_count": 0,
         "tournaments": [],
-        "stats": [],
     }
 
     for key, value in expected_data.items():
@@ -184,9 +186,9 @@ async def test_empty_update_player(authorized_admin_client: AsyncClient):
         "steam_id": data_for_tests.player1_steam_id,
         "faceit_id": data_for_tests.player1_faceit_id,
         "team": None,
-        "matches": [],
+        "matches_count": 0,
+        "maps_count": 0,
         "tournaments": [],
-        "stats": [],
     }
 
     for key, value in expected_data.items():
@@ -215,9 +217,9 @@ async def test_update_player_names(authorized_admin_client: AsyncClient):
         "steam_id": data_for_tests.player2_steam_id,
         "faceit_id": data_for_tests.player2_faceit_id,
         "team": None,
-        "matches": [],
+        "matches_count": 0,
+        "maps_count": 0,
         "tournaments": [],
-        "stats": [],
     }
     for key, value in expected_data.items():
         assert response_json[key] == value
@@ -246,9 +248,9 @@ async def test_update_player_nickname(authorized_admin_client: AsyncClient):
         "steam_id": data_for_tests.player2_steam_id,
         "faceit_id": data_for_tests.player2_faceit_id,
         "team": None,
-        "matches": [],
+        "matches_count": 0,
+        "maps_count": 0,
         "tournaments": [],
-        "stats": [],
     }
 
     for key, value in expected_data.items():
@@ -275,9 +277,9 @@ async def test_get_players(client: AsyncClient):
             "steam_id": data_for_tests.player1_steam_id,
             "faceit_id": data_for_tests.player1_faceit_id,
             "team": None,
-            "matches": [],
+            "matches_count": 0,
+            "maps_count": 0,
             "tournaments": [],
-            "stats": [],
         },
         {
             "nickname": "G666",
@@ -286,9 +288,9 @@ async def test_get_players(client: AsyncClient):
             "steam_id": data_for_tests.player2_steam_id,
             "faceit_id": data_for_tests.player2_faceit_id,
             "team": None,
-            "matches": [],
+            "matches_count": 0,
+            "maps_count": 0,
             "tournaments": [],
-            "stats": [],
         },
     ]
 
@@ -465,3 +467,158 @@ async def test_update_faceit_elo(mock_get, authorized_admin_client: AsyncClient)
     fetch_response = await authorized_admin_client.get("/players/FaceitPlayer/")
     assert fetch_response.status_code == 200
     assert fetch_response.json()["faceit_elo"] == 2000
+
+
+@pytest.mark.asyncio
+async def test_player_match_history(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test the paginated match history of a player and its filters.
+    """
+    session.add(TablePlayer(nickname="Historian", steam_id="history_steam"))
+    await session.commit()
+
+    data = {
+        "name": "History Cup",
+        "max_count_of_teams": 2,
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-10",
+    }
+    response = await authorized_admin_client.post("/tournaments/", json=data)
+    assert response.status_code == 201
+
+    # Two BO2 matches on different days
+    for date in ("2025-01-02T15:00:00", "2025-01-04T15:00:00"):
+        data = {
+            "best_of": 2,
+            "max_number_of_teams": 2,
+            "max_number_of_players": 10,
+            "tournament": "History Cup",
+            "date": date,
+        }
+        response = await authorized_admin_client.post("/matches/", json=data)
+        assert response.status_code == 201
+        match_id = response.json()["id"]
+
+        for round_of_match, map_name in ((1, "Mirage"), (2, "Nuke")):
+            stats = {
+                "nickname": "Historian",
+                "round_of_match": round_of_match,
+                "map": map_name,
+                "Result": 1,
+                "Kills": 20,
+                "Assists": 5,
+                "Deaths": 10,
+                "ADR": 80.5,
+                "Headshots %": 40,
+            }
+            response = await authorized_admin_client.patch(
+                f"/matches/stats/{match_id}/add_stats_manual/",
+                json=stats,
+            )
+            assert response.status_code == 200
+
+    # The profile only counts the history and links to it
+    response = await authorized_admin_client.get("/players/Historian/")
+    assert response.json()["matches_count"] == 2
+    assert response.json()["maps_count"] == 4
+    assert response.json()["matches_url"] == "/players/Historian/matches/"
+
+    # Nicknames are encoded in the link
+    session.add(TablePlayer(nickname="His tory?#1", steam_id="history_steam_2"))
+    await session.commit()
+    response = await authorized_admin_client.get("/players/His%20tory%3F%231/")
+    assert response.json()["matches_url"] == "/players/His%20tory%3F%231/matches/"
+    response = await authorized_admin_client.get(response.json()["matches_url"])
+    assert response.status_code == 200
+
+    # Pages go from the newest match to the oldest one
+    seen = []
+    params = {"limit": 3}
+    while True:
+        response = await authorized_admin_client.get(
+            "/players/Historian/matches/",
+            params=params,
+        )
+        assert response.status_code == 200
+        page = response.json()
+        seen += [(item["date"], item["round_of_match"]) for item in page["items"]]
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+    assert seen == [
+        ("2025-01-04T15:00:00", 2),
+        ("2025-01-04T15:00:00", 1),
+        ("2025-01-02T15:00:00", 2),
+        ("2025-01-02T15:00:00", 1),
+    ]
+
+    # Filters and field selection are applied on the server
+    response = await authorized_admin_client.get(
+        "/players/Historian/matches/",
+        params={"map": "Nuke", "end_date": "2025-01-03", "fields": ["Kills", "ADR"]},
+    )
+    items = response.json()["items"]
+    assert len(items) == 1
+    assert items[0]["map"] == "Nuke"
+    assert items[0]["tournament"] == "History Cup"
+    assert items[0]["stats"] == {"Kills": 20, "ADR": 80.5}
+
+    # An unknown map is rejected instead of returning an empty page
+    response = await authorized_admin_client.get(
+        "/players/Historian/matches/",
+        params={"map": "Nukee"},
+    )
+    assert response.status_code == 422
+
+    response = await authorized_admin_client.get(
+        "/players/Historian/matches/",
+        params={"fields": ["Unknown"]},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@patch("ravenspedia.api_v1.project_classes.player.crud.requests.get")
+async def test_player_elo_history(
+    mock_get,
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test that the ELO refresh keeps only the changes and that the curve is
+    downsampled on request.
+    """
+    session.add(TablePlayer(nickname="EloPlayer", steam_id="76561190000000050"))
+    await session.commit()
+
+    mock_get.return_value.status_code = 200
+    for elo in (2000, 2000, 2100, 2050):
+        mock_get.return_value.json.return_value = {
+            "player_id": "faceit_id_123",
+            "games": {"cs2": {"faceit_elo": elo}},
+        }
+        response = await authorized_admin_client.patch("/players/update_faceit_elo/")
+        assert response.status_code == 204
+
+    # The unchanged refresh is not stored
+    response = await authorized_admin_client.get("/players/EloPlayer/elo_history/")
+    assert response.status_code == 200
+    curve = response.json()
+    assert curve["changes"] == 3
+    assert curve["downsampled"] is False
+    assert [point["elo"] for point in curve["points"]] == [2000, 2100, 2050]
+
+    response = await authorized_admin_client.get(
+        "/players/EloPlayer/elo_history/", params={"points": 2}
+    )
+    curve = response.json()
+    assert curve["downsampled"] is True
+    assert len(curve["points"]) == 2
+    assert curve["points"][-1]["elo"] == 2050
+    assert max(point["max_elo"] for point in curve["points"]) == 2100
+
+    response = await authorized_admin_client.get("/players/Unknown/elo_history/")
+    assert response.status_code == 404
@@ -0,0 +1,69 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from ravenspedia.api_v1.profiling import profile_store
+from ravenspedia.core.config import profiling_settings
+
+
+@pytest.mark.asyncio
+async def test_profile_request(
+    client: AsyncClient, authorized_admin_client: AsyncClient
+):
+    """
+    Verify that an admin gets the profile of a flagged request in folded format.
+    """
+    # Only admins may profile a request
+    response = await client.get("/teams/", headers={"X-Profile": "1"})
+    assert response.status_code == 401
+    assert "x-profile-id" not in response.headers
+
+    # Flagged requests are never served from the cache
+    for flag in ({"headers": {"X-Profile": "1"}}, {"params": {"profile": "true"}}):
+        response = await authorized_admin_client.get("/teams/", **flag)
+        assert response.status_code == 200
+        profile_id = response.headers["x-profile-id"]
+
+        response = await authorized_admin_client.get(f"/profiles/{profile_id}/")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        # Lines of "frame;frame;... count" read by flamegraph.pl and speedscope
+        for line in response.text.splitlines():
+            assert re.fullmatch(r"\S.* \d+", line)
+
+    response = await authorized_admin_client.get("/profiles/")
+    assert response.status_code == 200
+    assert {"mode": "explicit", "route": "/teams/"}.items() <= response.json()[
+        0
+    ].items()
+
+    response = await authorized_admin_client.get("/profiles/999999/")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_rolling_capture(
+    client: AsyncClient, authorized_admin_client: AsyncClient
+):
+    """
+    Ensure the rolling capture samples 1 in N requests of the chosen routes.
+    """
+    capture = {"sample_every": 2, "routes": ["/tournaments/"], "min_duration_ms": 0}
+    response = await client.put("/profiles/capture/", json=capture)
+    assert response.status_code == 401
+    response = await authorized_admin_client.put("/profiles/capture/", json=capture)
+    assert response.status_code == 200
+
+    profile_store.clear()
+    try:
+        for _ in range(4):
+            await client.get("/tournaments/", params={"nocache": _})
+        await client.get("/teams/", params={"nocache": 1})
+    finally:
+        profiling_settings.sample_every = 0
+
+    profiles = profile_store.list()
+    assert len(profiles) == 2
+    assert {profile.mode for profile in profiles} == {"rolling"}
+    assert {profile.route for profile in profiles} == {"/tournaments/"}
@@ -0,0 +1,79 @@
+import logging
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ravenspedia.core import TableTeam
+
+
+@pytest.mark.asyncio
+async def test_response_reports_queries(
+    client: AsyncClient,
+    authorized_admin_client: AsyncClient,
+    query_budget,
+):
+    """
+    Verify that responses carry the number and duration of their queries.
+    """
+    data = {"name": "Counted", "max_number_of_players": 5}
+    response = await authorized_admin_client.post("/teams/", json=data)
+    assert response.status_code == 201
+
+    with query_budget(10, allow_repeated=False) as stats:
+        response = await client.get("/teams/Counted/")
+    assert response.status_code == 200
+    assert int(response.headers["x-db-query-count"]) == stats.count > 0
+    assert float(response.headers["x-db-time-ms"]) > 0
+    assert "x-db-repeated-queries" not in response.headers
+
+    # A response served from the cache does not touch the database
+    with query_budget(0):
+        response = await client.get("/teams/Counted/")
+    assert response.headers["x-db-query-count"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_are_detected(
+    session: AsyncSession,
+    query_budget,
+):
+    """
+    Ensure statements run in a loop share one fingerprint and are reported.
+    """
+    with query_budget() as stats:
+        for team_id in range(6):
+            await session.scalar(select(TableTeam).where(TableTeam.id == team_id))
+        # Lists of parameters of any length give the same fingerprint
+        for team_ids in ([1, 2], [1, 2, 3]):
+            await session.scalars(select(TableTeam).where(TableTeam.id.in_(team_ids)))
+
+    assert stats.count == 8
+    assert list(stats.repeated().values()) == [6]
+    assert sorted(stats.fingerprints.values()) == [2, 6]
+
+    # The budget assertion lists the statements of the block
+    with pytest.raises(AssertionError, match="over the budget of 1"):
+        with query_budget(1):
+            await session.scalar(select(TableTeam).where(TableTeam.id == 1))
+            await session.scalar(select(TableTeam).where(TableTeam.id == 2))
+
+
+@pytest.mark.asyncio
+async def test_queries_are_logged(
+    client: AsyncClient,
+    caplog: pytest.LogCaptureFixture,
+):
+    """
+    Check that every request writes a structured log record of its queries.
+    """
+    with caplog.at_level(logging.INFO, logger="ravenspedia.queries"):
+        response = await client.get("/tournaments/")
+    assert response.status_code == 200
+
+    record = next(r for r in caplog.records if r.name == "ravenspedia.queries")
+    assert '"path": "/tournaments/"' in record.getMessage()
+    assert f'"query_count": {response.headers["x-db-query-count"]}' in (
+        record.getMessage()
+    )
@@ -0,0 +1,89 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from httpx import AsyncClient
+from pydantic import BaseModel
+
+from ravenspedia.api_v1.news.schemes import ResponseNews
+from ravenspedia.api_v1.project_classes.player.schemes import ResponsePlayer
+from ravenspedia.api_v1.project_classes.team.schemes import ResponseTeam
+from ravenspedia.api_v1.project_classes.tournament.schemes import ResponseTournament
+from ravenspedia.api_v1.rendering import dumps
+
+
+def assert_matches_schema(document: dict, schema: type[BaseModel]) -> None:
+    """
+    Check that a rendered document has exactly the fields of its response model
+    and is what FastAPI would have produced from it.
+    """
+    assert set(document) == set(schema.model_fields)
+    validated = schema.model_validate(document)
+    assert validated.model_dump(mode="json") == document
+
+
+@pytest.mark.asyncio
+@patch("ravenspedia.api_v1.project_classes.player.crud.requests.get")
+async def test_rendered_documents_match_schemas(
+    mock_faceit_get,
+    client: AsyncClient,
+    authorized_admin_client: AsyncClient,
+):
+    """
+    Verify that the dicts rendered without pydantic follow the response models.
+    """
+    mock_faceit_get.return_value = Mock(status_code=404)
+    for url, data in (
+        ("/teams/", {"name": "Rendered", "max_number_of_players": 5}),
+        (
+            "/tournaments/",
+            {
+                "name": "Rendered Cup",
+                "max_count_of_teams": 4,
+                "start_date": "2025-01-01T10:00:00",
+                "end_date": "2025-01-02T10:00:00",
+            },
+        ),
+        ("/players/", {"steam_id": "76561190000000001", "nickname": "Render"}),
+        ("/news/", {"title": "Fast", "content": "JSON", "author": "Ravens"}),
+    ):
+        response = await authorized_admin_client.post(url, json=data)
+        assert response.status_code == 201
+    response = await authorized_admin_client.patch("/teams/Rendered/add_player/Render/")
+    assert response.status_code == 200
+    response = await authorized_admin_client.patch(
+        "/tournaments/Rendered Cup/add_team/Rendered/"
+    )
+    assert response.status_code == 200
+
+    for url, schema in (
+        ("/teams/", ResponseTeam),
+        ("/tournaments/", ResponseTournament),
+        ("/players/", ResponsePlayer),
+        ("/news/", ResponseNews),
+    ):
+        response = await client.get(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        documents = response.json()
+        assert documents
+        for document in documents:
+            assert_matches_schema(document, schema)
+
+    response = await client.get("/tournaments/Rendered Cup/")
+    assert_matches_schema(response.json(), ResponseTournament)
+    assert response.json()["teams"] == ["Rendered"]
+    assert response.json()["players"] == ["Render"]
+
+
+def test_dumps_encodes_like_pydantic():
+    """
+    Ensure the encoder writes dates and enums the way pydantic does.
+    """
+    news = ResponseNews(
+        id=1,
+        title="Ünïcode",
+        content="x",
+        author="y",
+        created_at="2025-01-02T03:04:05.678",
+    )
+    assert dumps(news.model_dump()) == news.model_dump_json().encode()
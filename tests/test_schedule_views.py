@@ -1,8 +1,14 @@
+import asyncio
+import json
 from datetime import datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
 
+from ravenspedia.api_v1.project_classes.match.live import RESYNC, match_broadcaster
+from ravenspedia.api_v1.schedules.schedule_live import live_match_events
+from ravenspedia.core import test_db_helper
+
 
 @pytest.mark.asyncio
 async def test_get_matches_empty_database(authorized_admin_client: AsyncClient):
@@ -244,3 +250,73 @@ async def test_manual_update_match_status_invalid(authorized_admin_client: Async
         f"/schedules/matches/{data['match_id']}/update_status/?new_status={data['new_status']}"
     )
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_live_match_events(
+    authorized_admin_client: AsyncClient,
+):
+    """Test the live stream: a snapshot of the in-progress matches, then diffs."""
+
+    async def next_event(events) -> tuple[str, object]:
+        event = await asyncio.wait_for(anext(events), timeout=1)
+        name, data = event.decode().removesuffix("\n\n").split("\n")
+        return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+    await authorized_admin_client.patch("/schedules/matches/update_statuses/")
+    subscriber = match_broadcaster.subscribe()
+    events = live_match_events(subscriber, test_db_helper.session_factory)
+
+    name, matches = await next_event(events)
+    assert name == "snapshot"
+    assert matches and {match["status"] for match in matches} == {"IN_PROGRESS"}
+    match_id = matches[0]["id"]
+
+    # Every change is pushed once the match document is regenerated
+    for description in ("Live 1", "Live 2"):
+        response = await authorized_admin_client.patch(
+            f"/matches/{match_id}/", json={"description": description}
+        )
+        assert response.status_code == 200
+        name, data = await next_event(events)
+        assert name == "match"
+        assert data["id"] == match_id
+        assert data["changes"]["description"] == description
+    assert data["changes"] == {"description": "Live 2"}
+
+    response = await authorized_admin_client.patch(
+        f"/schedules/matches/{match_id}/update_status/?new_status=COMPLETED"
+    )
+    assert response.status_code == 200
+    name, data = await next_event(events)
+    assert data["changes"] == {"status": "COMPLETED"}
+
+    await events.aclose()
+    assert subscriber not in match_broadcaster._subscribers
+
+    # A viewer that falls behind gets a new snapshot instead of the backlog
+    subscriber = match_broadcaster.subscribe(queue_size=1)
+    subscriber.push(b"first")
+    subscriber.push(b"second")
+    assert subscriber.queue.get_nowait() is RESYNC
+    match_broadcaster.unsubscribe(subscriber)
+
+    # A deleted match does not keep its last document
+    match_data = {
+        "max_number_of_teams": 2,
+        "max_number_of_players": 10,
+        "tournament": "Future Tournament",
+        "date": (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d"),
+        "best_of": 1,
+    }
+    response = await authorized_admin_client.post("/matches/", json=match_data)
+    assert response.status_code == 201
+    match_id = response.json()["id"]
+    response = await authorized_admin_client.patch(
+        f"/matches/{match_id}/", json={"description": "Deleted soon"}
+    )
+    assert response.status_code == 200
+    assert match_id in match_broadcaster._documents
+    response = await authorized_admin_client.delete(f"/matches/{match_id}/")
+    assert response.status_code == 204
+    assert match_id not in match_broadcaster._documents
@@ -0,0 +1,185 @@
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from ravenspedia.api_v1.snapshots.crud import (
+    SNAPSHOT_TABLES,
+    get_new_completed_match_ids,
+    get_snapshot_columns,
+)
+from ravenspedia.api_v1.snapshots.writer import (
+    SnapshotFile,
+    SnapshotManifest,
+    write_manifest,
+)
+from ravenspedia.bench import SCALES, generate_dataset
+from ravenspedia.core import (
+    DatabaseHelper,
+    MatchStatus,
+    TableMatch,
+    TableMatchStats,
+    db_helper,
+)
+from ravenspedia.core.config import snapshot_settings
+from ravenspedia.main import app
+
+
+@pytest.fixture
+async def snapshot_database(tmp_path, client: AsyncClient):
+    """
+    Serve a generated dataset and keep the snapshots in a temporary directory.
+    """
+    helper = DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path}/snapshot.sqlite3")
+    await generate_dataset(helper=helper, scale=SCALES["tiny"], documents=False)
+
+    previous = app.dependency_overrides[db_helper.session_dependency]
+    directory = snapshot_settings.directory
+    app.dependency_overrides[db_helper.session_dependency] = helper.session_dependency
+    snapshot_settings.directory = tmp_path / "snapshots"
+    yield helper
+
+    snapshot_settings.directory = directory
+    app.dependency_overrides[db_helper.session_dependency] = previous
+    await helper.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_columns(snapshot_database):
+    """
+    Verify that only new completed matches are picked and match_stats is flattened.
+    """
+    async with snapshot_database.session_factory() as session:
+        completed = list(
+            await session.scalars(
+                select(TableMatch.id)
+                .where(TableMatch.status == MatchStatus.COMPLETED)
+                .order_by(TableMatch.id)
+            )
+        )
+        match_ids = await get_new_completed_match_ids(session, completed[:2])
+        assert match_ids == completed[2:]
+
+        total = await session.scalar(
+            select(func.count(TableMatchStats.id)).where(
+                TableMatchStats.match_id.in_(match_ids)
+            )
+        )
+        columns = await get_snapshot_columns(session, match_ids)
+
+    for table, spec in SNAPSHOT_TABLES.items():
+        assert list(columns[table]) == list(spec)
+        assert len({len(values) for values in columns[table].values()}) == 1
+    stats = columns["player_stats"]
+    assert len(stats["stat_id"]) == total
+    assert all(isinstance(kills, int) for kills in stats["kills"])
+    assert set(stats["match_id"]) <= set(match_ids)
+    assert columns["matches"]["match_id"] == match_ids
+
+
+@pytest.mark.asyncio
+async def test_snapshot_file_ranges(client: AsyncClient, snapshot_database):
+    """
+    Verify that listed files are served with range support and others are not.
+    """
+    content = bytes(range(256)) * 4
+    directory = snapshot_settings.directory
+    (directory / "matches").mkdir(parents=True)
+    (directory / "matches" / "part-1.parquet").write_bytes(content)
+    write_manifest(
+        directory,
+        SnapshotManifest(
+            match_ids=[1],
+            files=[
+                SnapshotFile(
+                    table="matches",
+                    name="part-1.parquet",
+                    rows=1,
+                    size=len(content),
+                    matches=1,
+                    created_at=datetime.now().isoformat(),
+                )
+            ],
+        ),
+    )
+
+    response = await client.get("/snapshots/")
+    assert response.status_code == 200
+    assert [file["url"] for file in response.json()] == [
+        "/snapshots/matches/part-1.parquet"
+    ]
+
+    response = await client.get("/snapshots/matches/part-1.parquet")
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.content == content
+
+    response = await client.get(
+        "/snapshots/matches/part-1.parquet", headers={"Range": "bytes=100-199"}
+    )
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 100-199/{len(content)}"
+    assert response.content == content[100:200]
+
+    response = await client.get("/snapshots/matches/manifest.json")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_snapshot_append(client: AsyncClient, snapshot_database):
+    """
+    Verify that a snapshot only appends the matches completed since the last one.
+    """
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    from ravenspedia.api_v1.snapshots import writer
+
+    async with snapshot_database.session_factory() as session:
+        files = await writer.take_snapshot(session)
+        assert {file.table for file in files} == set(SNAPSHOT_TABLES)
+        assert await writer.take_snapshot(session) == []
+
+    stats = next(file for file in files if file.table == "player_stats")
+    table = pyarrow.parquet.read_table(
+        snapshot_settings.directory / "player_stats" / stats.name
+    )
+    assert table.num_rows == stats.rows
+    assert table.column_names == list(SNAPSHOT_TABLES["player_stats"])
+
+
+@pytest.mark.asyncio
+async def test_snapshot_failure_leaves_no_part_files(
+    snapshot_database,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Verify that a snapshot failing midway removes its temporary files.
+    """
+    pytest.importorskip("pyarrow")
+    from ravenspedia.api_v1.snapshots import writer
+
+    batches = 0
+
+    async def failing_columns(session, match_ids):
+        nonlocal batches
+        batches += 1
+        if batches == 2:
+            raise RuntimeError("Database gone")
+        return await get_snapshot_columns(session, match_ids)
+
+    monkeypatch.setattr(writer, "get_snapshot_columns", failing_columns)
+    directory = snapshot_settings.directory
+    async with snapshot_database.session_factory() as session:
+        with pytest.raises(RuntimeError):
+            await writer.write_snapshot(
+                session=session,
+                directory=directory,
+                file_format="parquet",
+                batch_size=1,
+            )
+
+    assert batches == 2
+    assert list(directory.rglob("*.tmp")) == []
+    assert not (directory / "manifest.json").exists()
@@ -1,8 +1,9 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ravenspedia.core import MapName
+from ravenspedia.core import MapName, TablePlayer, TableTeamMapStats, TableTournament
 
 
 @pytest.mark.asyncio
@@ -152,6 +153,139 @@ async def test_get_stats_from_match_with_info(client: AsyncClient):
             assert map_stat["win_rate"] == 0.0
 
 
+@pytest.mark.asyncio
+async def test_stats_follow_deleted_result(authorized_admin_client: AsyncClient):
+    """
+    Test that deleting the last map result is subtracted from the stats of both teams.
+    """
+    response = await authorized_admin_client.delete(
+        "/matches/stats/1/delete_last_map_result_info_from_match/"
+    )
+    assert response.status_code == 200
+
+    for team_name in ("Pro Team", "New Team"):
+        response = await authorized_admin_client.get(f"/teams/stats/{team_name}/")
+        assert response.status_code == 200
+        assert all(stat["matches_played"] == 0 for stat in response.json())
+
+    result_data = {
+        "map": "Inferno",
+        "first_team": "Pro Team",
+        "second_team": "New Team",
+        "first_half_score_first_team": 7,
+        "second_half_score_first_team": 6,
+        "first_half_score_second_team": 5,
+        "second_half_score_second_team": 6,
+        "total_score_first_team": 13,
+        "total_score_second_team": 11,
+        "overtime_score_first_team": 0,
+        "overtime_score_second_team": 0,
+    }
+    response = await authorized_admin_client.patch(
+        "/matches/stats/1/add_map_result_info_in_match/",
+        json=result_data,
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_rebuild_map_stats(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test recalculating the map stats of all teams from the match results.
+    """
+    # Corrupt the stored stats behind the API's back
+    await session.execute(
+        update(TableTeamMapStats).values(
+            matches_played=5,
+            matches_won=5,
+            win_rate=100.0,
+        )
+    )
+    await session.commit()
+
+    response = await authorized_admin_client.patch("/teams/stats/rebuild_map_stats/")
+    assert response.status_code == 204
+
+    response = await authorized_admin_client.get("/teams/stats/New Team/")
+    assert response.status_code == 200
+    for map_stat in response.json():
+        if map_stat["map"] == "Inferno":
+            assert map_stat["matches_played"] == 1
+            assert map_stat["matches_won"] == 0
+        else:
+            assert map_stat["matches_played"] == 0
+            assert map_stat["matches_won"] == 0
+
+
+@pytest.mark.asyncio
+async def test_results_follow_renamed_team(authorized_admin_client: AsyncClient):
+    """
+    Test that the map results and vetoes are linked to the team, not to its name.
+    """
+    response = await authorized_admin_client.patch(
+        "/teams/Pro Team/",
+        json={"name": "Renamed Team"},
+    )
+    assert response.status_code == 200
+
+    # The names shown with the match info follow the team
+    response = await authorized_admin_client.get("/matches/1/")
+    assert response.status_code == 200
+    assert response.json()["result"][0]["first_team"] == "Renamed Team"
+    assert response.json()["veto"][0]["initiator"] == "Renamed Team"
+
+    # The results still count for the team once its stats are recalculated
+    response = await authorized_admin_client.patch("/teams/stats/rebuild_map_stats/")
+    assert response.status_code == 204
+    response = await authorized_admin_client.get("/teams/stats/Renamed Team/")
+    inferno = next(stat for stat in response.json() if stat["map"] == "Inferno")
+    assert inferno["matches_played"] == 1
+    assert inferno["matches_won"] == 1
+
+    response = await authorized_admin_client.patch(
+        "/teams/Renamed Team/",
+        json={"name": "Pro Team"},
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_head_to_head(client: AsyncClient):
+    """
+    Test comparing two teams from both sides over their map results.
+    """
+    response = await client.get("/teams/Pro Team/vs/New Team/")
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["series_played"], data["series_won"], data["series_lost"]) == (1, 1, 0)
+    assert (data["maps_played"], data["maps_won"], data["maps_lost"]) == (1, 1, 0)
+    assert data["average_round_difference"] == 2.0
+    assert data["maps"] == [
+        {
+            "map": "Inferno",
+            "played": 1,
+            "won": 1,
+            "lost": 0,
+            "average_round_difference": 2.0,
+        }
+    ]
+    assert data["recent_meetings"][0]["match_id"] == 1
+    assert data["recent_meetings"][0]["tournament"] == "Test Championship"
+
+    response = await client.get("/teams/New Team/vs/Pro Team/")
+    data = response.json()
+    assert (data["series_won"], data["series_lost"]) == (0, 1)
+    assert data["average_round_difference"] == -2.0
+
+    response = await client.get("/teams/Pro Team/vs/Missing Team/")
+    assert response.status_code == 404
+    response = await client.get("/teams/Pro Team/vs/Pro Team/")
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_info_after_delete_match(authorized_admin_client: AsyncClient):
     """
@@ -173,3 +307,279 @@ async def test_get_info_after_delete_match(authorized_admin_client: AsyncClient)
         assert map_stat["matches_played"] == 0
         assert map_stat["matches_won"] == 0
         assert map_stat["win_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_veto_stats(authorized_admin_client: AsyncClient):
+    """
+    Test the veto tendencies of a team, kept up to date with its vetoes and results.
+    """
+    match_data = {
+        "best_of": 3,
+        "max_number_of_teams": 2,
+        "max_number_of_players": 10,
+        "tournament": "Test Championship",
+        "date": "2025-01-06T15:00:00",
+    }
+    response = await authorized_admin_client.post("/matches/", json=match_data)
+    assert response.status_code == 201
+    match_id = response.json()["id"]
+    for team_name in ("Pro Team", "New Team"):
+        response = await authorized_admin_client.patch(
+            f"/matches/{match_id}/add_team/{team_name}/"
+        )
+        assert response.status_code == 200
+
+    vetoes = [
+        ("Nuke", "Banned", "Pro Team"),
+        ("Mirage", "Banned", "New Team"),
+        ("Dust2", "Picked", "Pro Team"),
+        ("Ancient", "Picked", "New Team"),
+        ("Anubis", "Banned", "Pro Team"),
+    ]
+    for map_name, map_status, initiator in vetoes:
+        response = await authorized_admin_client.patch(
+            f"/matches/stats/{match_id}/add_pick_ban_info_in_match/",
+            json={"map": map_name, "map_status": map_status, "initiator": initiator},
+        )
+        assert response.status_code == 200
+
+    result_data = {
+        "map": "Dust2",
+        "first_team": "New Team",
+        "second_team": "Pro Team",
+        "first_half_score_first_team": 5,
+        "second_half_score_first_team": 0,
+        "first_half_score_second_team": 7,
+        "second_half_score_second_team": 6,
+        "total_score_first_team": 5,
+        "total_score_second_team": 13,
+        "overtime_score_first_team": 0,
+        "overtime_score_second_team": 0,
+    }
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_map_result_info_in_match/",
+        json=result_data,
+    )
+    assert response.status_code == 200
+
+    response = await authorized_admin_client.get("/teams/stats/Pro Team/veto/")
+    assert response.status_code == 200
+    stats = {stat["map"]: stat for stat in response.json()}
+    assert len(stats) == 8
+    assert (stats["Nuke"]["first_bans"], stats["Nuke"]["first_ban_rate"]) == (1, 100.0)
+    assert (stats["Anubis"]["bans"], stats["Anubis"]["first_bans"]) == (1, 0)
+    assert stats["Dust2"]["pick_rate"] == 100.0
+    assert (stats["Dust2"]["picks_played"], stats["Dust2"]["picks_won"]) == (1, 1)
+    assert stats["Dust2"]["pick_win_rate"] == 100.0
+
+    # A window without the match counts nothing
+    response = await authorized_admin_client.get(
+        "/teams/stats/Pro Team/veto/", params={"end_date": "2025-01-01T00:00:00"}
+    )
+    assert all(stat["bans"] == stat["picks"] == 0 for stat in response.json())
+
+    # The rollup kept up to date matches a count over all the vetoes
+    async def assert_rollup_matches_count():
+        for team_name in ("Pro Team", "New Team"):
+            rollup = await authorized_admin_client.get(
+                f"/teams/stats/{team_name}/veto/"
+            )
+            counted = await authorized_admin_client.get(
+                f"/teams/stats/{team_name}/veto/",
+                params={"end_date": "2100-01-01T00:00:00"},
+            )
+            assert rollup.json() == counted.json()
+
+    await assert_rollup_matches_count()
+
+    # Deleting the last veto, the map result and then the match updates the rollup
+    response = await authorized_admin_client.delete(
+        f"/matches/stats/{match_id}/delete_last_pick_ban_info_from_match/"
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.get("/teams/stats/Pro Team/veto/")
+    stats = {stat["map"]: stat for stat in response.json()}
+    assert stats["Anubis"]["bans"] == 0
+    await assert_rollup_matches_count()
+
+    response = await authorized_admin_client.delete(
+        f"/matches/stats/{match_id}/delete_last_map_result_info_from_match/"
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.get("/teams/stats/Pro Team/veto/")
+    stats = {stat["map"]: stat for stat in response.json()}
+    assert (stats["Dust2"]["picks"], stats["Dust2"]["picks_played"]) == (1, 0)
+    await assert_rollup_matches_count()
+
+    response = await authorized_admin_client.delete(f"/matches/{match_id}/")
+    assert response.status_code == 204
+    response = await authorized_admin_client.get("/teams/stats/Pro Team/veto/")
+    assert all(stat["bans"] == stat["picks"] == 0 for stat in response.json())
+
+
+@pytest.mark.asyncio
+async def test_map_meta_stats(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test the statistics of the maps, kept up to date with the map results.
+    """
+    tournament_data = {
+        "name": "Map Stats Cup",
+        "max_count_of_teams": 4,
+        "start_date": "2025-02-01",
+        "end_date": "2025-02-10",
+    }
+    response = await authorized_admin_client.post("/tournaments/", json=tournament_data)
+    assert response.status_code == 201
+    tournament_id = await session.scalar(
+        select(TableTournament.id).where(TableTournament.name == "Map Stats Cup")
+    )
+
+    match_data = {
+        "best_of": 1,
+        "max_number_of_teams": 2,
+        "max_number_of_players": 10,
+        "tournament": "Map Stats Cup",
+        "date": "2025-02-05T15:00:00",
+    }
+    response = await authorized_admin_client.post("/matches/", json=match_data)
+    assert response.status_code == 201
+    match_id = response.json()["id"]
+    for team_name in ("Pro Team", "New Team"):
+        response = await authorized_admin_client.patch(
+            f"/matches/{match_id}/add_team/{team_name}/"
+        )
+        assert response.status_code == 200
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_pick_ban_info_in_match/",
+        json={"map": "Inferno", "map_status": "Default", "initiator": "Pro Team"},
+    )
+    assert response.status_code == 200
+
+    # Level after both halves, won by Pro Team in overtime
+    result_data = {
+        "map": "Inferno",
+        "first_team": "Pro Team",
+        "second_team": "New Team",
+        "first_half_score_first_team": 8,
+        "second_half_score_first_team": 4,
+        "first_half_score_second_team": 4,
+        "second_half_score_second_team": 8,
+        "total_score_first_team": 16,
+        "total_score_second_team": 13,
+        "overtime_score_first_team": 4,
+        "overtime_score_second_team": 1,
+    }
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_map_result_info_in_match/",
+        json=result_data,
+    )
+    assert response.status_code == 200
+
+    params = {"tournament_ids": [tournament_id]}
+    response = await authorized_admin_client.get("/stats/maps/", params=params)
+    assert response.status_code == 200
+    stats = {stat["map"]: stat for stat in response.json()}
+    assert len(stats) == len(MapName)
+    inferno = stats["Inferno"]
+    assert (inferno["played"], inferno["play_rate"]) == (1, 100.0)
+    assert inferno["average_rounds"] == 29.0
+    assert (inferno["overtimes"], inferno["overtime_rate"]) == (1, 100.0)
+    assert inferno["average_half_swing"] == 8.0
+    assert inferno["first_half_leader_win_rate"] == 100.0
+    assert stats["Nuke"]["played"] == 0
+
+    # The results of other tournaments are left out
+    response = await authorized_admin_client.get(
+        "/stats/maps/", params={"tournament_ids": [tournament_id + 1]}
+    )
+    assert all(stat["played"] == 0 for stat in response.json())
+
+    # Deleting the result removes it from the rollup
+    response = await authorized_admin_client.delete(
+        f"/matches/stats/{match_id}/delete_last_map_result_info_from_match/"
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.get("/stats/maps/", params=params)
+    assert all(stat["played"] == 0 for stat in response.json())
+
+    # Deleting the match drops its results from the cached statistics too
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_map_result_info_in_match/",
+        json=result_data,
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.get("/stats/maps/", params=params)
+    assert {stat["map"]: stat for stat in response.json()}["Inferno"]["played"] == 1
+    response = await authorized_admin_client.delete(f"/matches/{match_id}/")
+    assert response.status_code == 204
+    response = await authorized_admin_client.get("/stats/maps/", params=params)
+    assert all(stat["played"] == 0 for stat in response.json())
+
+
+@pytest.mark.asyncio
+async def test_team_players_stats(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test the statistics of the members of a team, aggregated in one query.
+    """
+    session.add_all(
+        TablePlayer(nickname=f"member_{i}", steam_id=f"member_steam_{i}")
+        for i in range(2)
+    )
+    await session.commit()
+    for i in range(2):
+        response = await authorized_admin_client.patch(
+            f"/teams/New Team/add_player/member_{i}/"
+        )
+        assert response.status_code == 200
+
+    match_data = {
+        "best_of": 1,
+        "max_number_of_teams": 2,
+        "max_number_of_players": 10,
+        "tournament": "Test Championship",
+        "date": "2025-01-07T15:00:00",
+    }
+    response = await authorized_admin_client.post("/matches/", json=match_data)
+    assert response.status_code == 201
+    match_id = response.json()["id"]
+    header = "nickname,round_of_match,map,Result,Kills,Assists,Deaths,ADR,Headshots %"
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_scoreboard_manual/",
+        content="\n".join([header, "member_0,1,Dust2,1,20,5,10,80.5,40"]),
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+
+    response = await authorized_admin_client.get("/teams/stats/New Team/players/")
+    assert response.status_code == 200
+    stats = response.json()
+    assert [player["nickname"] for player in stats] == ["member_0", "member_1"]
+    assert (stats[0]["total_matches"], stats[0]["Kills"]) == (1, 20)
+    assert (stats[0]["K/D Ratio"], stats[0]["ADR"]) == (2.0, 80.5)
+    assert (stats[1]["total_matches"], stats[1]["Kills"]) == (0, 0)
+
+    # Same numbers as the stats of the player
+    response = await authorized_admin_client.get(
+        "/players/stats/member_0/", params={"detailed": True}
+    )
+    player_stats = response.json()
+    response = await authorized_admin_client.get(
+        "/teams/stats/New Team/players/", params={"detailed": True}
+    )
+    assert response.json()[0] == player_stats
+
+    # A window without the match counts nothing
+    response = await authorized_admin_client.get(
+        "/teams/stats/New Team/players/", params={"end_date": "2025-01-01T00:00:00"}
+    )
+    assert all(player["total_matches"] == 0 for player in response.json())
+
+    response = await authorized_admin_client.get("/teams/stats/Unknown/players/")
+    assert response.status_code == 404
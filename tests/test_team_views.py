@@ -2,7 +2,9 @@ from unittest.mock import patch, Mock
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ravenspedia.core import TablePlayer
 from ravenspedia.core.config import data_for_tests
 
 
@@ -316,3 +318,58 @@ async def test_update_team_faceit_elo(
             "tournament_results": [],
         },
     ]
+
+
+@pytest.mark.asyncio
+async def test_delete_team_statement_count_is_constant(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+    query_budget,
+):
+    """
+    Test that deleting a team costs the same number of statements for any roster size.
+    """
+    session.add_all(
+        TablePlayer(nickname=f"bulk_{i}", steam_id=f"bulk_steam_{i}") for i in range(6)
+    )
+    await session.commit()
+
+    data = {
+        "name": "Bulk Cup",
+        "max_count_of_teams": 4,
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-10",
+    }
+    response = await authorized_admin_client.post("/tournaments/", json=data)
+    assert response.status_code == 201
+
+    # A team with one player and a team with five players, both in the tournament
+    for team_name, nicknames in (
+        ("Bulk Small", ["bulk_0"]),
+        ("Bulk Large", [f"bulk_{i}" for i in range(1, 6)]),
+    ):
+        data = {"name": team_name, "max_number_of_players": 5}
+        response = await authorized_admin_client.post("/teams/", json=data)
+        assert response.status_code == 201
+        for nickname in nicknames:
+            response = await authorized_admin_client.patch(
+                f"/teams/{team_name}/add_player/{nickname}/"
+            )
+            assert response.status_code == 200
+        response = await authorized_admin_client.patch(
+            f"/tournaments/Bulk Cup/add_team/{team_name}/"
+        )
+        assert response.status_code == 200
+
+    statements = []
+    for team_name in ("Bulk Small", "Bulk Large"):
+        with query_budget(allow_repeated=False) as stats:
+            response = await authorized_admin_client.delete(f"/teams/{team_name}/")
+        assert response.status_code == 204
+        statements.append(stats.count)
+    assert statements[0] == statements[1]
+
+    # The players left both the team and its tournaments
+    response = await authorized_admin_client.get("/players/bulk_3/")
+    assert response.json()["team"] is None
+    assert response.json()["tournaments"] == []
@@ -316,3 +316,47 @@ async def test_create_tournament_with_existing_name(
     assert response.json() == {
         "detail": f"Tournament {data['name']} already exists",
     }
+
+
+@pytest.mark.asyncio
+async def test_delete_tournament_statement_count_is_constant(
+    authorized_admin_client: AsyncClient,
+    query_budget,
+):
+    """
+    Test that deleting a tournament costs the same number of statements for any
+    number of matches.
+    """
+    statements = []
+    for tournament_name, number_of_matches in (("Bulk One", 1), ("Bulk Many", 4)):
+        data = {
+            "name": tournament_name,
+            "max_count_of_teams": 2,
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-10",
+        }
+        response = await authorized_admin_client.post("/tournaments/", json=data)
+        assert response.status_code == 201
+
+        for _ in range(number_of_matches):
+            data = {
+                "best_of": 1,
+                "max_number_of_teams": 2,
+                "max_number_of_players": 10,
+                "tournament": tournament_name,
+                "date": "2025-01-05T15:00:00",
+            }
+            response = await authorized_admin_client.post("/matches/", json=data)
+            assert response.status_code == 201
+
+        with query_budget(allow_repeated=False) as stats:
+            response = await authorized_admin_client.delete(
+                f"/tournaments/{tournament_name}/"
+            )
+        assert response.status_code == 204
+        statements.append(stats.count)
+
+    assert statements[0] == statements[1]
+
+    response = await authorized_admin_client.get("/matches/")
+    assert response.json() == []
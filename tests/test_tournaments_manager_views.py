@@ -1,6 +1,9 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ravenspedia.core import PlayerTournamentAssociation, TablePlayer, TableTournament
 from ravenspedia.core.config import data_for_tests
 
 
@@ -279,3 +282,161 @@ async def test_delete_team_with_tournament(authorized_admin_client: AsyncClient)
     assert response.status_code == 200
     assert response.json()["teams"] == ["RedRavens"]
     assert response.json()["players"] == ["Excelleence"]
+
+
+@pytest.mark.asyncio
+async def test_add_team_statement_count_is_constant(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+    query_budget,
+):
+    """
+    Test that adding a team to a tournament costs the same number of statements
+    for any roster size, and skips players already linked to the tournament.
+    """
+    data = {
+        "name": "Roster Cup",
+        "max_count_of_teams": 4,
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-10",
+    }
+    response = await authorized_admin_client.post("/tournaments/", json=data)
+    assert response.status_code == 201
+
+    session.add_all(
+        TablePlayer(nickname=f"roster_{i}", steam_id=f"roster_steam_{i}")
+        for i in range(4)
+    )
+    await session.commit()
+
+    # One player is already in the tournament, e.g. through match stats
+    player_id = await session.scalar(
+        select(TablePlayer.id).where(TablePlayer.nickname == "roster_2")
+    )
+    tournament_id = await session.scalar(
+        select(TableTournament.id).where(TableTournament.name == "Roster Cup")
+    )
+    session.add(
+        PlayerTournamentAssociation(player_id=player_id, tournament_id=tournament_id)
+    )
+    await session.commit()
+
+    statements = []
+    for team_name, nicknames in (
+        ("Roster Small", ["roster_0"]),
+        ("Roster Large", ["roster_1", "roster_2", "roster_3"]),
+    ):
+        data = {"name": team_name, "max_number_of_players": 5}
+        response = await authorized_admin_client.post("/teams/", json=data)
+        assert response.status_code == 201
+        for nickname in nicknames:
+            response = await authorized_admin_client.patch(
+                f"/teams/{team_name}/add_player/{nickname}/"
+            )
+            assert response.status_code == 200
+
+        with query_budget(allow_repeated=False) as stats:
+            response = await authorized_admin_client.patch(
+                f"/tournaments/Roster Cup/add_team/{team_name}/"
+            )
+        assert response.status_code == 200
+        statements.append(stats.count)
+        # Neither the tournament nor the team has its roster loaded
+        assert not any(
+            "players.steam_id" in statement for statement in stats.statements.values()
+        )
+    assert statements[0] == statements[1]
+
+    assert response.json()["teams"] == ["Roster Small", "Roster Large"]
+    assert sorted(response.json()["players"]) == [f"roster_{i}" for i in range(4)]
+
+    # Membership is still checked for the team already in the tournament
+    response = await authorized_admin_client.patch(
+        "/tournaments/Roster Cup/add_team/Roster Large/"
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_tournament_summary(
+    authorized_admin_client: AsyncClient,
+    session: AsyncSession,
+):
+    """
+    Test the summary of a tournament, built on completion and rebuilt on later edits.
+    """
+    session.add_all(
+        TablePlayer(nickname=f"summary_{i}", steam_id=f"summary_steam_{i}")
+        for i in range(2)
+    )
+    await session.commit()
+
+    data = {
+        "name": "Summary Cup",
+        "max_count_of_teams": 4,
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-10",
+    }
+    response = await authorized_admin_client.post("/tournaments/", json=data)
+    assert response.status_code == 201
+    match_data = {
+        "max_number_of_teams": 2,
+        "max_number_of_players": 10,
+        "tournament": "Summary Cup",
+        "date": "2025-01-05",
+        "best_of": 1,
+    }
+    response = await authorized_admin_client.post("/matches/", json=match_data)
+    assert response.status_code == 201
+    match_id = response.json()["id"]
+
+    header = "nickname,round_of_match,map,Result,Kills,Assists,Deaths,ADR,Headshots %"
+    rows = [
+        "summary_0,1,Dust2,1,24,5,12,90.5,40",
+        "summary_1,1,Dust2,0,12,3,18,61.2,35",
+    ]
+    response = await authorized_admin_client.patch(
+        f"/matches/stats/{match_id}/add_scoreboard_manual/",
+        content="\n".join([header, *rows]),
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.patch(
+        "/tournaments/Summary Cup/add_result/",
+        json={"place": 1, "prize": "1000$"},
+    )
+    assert response.status_code == 200
+
+    # There is no summary until the tournament is completed
+    response = await authorized_admin_client.patch(
+        "/schedules/tournaments/Summary Cup/update_status/?new_status=IN_PROGRESS"
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.get("/tournaments/Summary Cup/summary/")
+    assert response.status_code == 400
+
+    response = await authorized_admin_client.patch(
+        "/schedules/tournaments/Summary Cup/update_status/?new_status=COMPLETED"
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.get("/tournaments/Summary Cup/summary/")
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["tournament"] == "Summary Cup"
+    assert summary["mvp"]["nickname"] == "summary_0"
+    assert summary["mvp"]["K/D Ratio"] == 2.0
+    assert [player["nickname"] for player in summary["players"]] == [
+        "summary_0",
+        "summary_1",
+    ]
+    assert summary["standings"] == [{"place": 1, "team": None, "prize": "1000$"}]
+
+    # Later stat edits rebuild the summary
+    response = await authorized_admin_client.delete(
+        f"/matches/stats/{match_id}/delete_last_stat_from_match/"
+    )
+    assert response.status_code == 200
+    response = await authorized_admin_client.get("/tournaments/Summary Cup/summary/")
+    assert [player["nickname"] for player in response.json()["players"]] == [
+        "summary_0"
+    ]